@@ -34,32 +34,26 @@ def build_presentation():
     header_template = read_file(base_dir / "templates" / "header.html")
     footer_template = read_file(base_dir / "templates" / "footer.html")
     
-    # Start building the presentation
-    presentation_html = header_template
-    
-    # Add each slide
+    # Stream the presentation to disk slide by slide
     active_slides = [s for s in manifest['slides'] if s.get('active', True)]
     
-    for i, slide in enumerate(active_slides, 1):
-        slide_path = slides_dir / slide['file']
-        if slide_path.exists():
-            slide_content = read_file(slide_path)
-            # Update slide number in the content
-            slide_content = slide_content.replace('{{SLIDE_NUMBER}}', str(i))
-            presentation_html += f"\n<!-- Slide {i}: {slide['title']} -->\n"
-            presentation_html += slide_content + "\n"
-        else:
-            print(f"Warning: Slide file not found: {slide['file']}")
-    
-    # Update total slides count in footer
-    footer_template = footer_template.replace('{{TOTAL_SLIDES}}', str(len(active_slides)))
-    
-    # Add footer
-    presentation_html += footer_template
-    
-    # Write the complete presentation
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(presentation_html)
+        f.write(header_template)
+        
+        # Add each slide
+        for i, slide in enumerate(active_slides, 1):
+            slide_path = slides_dir / slide['file']
+            if slide_path.exists():
+                slide_content = read_file(slide_path)
+                # Update slide number in the content
+                slide_content = slide_content.replace('{{SLIDE_NUMBER}}', str(i))
+                f.write(f"\n<!-- Slide {i}: {slide['title']} -->\n")
+                f.write(slide_content + "\n")
+            else:
+                print(f"Warning: Slide file not found: {slide['file']}")
+        
+        # Update total slides count in footer
+        f.write(footer_template.replace('{{TOTAL_SLIDES}}', str(len(active_slides))))
     
     print(f"✅ Presentation built successfully!")
     print(f"   Total slides: {len(active_slides)}")
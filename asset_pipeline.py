@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Asset pipeline for the linked presentation builder
+Finds every local image/stylesheet/script a slide references, copies each
+unique file once under a content-hash name and rewrites the references
+(stylesheets are published with their own url() references rewritten)
+Blobs are kept in a shared cache so unchanged assets are reused across builds
+Images can optionally be routed through optimize_images.ImageOptimizer
+"""
+
+import hashlib
+import os
+import re
+import shutil
+from pathlib import Path
+
+# Shared blob store reused by every timestamped build
+ASSET_CACHE_DIR = Path(".asset_cache")
+
+# File types treated as assets (slide-to-slide .html links are left alone)
+ASSET_EXTENSIONS = {
+    '.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.avif', '.ico',
+    '.css', '.js', '.woff', '.woff2', '.ttf', '.otf', '.mp4', '.webm'
+}
+
+# Reference prefixes that never point at a local file
+EXTERNAL_PREFIXES = ('http://', 'https://', '//', 'data:', 'mailto:', 'javascript:', '#')
+
+CSS_URL_PATTERN = re.compile(r'url\(\s*([\'"]?)([^\'")]+?)\1\s*\)')
+
+# Each srcset candidate's URL: a run of non-space characters (trailing commas
+# excluded) at the start or after the comma ending the previous candidate
+SRCSET_URL_PATTERN = re.compile(r'(^\s*|,\s*)(\S+?)(?=,*(?:\s|$))')
+
+
+def file_content_hash(path, length=12):
+    """Return a short SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:length]
+
+
+def is_local_asset(ref):
+    """Check whether a src/href/url() value points at a local asset file"""
+    ref = ref.strip()
+    if not ref or ref.lower().startswith(EXTERNAL_PREFIXES):
+        return False
+    path = ref.split('#', 1)[0].split('?', 1)[0]
+    return Path(path).suffix.lower() in ASSET_EXTENSIONS
+
+
+class AssetPipeline:
+    """Copies, fingerprints and deduplicates assets referenced by slides"""
+
+    def __init__(self, output_dir, cache_dir=ASSET_CACHE_DIR, optimizer=None):
+        self.output_dir = Path(output_dir)
+        self.assets_dir = self.output_dir / "assets"
+        self.cache_dir = Path(cache_dir)
+        self.optimizer = optimizer  # optional optimize_images.ImageOptimizer
+        self.published = {}  # resolved source path -> fingerprinted file name
+        self.hashes = {}  # resolved source path -> content hash
+        self.publishing = set()  # stylesheets whose url()s are being rewritten
+        self.pending_variants = []
+        self.missing = set()
+        self.stats = {'copied': 0, 'reused': 0, 'references': 0}
+
+    def content_hash(self, source_path):
+        """Hash each source file at most once per build"""
+        if source_path not in self.hashes:
+            self.hashes[source_path] = file_content_hash(source_path)
+        return self.hashes[source_path]
+
+    def link_into_build(self, name):
+        """Hard-link a cached blob into the build, falling back to a copy across filesystems"""
+        self.assets_dir.mkdir(parents=True, exist_ok=True)
+        target_path = self.assets_dir / name
+        if not target_path.exists():
+            try:
+                os.link(self.cache_dir / name, target_path)
+            except OSError:
+                shutil.copy2(self.cache_dir / name, target_path)
+
+    def publish(self, source_path):
+        """Publish one asset into the build and return its fingerprinted name"""
+        source_path = Path(source_path).resolve()
+        if source_path in self.published:
+            return self.published[source_path]
+
+        data = None
+        if source_path.suffix.lower() == '.css':
+            if source_path in self.publishing:
+                return None  # an @import cycle; leave that reference as written
+            # Point the stylesheet's own url()s (fonts, images, @imports) at their
+            # fingerprinted copies, which sit beside it in assets/, before hashing it
+            self.publishing.add(source_path)
+            try:
+                css = source_path.read_bytes().decode('utf-8', 'surrogateescape')
+                data = self.rewrite_css(css, source_path.parent, "").encode('utf-8', 'surrogateescape')
+            finally:
+                self.publishing.discard(source_path)
+            digest = hashlib.sha256(data).hexdigest()[:12]
+        else:
+            digest = self.content_hash(source_path)
+        fingerprinted = f"{source_path.stem}.{digest}{source_path.suffix.lower()}"
+
+        # Store each blob once in the shared cache
+        blob_path = self.cache_dir / fingerprinted
+        if blob_path.exists():
+            self.stats['reused'] += 1
+        else:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = blob_path.with_name(f'{blob_path.name}.{os.getpid()}.tmp')
+            if data is None:
+                shutil.copy2(source_path, tmp_path)
+            else:
+                tmp_path.write_bytes(data)
+            os.replace(tmp_path, blob_path)
+            self.stats['copied'] += 1
+
+        self.link_into_build(fingerprinted)
+        self.published[source_path] = fingerprinted
+        return fingerprinted
+
+    def resolve(self, ref, base_dir):
+        """Resolve a local asset reference to (source path, fragment), or None"""
+        if not is_local_asset(ref):
+            return None
+
+        path_part, sep, fragment = ref.strip().partition('#')
+        path_part = path_part.split('?', 1)[0]
+        source_path = Path(base_dir) / path_part
+        if not source_path.is_file():
+            if source_path not in self.missing:
+                self.missing.add(source_path)
+                print(f"  ⚠️  Missing asset: {path_part}")
+            return None
+        return source_path, sep + fragment
+
+    def rewrite_reference(self, ref, base_dir, url_prefix):
+        """Return the rewritten reference, or the original if it is not a local asset"""
+        resolved = self.resolve(ref, base_dir)
+        if resolved is None:
+            return ref
+
+        source_path, fragment = resolved
+        name = self.publish(source_path)
+        if name is None:
+            return ref
+        self.stats['references'] += 1
+        return f"{url_prefix}{name}{fragment}"
+
+    def rewrite_image(self, soup, img, base_dir, url_prefix):
+        """Point an <img> at optimized variants, adding srcset and <picture> sources"""
+        resolved = self.resolve(img['src'], base_dir)
+        if resolved is None:
+            return
+
+        from optimize_images import OPTIMIZABLE_EXTENSIONS, MIME_TYPES, build_srcset
+
+        source_path = resolved[0].resolve()
+        if source_path.suffix.lower() not in OPTIMIZABLE_EXTENSIONS:
+            img['src'] = self.rewrite_reference(img['src'], base_dir, url_prefix)
+            return
+
+        variants = self.optimizer.submit(source_path, self.content_hash(source_path))
+        self.pending_variants.extend(v['name'] for v in variants)
+        self.stats['references'] += 1
+
+        fallback = [v for v in variants if v['fallback']]
+        img['src'] = url_prefix + fallback[0]['name']
+        if len(fallback) > 1:
+            img['srcset'] = build_srcset(variants, url_prefix, fallback[0]['format'])
+
+        modern_formats = [fmt for fmt in self.optimizer.formats if fmt != fallback[0]['format']]
+        if modern_formats and img.parent.name != 'picture':
+            picture = soup.new_tag('picture')
+            img.wrap(picture)
+            for fmt in modern_formats:
+                source = soup.new_tag('source', type=MIME_TYPES[fmt],
+                                      srcset=build_srcset(variants, url_prefix, fmt))
+                img.insert_before(source)
+
+    def rewrite_css(self, css, base_dir, url_prefix):
+        """Rewrite url() references inside a block of CSS"""
+        def replace(match):
+            quote, ref = match.group(1), match.group(2)
+            return f"url({quote}{self.rewrite_reference(ref, base_dir, url_prefix)}{quote})"
+        return CSS_URL_PATTERN.sub(replace, css)
+
+    def rewrite_srcset(self, srcset, base_dir, url_prefix):
+        """Rewrite each candidate URL of a srcset attribute, keeping its descriptor"""
+        def replace(match):
+            return match.group(1) + self.rewrite_reference(match.group(2), base_dir, url_prefix)
+        return SRCSET_URL_PATTERN.sub(replace, srcset)
+
+    def rewrite_soup(self, soup, base_dir, url_prefix="../assets/"):
+        """Rewrite src/srcset/href attributes, style blocks and style attributes in a parsed slide"""
+        # Before <img> optimization, which replaces srcset when it makes variants
+        for tag in soup.find_all(srcset=True):
+            tag['srcset'] = self.rewrite_srcset(tag['srcset'], base_dir, url_prefix)
+
+        for tag in soup.find_all(src=True):
+            if tag.name == 'img' and self.optimizer is not None:
+                self.rewrite_image(soup, tag, base_dir, url_prefix)
+            else:
+                tag['src'] = self.rewrite_reference(tag['src'], base_dir, url_prefix)
+
+        # Links to other slides are left alone: .html is not an asset extension
+        for tag in soup.find_all(href=True):
+            tag['href'] = self.rewrite_reference(tag['href'], base_dir, url_prefix)
+
+        for tag in soup.find_all(style=True):
+            tag['style'] = self.rewrite_css(tag['style'], base_dir, url_prefix)
+
+        for style in soup.find_all('style'):
+            if style.string and 'url(' in style.string:
+                style.string = self.rewrite_css(style.string, base_dir, url_prefix)
+
+        return soup
+
+    def finish(self):
+        """Wait for optimized image variants and link them into the build"""
+        if self.optimizer is None:
+            return
+        self.optimizer.wait()
+        for name in dict.fromkeys(self.pending_variants):
+            self.link_into_build(name)
+        self.pending_variants = []
+
+    def report(self):
+        """Print a summary of the asset stage"""
+        print(f"  ✅ Assets: {len(self.published)} unique "
+              f"({self.stats['copied']} new, {self.stats['reused']} reused from cache, "
+              f"{self.stats['references']} references rewritten)")
+        if self.missing:
+            print(f"  ⚠️  {len(self.missing)} referenced asset(s) not found")
+        if self.optimizer is not None:
+            self.optimizer.report()
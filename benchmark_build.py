@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Benchmark the build and export pipeline on synthetic decks
+Generates decks of 100 / 1,000 / 10,000 slides (many agenda sections, varied
+slide sizes, with and without chart scripts) into a temporary slides.db plus
+slides_complete/, runs the build, navigation, minify, asset and PDF-assembly
+stages, and appends time/memory results to a JSON-lines file so runs can be
+compared across commits. Each deck size runs in a fresh process, so its max
+RSS is its own rather than the peak of an earlier, larger deck
+
+Usage:
+    python benchmark_build.py                      # 100 and 1,000 slides
+    python benchmark_build.py --sizes 100 1000 10000
+    python benchmark_build.py --compare            # diff the last two commits
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from build_profiler import BuildProfiler
+
+REPO_DIR = Path(__file__).resolve().parent
+DEFAULT_RESULTS = REPO_DIR / "benchmark_results.jsonl"
+DECK_SIZES = [100, 1000, 10000]
+
+# Synthetic decks reuse a handful of images so the asset stage has to deduplicate
+SYNTHETIC_IMAGES = 5
+
+SLIDE_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    {chart_library}
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+            background: #f5f5f5;
+            overflow: hidden;
+        }}
+
+        .slide {{
+            display: flex;
+            flex-direction: column;
+            width: 100vw;
+            height: 100vh;
+            padding: 3vh 4vw;
+            background: url('image_{image}.png') no-repeat right bottom / 10vw;
+        }}
+{extra_css}
+    </style>
+</head>
+<body>
+    <div class="presentation-container">
+        <div class="slide active">
+            <!-- Slide {num} content -->
+            <h1>{title}</h1>
+            <div class="subtitle">{section}</div>
+            <img src="image_{image}.png" alt="Illustration">
+{paragraphs}
+            {chart_markup}
+        </div>
+    </div>
+    {chart_script}
+</body>
+</html>
+'''
+
+CHART_SCRIPT = '''<script>
+        // Draw the synthetic chart once Chart.js is available
+        function drawChart() {{
+            const ctx = document.getElementById('chart{num}');
+            if (!ctx || typeof Chart === 'undefined') {{
+                setTimeout(drawChart, 500);
+                return;
+            }}
+            new Chart(ctx, {{
+                type: 'line',
+                data: {{
+                    labels: {labels},
+                    datasets: [{{ label: 'Series', data: {values}, borderColor: '#0076a8' }}]
+                }}
+            }});
+        }}
+        drawChart();
+    </script>'''
+
+
+def git_commit():
+    """Current commit hash, or 'unknown' outside a git checkout"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def generate_deck(deck_dir, size, seed=0):
+    """Write slides.db, slides_complete/ and synthetic images for a deck"""
+    from PIL import Image
+
+    rng = random.Random(seed)
+    deck_dir = Path(deck_dir)
+    source_dir = deck_dir / "slides_complete"
+    source_dir.mkdir(parents=True)
+
+    for i in range(SYNTHETIC_IMAGES):
+        Image.new('RGB', (1600, 900), (40 * i, 118, 168)).save(source_dir / f"image_{i}.png")
+
+    # Roughly sqrt(n) agenda sections, so large decks have many sections
+    section_count = max(10, int(size ** 0.5))
+    sections = [f"Section {i + 1:03d}" for i in range(section_count)]
+
+    rows = []
+    for n in range(1, size + 1):
+        section = sections[(n - 1) * section_count // size]
+        has_chart = rng.random() < 0.3
+        paragraph_count = rng.choice([1, 3, 10, 40])
+        css_rules = rng.choice([5, 20, 80])
+
+        html = SLIDE_TEMPLATE.format(
+            title=f"Synthetic Slide {n}",
+            num=n,
+            section=section,
+            image=n % SYNTHETIC_IMAGES,
+            chart_library=('<script src="https://cdnjs.cloudflare.com/ajax/libs/Chart.js/3.9.1/chart.min.js"></script>'
+                           if has_chart else ''),
+            extra_css='\n'.join(f"        .rule-{r} {{\n            padding: {r}px;\n            color: #{r:06x};\n        }}\n"
+                                for r in range(css_rules)),
+            paragraphs='\n'.join(f"            <p class=\"rule-{p % css_rules}\">Paragraph {p} of slide {n}: "
+                                 f"market share, customer growth and ROI commentary.</p>"
+                                 for p in range(paragraph_count)),
+            chart_markup=f'<canvas id="chart{n}"></canvas>' if has_chart else '',
+            chart_script=CHART_SCRIPT.format(
+                num=n,
+                labels=json.dumps([f"M{m}" for m in range(1, 37)]),
+                values=json.dumps([round(rng.uniform(0, 100), 2) for _ in range(36)]),
+            ) if has_chart else '',
+        )
+        source = f"slide_{n:05d}.html"
+        (source_dir / source).write_text(html, encoding='utf-8')
+        rows.append((str(n), f"slide_{n:05d}", f"Synthetic Slide {n}", source, section))
+
+    conn = sqlite3.connect(deck_dir / "slides.db")
+    conn.execute('''
+        CREATE TABLE slides (
+            num TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            title TEXT NOT NULL,
+            source TEXT NOT NULL,
+            agenda_section TEXT NOT NULL
+        )
+    ''')
+    conn.executemany('INSERT INTO slides VALUES (?, ?, ?, ?, ?)', rows)
+    conn.commit()
+    conn.close()
+
+
+def generate_screenshots(capture_dir, count):
+    """Write synthetic 1920x1080 screenshots for the PDF-assembly stage"""
+    from PIL import Image, ImageDraw
+
+    capture_dir.mkdir(parents=True, exist_ok=True)
+    files = []
+    for i in range(count):
+        img = Image.new('RGB', (1920, 1080), 'white')
+        draw = ImageDraw.Draw(img)
+        draw.rectangle((100, 100 + i % 500, 1820, 300 + i % 500), fill=(0, 118, 168))
+        draw.text((120, 120 + i % 500), f"Slide {i + 1}", fill='white')
+        path = capture_dir / f"slide_{i + 1:05d}.png"
+        img.save(path)
+        files.append(path)
+    return files
+
+
+def run_benchmark(size, pdf_pages, seed=0):
+    """Generate one deck, run every stage under the profiler and summarise"""
+    with tempfile.TemporaryDirectory(prefix=f"vmg_bench_{size}_") as tmp:
+        deck_dir = Path(tmp)
+        original_cwd = os.getcwd()
+        generate_deck(deck_dir, size, seed)
+        os.chdir(deck_dir)
+        try:
+            # The builder reads slides.db relative to the working directory
+            sys.path.insert(0, str(REPO_DIR))
+            import build_linked_presentation_v2 as builder
+            from asset_pipeline import AssetPipeline
+
+            profiler = BuildProfiler()
+            output_dir = deck_dir / "vmg_presentation_bench"
+            (output_dir / "slides").mkdir(parents=True)
+
+            with profiler.stage('load_slides_from_db'):
+                builder.SLIDES[:] = builder.load_slides_from_db()
+
+            with profiler.stage('navigation'):
+                for i in range(size):
+                    builder.create_navigation(i, size)
+
+            assets = AssetPipeline(output_dir, cache_dir=deck_dir / ".asset_cache")
+            with profiler.stage('build'):
+                with open(os.devnull, 'w') as devnull:
+                    stdout, sys.stdout = sys.stdout, devnull
+                    try:
+                        sections = builder.agenda_sections()
+                        for i, slide in enumerate(builder.SLIDES):
+                            builder.process_slide(slide, i, size, output_dir, assets,
+                                                  minify=True, profiler=profiler, sections=sections)
+                        builder.create_index_page(output_dir, minify=True)
+                    finally:
+                        sys.stdout = stdout
+
+            screenshots = generate_screenshots(deck_dir / "slide_captures", min(size, pdf_pages))
+            try:
+                from capture_slides_to_pdf import create_pdf_from_screenshots
+            except ImportError as e:
+                print(f"  ⚠️  Skipping PDF assembly: {e}")
+            else:
+                with profiler.stage('pdf_assembly', pages=len(screenshots)):
+                    with open(os.devnull, 'w') as devnull:
+                        stdout, sys.stdout = sys.stdout, devnull
+                        try:
+                            create_pdf_from_screenshots(screenshots, str(deck_dir / "bench.pdf"))
+                        finally:
+                            sys.stdout = stdout
+
+            stages = {}
+            for event in profiler.events:
+                if event['depth'] == 0 or event['name'] in ('parse', 'assets', 'inject', 'minify', 'serialize', 'write'):
+                    entry = stages.setdefault(event['name'], {'ms': 0.0, 'peak_memory_bytes': 0})
+                    entry['ms'] = round(entry['ms'] + event['duration_ms'], 3)
+                    entry['peak_memory_bytes'] = max(entry['peak_memory_bytes'], event['peak'])
+            profiler.stop()
+        finally:
+            os.chdir(original_cwd)
+
+    # ru_maxrss is KB on Linux and bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != 'darwin':
+        max_rss *= 1024
+
+    return {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'slides': size,
+        'stages': stages,
+        'max_rss_bytes': max_rss,
+    }
+
+
+def run_benchmark_process(size, pdf_pages, seed=0):
+    """run_benchmark in a freshly spawned interpreter, so its max RSS
+    covers this deck size alone"""
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(run_benchmark, size, pdf_pages, seed).result()
+
+
+def print_result(result):
+    """Print one benchmark record"""
+    print(f"\n📊 {result['slides']} slides @ {result['commit']}")
+    for name, entry in result['stages'].items():
+        per_slide = entry['ms'] / result['slides']
+        print(f"    {name:<20} {entry['ms']:>11.1f} ms  ({per_slide:.3f} ms/slide, "
+              f"peak {entry['peak_memory_bytes'] / 1024 / 1024:.1f} MB)")
+    print(f"    max RSS {result['max_rss_bytes'] / 1024 / 1024:.0f} MB")
+
+
+def compare_results(results_path):
+    """Compare the latest run of each deck size with the previous commit's run"""
+    records = [json.loads(line) for line in Path(results_path).read_text().splitlines() if line.strip()]
+    for size in sorted({r['slides'] for r in records}):
+        runs = [r for r in records if r['slides'] == size]
+        latest = runs[-1]
+        previous = next((r for r in reversed(runs) if r['commit'] != latest['commit']), None)
+        if previous is None:
+            print(f"\n{size} slides: only one commit recorded ({latest['commit']})")
+            continue
+        print(f"\n{size} slides: {previous['commit']} → {latest['commit']}")
+        for name, entry in latest['stages'].items():
+            before = previous['stages'].get(name)
+            if not before or not before['ms']:
+                print(f"    {name:<20} {entry['ms']:>11.1f} ms  (new)")
+                continue
+            change = (entry['ms'] - before['ms']) * 100 / before['ms']
+            marker = '⚠️ ' if change > 10 else '  '
+            print(f"  {marker}{name:<20} {before['ms']:>11.1f} → {entry['ms']:>11.1f} ms  ({change:+.1f}%)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the build pipeline on synthetic decks")
+    parser.add_argument('--sizes', type=int, nargs='+', choices=DECK_SIZES, default=[100, 1000],
+                        help="Deck sizes to generate (default: 100 1000)")
+    parser.add_argument('--pdf-pages', type=int, default=200,
+                        help="Maximum screenshots assembled into the benchmark PDF (default: 200)")
+    parser.add_argument('--results', default=str(DEFAULT_RESULTS),
+                        help="JSON-lines results file (default: benchmark_results.jsonl)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for deck generation")
+    parser.add_argument('--compare', action='store_true',
+                        help="Only compare the latest recorded runs against the previous commit")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare_results(args.results)
+        return
+
+    print("🏁 VMG build benchmark")
+    print("=" * 50)
+    for size in args.sizes:
+        print(f"\n⚙️  Generating and building {size} slides...")
+        started = time.perf_counter()
+        result = run_benchmark_process(size, args.pdf_pages, args.seed)
+        result['total_s'] = round(time.perf_counter() - started, 2)
+        print_result(result)
+        with open(args.results, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(result) + '\n')
+
+    print(f"\n✅ Results appended to {args.results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,22 @@ Each slide is a separate HTML page with navigation
 Includes color-coded agenda sections in navigation
 """
 
+import argparse
 import os
-import shutil
 import sqlite3
 from pathlib import Path
-from bs4 import BeautifulSoup
 from datetime import datetime
 
+# BeautifulSoup and the minifier are imported inside the functions that use
+# them, so importing this module (e.g. for `vmg.py build --help`) stays fast
+from asset_pipeline import AssetPipeline
+from service_worker import service_worker_registration, write_service_worker
+from build_profiler import BuildProfiler, NULL_PROFILER
+from page_templates import get_template
+from search_index import SearchIndex
+from chart_data import build_datasets, embed_chart_data, load_initiative_scores, load_maturity
+from chart_prerender import drop_unused_libraries, prerender_charts
+
 # Define agenda section colors (from orange/red to green gradient)
 AGENDA_COLORS = {
     "Title": "#666",  # Neutral gray for title
@@ -30,9 +39,9 @@ AGENDA_COLORS = {
     "Appendix": "#888888"  # Gray for appendix
 }
 
-def load_slides_from_db():
+def load_slides_from_db(db_path='slides.db'):
     """Load slides configuration from SQLite database with agenda sections"""
-    conn = sqlite3.connect('slides.db')
+    conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
     # Try to get agenda_section, fall back if it doesn't exist
@@ -60,14 +69,19 @@ def load_slides_from_db():
     conn.close()
     return slides
 
-# Load slides from database
-SLIDES = load_slides_from_db()
+# Slide configuration, loaded from the database by main()
+SLIDES = []
 
-def create_navigation(slide_index, total_slides):
-    """Create navigation HTML for a slide with breadcrumb agenda sections"""
-    current = SLIDES[slide_index]
-    current_section = current.get('agenda_section', 'General')
-    
+# Decks up to this size render every TOC group expanded; larger decks start
+# collapsed and fill each group in on first open
+TOC_EXPANDED_LIMIT = 60
+
+def slide_filename(slide):
+    """Output file name of a slide, e.g. 05_competitive_landscape.html"""
+    return f'{int(slide["num"]):02d}_{slide["name"]}.html'
+
+def agenda_sections():
+    """Agenda sections in order of first appearance with their color and slides"""
     # Abbreviations for long section names
     section_abbreviations = {
         'Competitive landscape': 'Competition',
@@ -75,79 +89,33 @@ def create_navigation(slide_index, total_slides):
         'Risks and mitigation strategies': 'Risks & Mitigation'
     }
     
-    # Get unique agenda sections in order
-    seen_sections = []
-    agenda_sections = []
+    sections = {}
     for slide in SLIDES:
         section = slide.get('agenda_section', 'General')
-        # Include all sections
-        if section not in seen_sections:
-            seen_sections.append(section)
-            # Find first slide in this section for linking
-            first_slide = next((s for s in SLIDES if s.get('agenda_section') == section), None)
-            if first_slide:
-                # Use abbreviated name if available
-                display_name = section_abbreviations.get(section, section)
-                agenda_sections.append({
-                    'name': display_name,
-                    'color': AGENDA_COLORS.get(section, '#666'),
-                    'link': f'{int(first_slide["num"]):02d}_{first_slide["name"]}.html',
-                    'is_current': section == current_section
-                })
-    
-    # Create breadcrumbs HTML
-    breadcrumbs = []
-    for i, section in enumerate(agenda_sections):
-        if section['is_current']:
-            breadcrumbs.append(f'<span class="breadcrumb-item active" style="background: {section["color"]};">{section["name"]}</span>')
-        else:
-            breadcrumbs.append(f'<a href="{section["link"]}" class="breadcrumb-item inactive">{section["name"]}</a>')
-        
-        # Add separator except for last item
-        if i < len(agenda_sections) - 1:
-            breadcrumbs.append('<span class="breadcrumb-separator">›</span>')
-    
-    breadcrumbs_html = ''.join(breadcrumbs)
-    
-    # Previous link
-    if slide_index > 0:
-        prev_slide = SLIDES[slide_index - 1]
-        prev_link = f'<a href="{int(prev_slide["num"]):02d}_{prev_slide["name"]}.html" class="nav-prev">← Previous</a>'
-    else:
-        prev_link = '<span class="nav-prev nav-disabled">← Previous</span>'
-    
-    # Next link
-    if slide_index < total_slides - 1:
-        next_slide = SLIDES[slide_index + 1]
-        next_link = f'<a href="{int(next_slide["num"]):02d}_{next_slide["name"]}.html" class="nav-next">Next →</a>'
-    else:
-        next_link = '<span class="nav-next nav-disabled">Next →</span>'
-    
-    # Find the agenda slide for linking
-    agenda_slide = next((s for s in SLIDES if s.get('name') == 'agenda'), None)
-    agenda_link = f'{int(agenda_slide["num"]):02d}_{agenda_slide["name"]}.html' if agenda_slide else '02_agenda.html'
-    
-    # Navigation HTML with breadcrumbs
-    nav_html = f'''
-    <nav class="slide-navigation">
-        <div class="nav-left">
-            {prev_link}
-        </div>
-        <div class="nav-center">
-            <span class="nav-counter">Slide {int(current["num"])} of {total_slides}</span>
-            <div class="nav-breadcrumbs">
-                <a href="../index.html" class="breadcrumb-item toc-item">TOC</a>
-                <span class="breadcrumb-separator">›</span>
-                {breadcrumbs_html}
-            </div>
-        </div>
-        <div class="nav-right">
-            {next_link}
-        </div>
-    </nav>
-    '''
-    
-    return nav_html
+        if section not in sections:
+            sections[section] = {
+                'name': section,
+                'index': len(sections),
+                'label': section_abbreviations.get(section, section),
+                'color': AGENDA_COLORS.get(section, '#666'),
+                'first_slide': slide,
+                'slides': [],
+            }
+        sections[section]['slides'].append(slide)
+    return list(sections.values())
+
+def create_navigation(slide_index, total_slides, sections=None):
+    """Create navigation HTML for a slide with breadcrumb agenda sections"""
+    current = SLIDES[slide_index]
+    return get_template('navigation.html').render_string(
+        current=current,
+        current_section=current.get('agenda_section', 'General'),
+        total_slides=total_slides,
+        sections=agenda_sections() if sections is None else sections,
+        prev_slide=SLIDES[slide_index - 1] if slide_index > 0 else None,
+        next_slide=SLIDES[slide_index + 1] if slide_index < total_slides - 1 else None,
+        slide_filename=slide_filename,
+    )
 
 def add_navigation_css():
     """CSS for the navigation bar with breadcrumb styling"""
@@ -310,8 +278,14 @@ def add_navigation_css():
     </style>
     '''
 
-def add_keyboard_navigation():
-    """JavaScript for keyboard navigation"""
+def add_keyboard_navigation(fullscreen_persistence=False):
+    """JavaScript for keyboard navigation
+    
+    With fullscreen_persistence the fullscreen state is saved in sessionStorage
+    before each navigation and restored on the next slide
+    """
+    if fullscreen_persistence:
+        return FULLSCREEN_PERSISTENCE_SCRIPT
     return '''
     <script>
         document.addEventListener('keydown', function(e) {
@@ -343,332 +317,446 @@ def add_keyboard_navigation():
     </script>
     '''
 
-def process_slide(slide_info, slide_index, total_slides, output_dir):
-    """Process a single slide file"""
-    source_path = Path("slides_complete") / slide_info["source"]
-    
-    # Read the source file
-    with open(source_path, 'r', encoding='utf-8') as f:
-        html = f.read()
-    
-    soup = BeautifulSoup(html, 'html.parser')
-    
-    # Add navigation CSS to head
-    head = soup.find('head')
-    if head:
-        head.append(BeautifulSoup(add_navigation_css(), 'html.parser'))
-    
-    # Add navigation bar before closing body
-    body = soup.find('body')
-    if body:
-        nav_html = create_navigation(slide_index, total_slides)
-        body.append(BeautifulSoup(nav_html, 'html.parser'))
-        
-        # Add keyboard navigation script
-        body.append(BeautifulSoup(add_keyboard_navigation(), 'html.parser'))
-    
-    # Write to new location
-    output_filename = f"{int(slide_info['num']):02d}_{slide_info['name']}.html"
-    output_path = output_dir / "slides" / output_filename
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(str(soup))
-    
-    print(f"  ✅ Created: {output_filename} ({slide_info.get('agenda_section', 'General')})")
-    
-    return output_filename
-
-def create_index_page(output_dir):
-    """Create the index/contents page matching slide styling"""
-    index_html = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>VMG Strategic Initiative - Presentation</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            background: #f5f5f5;
-            overflow: hidden;
-            margin: 0;
-            padding: 0;
-        }
-
-        .presentation-container {
-            width: 100vw;
-            height: 100vh;
-            display: flex;
-            flex-direction: column;
-            position: relative;
-        }
-
-        .slide {
-            display: flex;
-            flex-direction: column;
-            width: 100vw;
-            height: 100vh;
-            padding: 3vh 4vw;
-            background: white;
-            position: relative;
-            overflow-y: auto;
-            overflow-x: hidden;
-        }
-        
-        h1 {
-            font-size: 2.8vw;
-            margin-bottom: 1vh;
-            color: #1a1a1a;
-            text-align: center;
-            font-weight: 300;
-            letter-spacing: -0.5px;
-        }
-        
-        .subtitle {
-            font-size: 1.3vw;
-            color: #666;
-            margin-bottom: 3vh;
-            padding-bottom: 2vh;
-            border-bottom: 2px solid #e9ecef;
-            text-align: center;
-        }
-        
-        .toc-title {
-            font-size: 1.8vw;
-            color: #495057;
-            margin-bottom: 2vh;
-            font-weight: 600;
-            text-align: center;
-        }
-        
-        .toc-container {
-            max-width: 70vw;
-            margin: 0 auto;
-            flex: 1;
-            display: flex;
-            flex-direction: column;
-        }
-        
-        .toc-grid {
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 1.5vw;
-            margin-bottom: 3vh;
-        }
-        
-        .toc-column {
-            display: flex;
-            flex-direction: column;
-            gap: 0.5vh;
-        }
-        
-        .toc-item {
-            list-style: none;
-            margin-bottom: 0.5vh;
+# Keyboard navigation that remembers fullscreen state across page loads
+FULLSCREEN_PERSISTENCE_SCRIPT = '''
+    <script>
+        // Save fullscreen state before navigation
+        function saveFullscreenState() {
+            if (document.fullscreenElement) {
+                sessionStorage.setItem('wasFullscreen', 'true');
+            } else {
+                sessionStorage.removeItem('wasFullscreen');
+            }
         }
         
-        .toc-link {
-            color: #495057;
-            text-decoration: none;
-            display: flex;
-            padding: 0.8vh 1.2vw;
-            border-radius: 8px;
-            transition: all 0.3s;
-            align-items: baseline;
-            background: #f8f9fa;
-            border: 1px solid transparent;
+        // Restore fullscreen state on page load
+        function restoreFullscreenState() {
+            if (sessionStorage.getItem('wasFullscreen') === 'true') {
+                // Small delay to ensure page is fully loaded
+                setTimeout(() => {
+                    document.documentElement.requestFullscreen().catch(err => {
+                        console.log('Could not restore fullscreen:', err);
+                        // Clear on error to prevent repeated attempts
+                        sessionStorage.removeItem('wasFullscreen');
+                    });
+                }, 100);
+            }
         }
         
-        .toc-link:hover {
-            background: white;
-            border-color: #0076a8;
-            color: #0076a8;
-            transform: translateX(5px);
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }
+        document.addEventListener('keydown', function(e) {
+            switch(e.key) {
+                case 'ArrowLeft':
+                    const prevLink = document.querySelector('.nav-prev:not(.nav-disabled)');
+                    if (prevLink) {
+                        saveFullscreenState();
+                        prevLink.click();
+                    }
+                    break;
+                case 'ArrowRight':
+                case ' ':
+                    e.preventDefault();
+                    const nextLink = document.querySelector('.nav-next:not(.nav-disabled)');
+                    if (nextLink) {
+                        saveFullscreenState();
+                        nextLink.click();
+                    }
+                    break;
+                case 'Home':
+                    e.preventDefault();
+                    const homeLink = document.querySelector('.nav-home');
+                    if (homeLink) {
+                        saveFullscreenState();
+                        homeLink.click();
+                    }
+                    break;
+                case 'f':
+                case 'F':
+                    if (document.fullscreenElement) {
+                        document.exitFullscreen();
+                        sessionStorage.removeItem('wasFullscreen');
+                    } else {
+                        document.documentElement.requestFullscreen();
+                        sessionStorage.setItem('wasFullscreen', 'true');
+                    }
+                    break;
+                case 'Escape':
+                    // Clear fullscreen state when user explicitly exits
+                    sessionStorage.removeItem('wasFullscreen');
+                    break;
+            }
+        });
         
-        .toc-number {
-            font-weight: 600;
-            min-width: 2.5vw;
-            color: #0076a8;
-            font-size: 1.1vw;
-        }
+        // Save state when navigating with the mouse
+        document.querySelectorAll('.nav-prev, .nav-next, .nav-home').forEach(function(link) {
+            link.addEventListener('click', saveFullscreenState);
+        });
         
-        .toc-text {
-            flex: 1;
-            font-size: 1vw;
-            line-height: 1.4;
-        }
+        // Listen for fullscreen changes
+        document.addEventListener('fullscreenchange', function() {
+            if (!document.fullscreenElement) {
+                // User exited fullscreen
+                sessionStorage.removeItem('wasFullscreen');
+            }
+        });
         
-        .start-button {
-            display: inline-block;
-            background: linear-gradient(135deg, #0076a8 0%, #00a74f 100%);
-            color: white;
-            text-decoration: none;
-            padding: 1.2vh 3vw;
-            border-radius: 50px;
-            font-size: 1.2vw;
-            font-weight: 600;
-            transition: transform 0.3s, box-shadow 0.3s;
-            box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4);
+        if (document.readyState === 'loading') {
+            document.addEventListener('DOMContentLoaded', restoreFullscreenState);
+        } else {
+            restoreFullscreenState();
         }
+    </script>
+    '''
+
+# Clears the saved state when the audience returns to the table of contents
+CLEAR_FULLSCREEN_STATE_SCRIPT = '''
+    <script>
+        sessionStorage.removeItem('wasFullscreen');
+    </script>
+    '''
+
+# Elements of the slides built from the financial model and growth projection
+FINANCIAL_ELEMENT_IDS = ['sensitivity-data', 'risk-simulation-data', 'customerTableBody', 'cb-growth-by-year']
+
+def embed_financial_model(soup, slide_name, client_inputs=None):
+    """Fill in ROI results, lookup tables, growth figures, sensitivity data
+    and risk bands from financial_model, roi_lookup, growth_projection,
+    scenario_sweep and monte_carlo (all need numpy)
+    
+    client_inputs (from client_batch.py) override the model defaults, the
+    ROI slide's input fields are set to them, and the sensitivity and risk
+    slides are analysed around them
+    """
+    try:
+        from financial_model import apply_slide_inputs, embed_cost_benefit, embed_results, model_inputs
+        from growth_projection import embed_growth_table, embed_projection
+        from roi_lookup import embed_lookup
+        from scenario_sweep import embed_sensitivity
+        from monte_carlo import embed_risk_bands
+    except ImportError as e:
+        print(f"  ⚠️  {slide_name}: keeping the slide's own figures ({e})")
+        return
+    inputs = model_inputs(**(client_inputs or {}))
+    if client_inputs:
+        apply_slide_inputs(soup, client_inputs)
+    embed_results(soup, inputs)
+    embed_lookup(soup, inputs)
+    embed_projection(soup, inputs)
+    embed_growth_table(soup, inputs)
+    embed_cost_benefit(soup, inputs)
+    embed_sensitivity(soup, inputs)
+    embed_risk_bands(soup, inputs)
+
+def process_slide(slide_info, slide_index, total_slides, output_dir, assets=None, *, minify=False, offline=False,
+                  profiler=NULL_PROFILER, fullscreen_persistence=False, sections=None, search_index=None,
+                  chart_data=None, initiative_scores=None, client_inputs=None, maturity=None):
+    """Process a single slide file
+    
+    chart_data maps the slide's chart ids to JSON datasets from slides.db;
+    initiative_scores are scoring_engine results for the score slides;
+    client_inputs are a client's financial model overrides; maturity is the
+    maturity_assessment gap analysis for the assessment slide. Everything
+    after assets is keyword-only, so a new option cannot shift the others
+    """
+    from bs4 import BeautifulSoup
+    from minify_html import minify_soup
+    
+    source_path = Path("slides_complete") / slide_info["source"]
+    output_filename = slide_filename(slide_info)
+    
+    with profiler.stage('process_slide', slide=output_filename) as stats:
+        # Read the source file
+        with profiler.stage('read'):
+            with open(source_path, 'r', encoding='utf-8') as f:
+                html = f.read()
+        
+        with profiler.stage('parse'):
+            soup = BeautifulSoup(html, 'html.parser')
+        
+        # Replace the slide's default chart datasets with those in slides.db
+        if chart_data:
+            with profiler.stage('chart_data'):
+                for chart_id in embed_chart_data(soup, chart_data):
+                    print(f"  ⚠️  {output_filename}: no data script for chart '{chart_id}'")
+        
+        # Generate the score tables and ranked list from the weighted scores
+        if initiative_scores:
+            with profiler.stage('initiative_scores'):
+                from scoring_engine import embed_scores
+                embed_scores(soup, slide_info['name'], initiative_scores)
+        
+        # Generate the assessment's status line and insight cards from its profile
+        if maturity:
+            with profiler.stage('maturity'):
+                from maturity_assessment import embed_gap_analysis
+                embed_gap_analysis(soup, slide_info['name'], maturity)
+        
+        # Precompute the financial model's results so the slide opens on them
+        if soup.find('input', id='revPerCustomer') or soup.find(id=FINANCIAL_ELEMENT_IDS):
+            with profiler.stage('financial_model'):
+                embed_financial_model(soup, output_filename, client_inputs)
+        
+        # Index the slide's own text before navigation is injected
+        if search_index is not None:
+            with profiler.stage('search_index'):
+                search_index.add_slide(slide_info, output_filename, soup)
+        
+        # Paint charts as static SVG and skip chart libraries the slide never uses
+        with profiler.stage('prerender_charts'):
+            prerender_charts(soup)
+            drop_unused_libraries(soup)
+        
+        # Fingerprint and rewrite local asset references relative to the source slide
+        if assets is not None:
+            with profiler.stage('assets'):
+                assets.rewrite_soup(soup, source_path.parent)
+        
+        with profiler.stage('inject'):
+            # Add navigation CSS to head
+            head = soup.find('head')
+            if head:
+                head.append(BeautifulSoup(add_navigation_css(), 'html.parser'))
+            
+            # Add navigation bar before closing body
+            body = soup.find('body')
+            if body:
+                nav_html = create_navigation(slide_index, total_slides, sections)
+                body.append(BeautifulSoup(nav_html, 'html.parser'))
+                
+                # Add keyboard navigation script
+                body.append(BeautifulSoup(add_keyboard_navigation(fullscreen_persistence), 'html.parser'))
+                
+                # Register the offline service worker (it lives in the build root)
+                if offline:
+                    body.append(BeautifulSoup(service_worker_registration('../'), 'html.parser'))
         
-        .start-button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 6px 20px rgba(102, 126, 234, 0.5);
-        }
+        # Minify markup, inline CSS and scripts in the same pass
+        if minify:
+            with profiler.stage('minify'):
+                minify_soup(soup)
         
-        .button-container {
-            text-align: center;
-            margin-top: 2vh;
-            padding-top: 2vh;
-            border-top: 2px solid #e9ecef;
-        }
+        with profiler.stage('serialize'):
+            output_html = str(soup)
         
-        .keyboard-hint {
-            margin-top: 2vh;
-            padding: 1vh 2vw;
-            background: #f8f9fa;
-            border-radius: 8px;
-            font-size: 0.9vw;
-            color: #6c757d;
-            text-align: center;
-        }
+        # Write to new location
+        output_path = output_dir / "slides" / output_filename
+        with profiler.stage('write'):
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(output_html)
         
-        .keyboard-hint strong {
-            color: #495057;
-        }
-    </style>
-</head>
-<body>
-    <div class="presentation-container">
-        <div class="slide">
-            <h1>VMG Strategic Initiative</h1>
-            <div class="subtitle">AI-Enabled Consulting Platform</div>
-            
-            <div class="toc-container">
-                <div class="toc-title">Table of Contents</div>
-                <div class="toc-grid">
-                    <div class="toc-column">
-'''
-    
-    # Add table of contents entries - split into two columns
-    half_point = len(SLIDES) // 2 + (len(SLIDES) % 2)  # Round up for odd numbers
-    
-    for i, slide in enumerate(SLIDES):
-        if i == half_point:
-            # Start second column
-            index_html += '''
-                    </div>
-                    <div class="toc-column">
-'''
-        
-        index_html += f'''
-                        <div class="toc-item">
-                            <a href="slides/{int(slide["num"]):02d}_{slide["name"]}.html" class="toc-link">
-                                <span class="toc-number">{int(slide["num"])}.</span>
-                                <span class="toc-text">{slide["title"]}</span>
-                            </a>
-                        </div>
-'''
-    
-    # Add start button pointing to first slide
-    first_slide = SLIDES[0] if SLIDES else None
-    start_link = f'slides/{int(first_slide["num"]):02d}_{first_slide["name"]}.html' if first_slide else '#'
-    
-    index_html += f'''
-                    </div>
-                </div>
-                
-                <div class="button-container">
-                    <a href="{start_link}" class="start-button">Start Presentation →</a>
-                    <a href="presenter.html" class="start-button" style="background: linear-gradient(135deg, #00a74f 0%, #0076a8 100%); margin-left: 20px;">
-                        🔳 Fullscreen Mode
-                    </a>
-                </div>
-                
-                <div class="keyboard-hint">
-                    <strong>Keyboard Shortcuts:</strong> Use arrow keys to navigate between slides, 
-                    Home key to return here, F for fullscreen, and Space for next slide.<br>
-                    <strong>Tip:</strong> Use "Fullscreen Mode" button for seamless presentation without losing fullscreen between slides.
-                </div>
-            </div>
-        </div>
-    </div>
-</body>
-</html>
-'''
-    
-    # Write index file
-    index_path = output_dir / "index.html"
-    with open(index_path, 'w', encoding='utf-8') as f:
-        f.write(index_html)
+        if profiler.enabled:
+            stats['bytes_in'] = source_path.stat().st_size
+            stats['bytes_out'] = output_path.stat().st_size
+    
+    print(f"  ✅ Created: {output_filename} ({slide_info.get('agenda_section', 'General')})")
+    
+    return output_filename
+
+def page_scripts(root_prefix="", offline=False, fullscreen_persistence=False, activate_updates=False):
+    """Scripts appended to the body of the index and presenter pages
+
+    activate_updates lets the page switch the deck to a newly built version
+    (the index only, so a talk in progress never changes version)
+    """
+    scripts = []
+    if fullscreen_persistence:
+        scripts.append(CLEAR_FULLSCREEN_STATE_SCRIPT)
+    if offline:
+        scripts.append(service_worker_registration(root_prefix, activate_updates))
+    return scripts
+
+def render_page(template_name, output_path, minify=False, **context):
+    """Stream a template to output_path, or minify the rendered page first"""
+    template = get_template(template_name)
+    if not minify:
+        template.render_to(output_path, slide_filename=slide_filename, **context)
+        return
+    
+    from bs4 import BeautifulSoup
+    from minify_html import minify_soup
+    page_html = template.render_string(slide_filename=slide_filename, **context)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(str(minify_soup(BeautifulSoup(page_html, 'html.parser'))))
+
+def create_index_page(output_dir, minify=False, offline=False, fullscreen_persistence=False, sections=None):
+    """Create the index/contents page matching slide styling
+    
+    The table of contents is grouped by agenda section. Large decks render
+    only the collapsed section headings; each group is filled in from the
+    embedded title index when it is first opened, and the same index backs
+    the title search box
+    """
+    sections = agenda_sections() if sections is None else sections
+    title_index = [[int(slide['num']), slide['title'], slide_filename(slide), section['index']]
+                   for section in sections for slide in section['slides']]
+    title_index.sort(key=lambda entry: entry[0])
+    
+    render_page('index.html', output_dir / "index.html", minify,
+                slides=SLIDES, sections=sections, expanded=len(SLIDES) <= TOC_EXPANDED_LIMIT,
+                title_index=title_index, body_scripts=page_scripts('', offline, fullscreen_persistence, activate_updates=True))
     
     print("  ✅ Created: index.html (with color-coded sections)")
 
-def main():
-    """Build the complete linked presentation"""
+def create_presenter_page(output_dir, template_path, minify=False, offline=False, search_index=None):
+    """Render presenter.html with the slide list from slides.db and the search index"""
+    search_data = search_index.to_json() if search_index is not None else SearchIndex().to_json()
+    render_page(template_path, output_dir / "presenter.html", minify,
+                slides=SLIDES, search_index=search_data, body_scripts=page_scripts('', offline))
+    
+    print("  ✅ Created: presenter.html (fullscreen mode)")
+
+def parse_args(argv=None):
+    """Parse build options"""
+    parser = argparse.ArgumentParser(description="Build the linked VMG presentation")
+    parser.add_argument('--optimize-images', action='store_true',
+                        help="Resize and recompress images and emit WebP/AVIF srcset variants")
+    parser.add_argument('--minify', action='store_true',
+                        help="Collapse markup whitespace and minify inline CSS/JS")
+    parser.add_argument('--offline', action='store_true',
+                        help="Generate a service worker that precaches the whole deck")
+    parser.add_argument('--fullscreen-persistence', action='store_true',
+                        help="Keep fullscreen on while navigating between slide pages")
+    parser.add_argument('--precompress', action='store_true',
+                        help="Write .gz/.br siblings for serve_presentation.py")
+    parser.add_argument('--profile', action='store_true',
+                        help="Record per-stage/per-slide timing and memory, write JSON and Chrome traces")
+    parser.add_argument('--profile-top', type=int, default=10,
+                        help="Number of slowest slides to list with --profile (default: 10)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes for image optimization (default: CPU count)")
+    parser.add_argument('--client', default=None,
+                        help="Build a client's deck from its financial inputs in slides.db (see client_batch.py) "
+                             "under clients/<client>/")
+    parser.add_argument('--db', default='slides.db',
+                        help="Slide database (default: slides.db)")
+    return parser.parse_args(argv)
+
+def main(argv=None, slides=None):
+    """Build the complete linked presentation and return the output directory
+    
+    slides may be passed in by run_pipeline.py to skip re-reading slides.db
+    """
+    args = parse_args(argv)
+    
     print("\n🚀 Building VMG Linked Presentation v2 (with color-coded sections)")
     print("="*50)
     
     # Check if database exists
-    if not Path('slides.db').exists():
-        print("❌ Error: slides.db not found!")
+    if slides is None and not Path(args.db).exists():
+        print(f"❌ Error: {args.db} not found!")
         print("   Run setup_slides_db_v2.py first to create the database")
         return
     
+    # A client deck uses the client's financial inputs and its own directory
+    client_inputs = None
+    base_dir = Path(".")
+    if args.client:
+        from client_batch import CLIENTS_DIR, load_client_inputs
+        client_inputs = load_client_inputs(args.client, args.db)
+        if client_inputs is None:
+            print(f"❌ Error: no client {args.client!r} in {args.db}")
+            print("   Import it first with `python client_batch.py import clients.csv`")
+            return
+        base_dir = CLIENTS_DIR / args.client
+    
     # Create timestamped output directory
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_dir = Path(f"vmg_presentation_{timestamp}")
+    output_dir = base_dir / f"vmg_presentation_{timestamp}"
     slides_dir = output_dir / "slides"
     slides_dir.mkdir(parents=True, exist_ok=True)
     
     # Also create/update a symlink to the latest version
-    latest_link = Path("vmg_presentation_latest")
+    latest_link = base_dir / "vmg_presentation_latest"
     if latest_link.exists() or latest_link.is_symlink():
         latest_link.unlink()
-    latest_link.symlink_to(output_dir)
+    latest_link.symlink_to(output_dir.name)
+    
+    profiler = BuildProfiler() if args.profile else NULL_PROFILER
+    
+    # Load slide configuration (timed when profiling)
+    with profiler.stage('load_slides_from_db'):
+        SLIDES[:] = load_slides_from_db(args.db) if slides is None else slides
+    with profiler.stage('score_initiatives'):
+        initiative_scores = load_initiative_scores(args.db, args.client)
+    with profiler.stage('maturity_assessment'):
+        maturity = load_maturity(args.client, args.db)
+    # The prioritization matrix and assessment chart are drawn from the same scores and profile
+    with profiler.stage('load_chart_data'):
+        chart_datasets = build_datasets(args.db, initiative_scores, maturity)
     
     # Process each slide
     print("\n📄 Processing slides:")
     total_slides = len(SLIDES)
-    
-    for i, slide in enumerate(SLIDES):
-        process_slide(slide, i, total_slides, output_dir)
+    optimizer = None
+    if args.optimize_images:
+        from optimize_images import ImageOptimizer
+        optimizer = ImageOptimizer(workers=args.workers)
+    assets = AssetPipeline(output_dir, optimizer=optimizer)
+    
+    sections = agenda_sections()
+    search_index = SearchIndex()
+    with profiler.stage('process_slides', slides=total_slides):
+        for i, slide in enumerate(SLIDES):
+            process_slide(slide, i, total_slides, output_dir, assets, minify=args.minify, offline=args.offline,
+                          profiler=profiler, fullscreen_persistence=args.fullscreen_persistence,
+                          sections=sections, search_index=search_index,
+                          chart_data=chart_datasets.get(slide['name']), initiative_scores=initiative_scores,
+                          client_inputs=client_inputs, maturity=maturity)
+    
+    # Report fingerprinted assets
+    print("\n🖼️  Publishing assets:")
+    with profiler.stage('publish_assets'):
+        assets.finish()
+    assets.report()
     
     # Create index page
     print("\n📋 Creating index page:")
-    create_index_page(output_dir)
+    with profiler.stage('create_index_page'):
+        create_index_page(output_dir, args.minify, args.offline, args.fullscreen_persistence, sections)
     
-    # Copy image.png if it exists
-    image_path = Path("slides_complete/image.png")
-    if image_path.exists():
-        shutil.copy(image_path, slides_dir / "image.png")
-        print("  ✅ Copied: image.png")
+    # Full-text search index for `search_index.py` and the presenter
+    print("\n🔍 Writing search index:")
+    with profiler.stage('write_search_index'):
+        search_index.write(output_dir)
     
-    # Copy presenter.html if it exists
+    # Render presenter.html if it exists
     presenter_path = Path("presenter.html")
     if presenter_path.exists():
-        shutil.copy(presenter_path, output_dir / "presenter.html")
-        print("  ✅ Copied: presenter.html (fullscreen mode)")
+        with profiler.stage('create_presenter_page'):
+            create_presenter_page(output_dir, presenter_path, args.minify, args.offline, search_index)
+    
+    # Precache manifest and service worker cover every file written above
+    if args.offline:
+        print("\n📴 Generating offline support:")
+        with profiler.stage('service_worker'):
+            write_service_worker(output_dir)
+    
+    # Precompress text files for the local server
+    if args.precompress:
+        from serve_presentation import precompress_build
+        print("\n🗜️  Precompressing output:")
+        with profiler.stage('precompress'):
+            precompress_build(output_dir)
+    
+    if profiler.enabled:
+        profiler.print_summary(args.profile_top)
+        profiler.write(output_dir)
+        profiler.stop()
     
     print("\n✨ Presentation built successfully!")
     print(f"   Version: {timestamp}")
     print(f"   Location: {output_dir}/")
-    print(f"   Latest link: vmg_presentation_latest/")
+    print(f"   Latest link: {latest_link}/")
     print(f"   To view: open {output_dir}/index.html")
     print(f"   Total slides: {total_slides}")
     print("\n📝 Features:")
     print("   - Color-coded agenda sections in navigation")
     print("   - Grouped table of contents by agenda section")
     print("   - Keyboard navigation support")
+    if args.fullscreen_persistence:
+        print("   - Fullscreen persists across slide navigation")
     print("\n" + "="*50)
+    
+    return output_dir
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Build profiling for the linked presentation builder
+Records wall time, bytes in/out and peak traced memory for every build stage
+and every slide, then writes a JSON trace, a Chrome trace (open it in
+chrome://tracing or https://ui.perfetto.dev) and a slowest-slides summary
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off; every hook is a no-op"""
+
+    enabled = False
+
+    def stage(self, name, **args):
+        return nullcontext({})
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class BuildProfiler:
+    """Collects nested stage timings with tracemalloc peak memory"""
+
+    enabled = True
+
+    def __init__(self):
+        self.events = []
+        self.stack = []
+        self.peak = 0  # build-wide peak; tracemalloc's own is reset per stage
+        self.start = time.perf_counter()
+        tracemalloc.start()
+
+    def _reset_peak(self):
+        """Reset tracemalloc's peak, keeping it in the build-wide peak first"""
+        self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+
+    def peak_memory(self):
+        """Peak traced memory over the whole build so far"""
+        return max(self.peak, tracemalloc.get_traced_memory()[1])
+
+    @contextmanager
+    def stage(self, name, **args):
+        """Time a stage; callers may add bytes_in/bytes_out to the yielded dict"""
+        if self.stack:
+            parent = self.stack[-1]
+            parent['peak'] = max(parent['peak'], tracemalloc.get_traced_memory()[1])
+        self._reset_peak()
+
+        record = {'name': name, 'args': dict(args), 'peak': 0, 'depth': len(self.stack)}
+        self.stack.append(record)
+        began = time.perf_counter()
+        try:
+            yield record['args']
+        finally:
+            ended = time.perf_counter()
+            self.stack.pop()
+            record['peak'] = max(record['peak'], tracemalloc.get_traced_memory()[1])
+            record['start_ms'] = (began - self.start) * 1000
+            record['duration_ms'] = (ended - began) * 1000
+            self.events.append(record)
+            # Nested stages reset the tracemalloc peak, so fold it back into the parent
+            if self.stack:
+                self.stack[-1]['peak'] = max(self.stack[-1]['peak'], record['peak'])
+            self._reset_peak()
+
+    def slide_events(self):
+        """Top-level per-slide records"""
+        return [e for e in self.events if e['name'] == 'process_slide']
+
+    def write(self, output_dir):
+        """Write build_profile.json and build_trace.json (Chrome trace format)"""
+        output_dir = Path(output_dir)
+        ordered = sorted(self.events, key=lambda e: (e['start_ms'], e['depth']))
+
+        profile = {
+            'total_ms': round((time.perf_counter() - self.start) * 1000, 3),
+            'peak_memory_bytes': self.peak_memory(),
+            'stages': [{
+                'name': e['name'],
+                'depth': e['depth'],
+                'start_ms': round(e['start_ms'], 3),
+                'duration_ms': round(e['duration_ms'], 3),
+                'peak_memory_bytes': e['peak'],
+                **e['args'],
+            } for e in ordered],
+        }
+        with open(output_dir / "build_profile.json", 'w', encoding='utf-8') as f:
+            json.dump(profile, f, indent=1)
+
+        trace = {'traceEvents': [{
+            'name': e['args'].get('slide', e['name']),
+            'cat': e['name'],
+            'ph': 'X',
+            'ts': round(e['start_ms'] * 1000, 1),
+            'dur': round(e['duration_ms'] * 1000, 1),
+            'pid': 1,
+            'tid': 1,
+            'args': {'peak_memory_bytes': e['peak'], **e['args']},
+        } for e in ordered]}
+        with open(output_dir / "build_trace.json", 'w', encoding='utf-8') as f:
+            json.dump(trace, f)
+
+        print("  ✅ Created: build_profile.json, build_trace.json (chrome://tracing)")
+
+    def print_summary(self, top=10):
+        """Print stage totals per nesting level and the slowest slides
+
+        Each level gets its own table, since a nested stage's time is
+        already part of its parent's (process_slide within process_slides)
+        """
+        levels = {}
+        for event in self.events:
+            if event['depth'] <= 2:
+                totals = levels.setdefault(event['depth'], {})
+                totals.setdefault(event['name'], [0.0, 0])
+                totals[event['name']][0] += event['duration_ms']
+                totals[event['name']][1] += 1
+
+        print(f"\n⏱️  Build profile ({(time.perf_counter() - self.start) * 1000:.0f} ms total, "
+              f"peak traced memory {self.peak_memory() / 1024 / 1024:.1f} MB)")
+        for depth, totals in sorted(levels.items()):
+            print("  Stage totals:" if depth == 0 else f"  Nested stage totals (level {depth}):")
+            for name, (duration, count) in sorted(totals.items(), key=lambda item: -item[1][0]):
+                print(f"    {name:<24} {duration:>9.1f} ms  ({count}x)")
+
+        slides = sorted(self.slide_events(), key=lambda e: -e['duration_ms'])[:top]
+        if slides:
+            print(f"  Slowest {len(slides)} slides:")
+            for event in slides:
+                args = event['args']
+                print(f"    {event['duration_ms']:>7.1f} ms  {args.get('slide', '?'):<45} "
+                      f"{args.get('bytes_in', 0) / 1024:>6.1f} KB → {args.get('bytes_out', 0) / 1024:>6.1f} KB  "
+                      f"peak {event['peak'] / 1024 / 1024:.1f} MB")
+
+    def stop(self):
+        tracemalloc.stop()
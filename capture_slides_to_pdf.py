@@ -2,22 +2,26 @@
 """
 Capture all presentation slides to PDF using Selenium
 Navigates through each slide and takes screenshots
+Screenshots are reused while the built slide they were taken from is
+unchanged (e.g. only slides whose chart data changed are recaptured)
+
+Usage:
+    python capture_slides_to_pdf.py
+    python capture_slides_to_pdf.py --force --delete-screenshots
 """
 
+import argparse
+import hashlib
+import json
 import os
+import sys
 import time
 from pathlib import Path
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
-from PIL import Image
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter, landscape
-from reportlab.lib.utils import ImageReader
 import sqlite3
 
+# selenium, PIL and reportlab are imported by the functions that need them,
+# so PDF assembly works without selenium and startup stays fast
+
 def get_slides_from_db():
     """Get all slides from the database"""
     conn = sqlite3.connect('slides.db')
@@ -27,8 +31,37 @@ def get_slides_from_db():
     conn.close()
     return slides
 
-def capture_slides():
-    """Capture all slides using Selenium"""
+# Screenshot file name -> hash of the built slide it was taken from
+CAPTURE_MANIFEST = "capture_manifest.json"
+
+def file_hash(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_manifest(output_dir):
+    manifest_path = output_dir / CAPTURE_MANIFEST
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+def save_manifest(output_dir, manifest):
+    manifest_path = output_dir / CAPTURE_MANIFEST
+    tmp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+    tmp_path.replace(manifest_path)
+
+def capture_slides(force=False):
+    """Capture all slides using Selenium
+    
+    Slides whose built HTML matches the last capture keep their screenshot
+    unless force is set; Chrome is not started when every slide is current
+    """
     print("🚀 Starting slide capture process...")
     
     # Create output directory
@@ -39,6 +72,27 @@ def capture_slides():
     slides = get_slides_from_db()
     print(f"Found {len(slides)} slides to capture")
     
+    manifest = {} if force else load_manifest(output_dir)
+    captured_files = []
+    stale = []
+    for slide_num, slide_name, slide_title in slides:
+        slide_file = f"{str(slide_num).zfill(2)}_{slide_name}.html"
+        screenshot_path = output_dir / f"slide_{str(slide_num).zfill(2)}_{slide_name}.png"
+        built_path = Path("vmg_presentation_latest") / "slides" / slide_file
+        fingerprint = file_hash(built_path) if built_path.exists() else None
+        captured_files.append(screenshot_path)
+        if fingerprint is None or manifest.get(screenshot_path.name) != fingerprint or not screenshot_path.exists():
+            stale.append((slide_num, slide_file, slide_title, screenshot_path, fingerprint))
+    
+    if len(stale) < len(slides):
+        print(f"⏭️  {len(slides) - len(stale)} slide(s) unchanged since their last capture")
+    if not stale:
+        print(f"✅ Captured {len(captured_files)} slides")
+        return captured_files
+    
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    
     # Setup Chrome options for better screenshots
     options = webdriver.ChromeOptions()
     options.add_argument('--start-maximized')
@@ -59,13 +113,11 @@ def capture_slides():
         driver.get(f"file://{presentation_path}")
         time.sleep(2)
         
-        captured_files = []
-        
-        for slide_num, slide_name, slide_title in slides:
+        for slide_num, slide_file, slide_title, screenshot_path, fingerprint in stale:
             print(f"📸 Capturing slide {slide_num}: {slide_title}")
             
             # Navigate to the slide
-            slide_url = f"file://{Path.cwd()}/vmg_presentation_latest/slides/{str(slide_num).zfill(2)}_{slide_name}.html"
+            slide_url = f"file://{Path.cwd()}/vmg_presentation_latest/slides/{slide_file}"
             driver.get(slide_url)
             
             # Wait for slide to load
@@ -79,22 +131,26 @@ def capture_slides():
             time.sleep(5)  # Give plenty of time for everything to render
             
             # Take screenshot
-            screenshot_path = output_dir / f"slide_{str(slide_num).zfill(2)}_{slide_name}.png"
             driver.save_screenshot(str(screenshot_path))
-            captured_files.append(screenshot_path)
+            manifest[screenshot_path.name] = fingerprint
             
             # Exit fullscreen for next slide
             body.send_keys('f')
             time.sleep(0.2)
         
-        print(f"✅ Captured {len(captured_files)} slides")
+        print(f"✅ Captured {len(captured_files)} slides ({len(stale)} new)")
         return captured_files
         
     finally:
         driver.quit()
+        save_manifest(output_dir, manifest)
 
 def create_pdf_from_screenshots(screenshot_files, output_filename="presentation.pdf"):
     """Create a PDF from the screenshot files"""
+    from PIL import Image
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter, landscape
+    
     print(f"📄 Creating PDF: {output_filename}")
     
     if not screenshot_files:
@@ -138,24 +194,43 @@ def create_pdf_from_screenshots(screenshot_files, output_filename="presentation.
     print(f"✅ PDF created: {pdf_path}")
     return pdf_path
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Capture every built slide with Selenium and assemble a PDF")
+    parser.add_argument('--force', action='store_true', help="Recapture slides whose built page is unchanged")
+    parser.add_argument('--output', default="VMG_Presentation.pdf",
+                        help="PDF file name (default: VMG_Presentation.pdf)")
+    cleanup = parser.add_mutually_exclusive_group()
+    cleanup.add_argument('--keep-screenshots', action='store_true',
+                         help="Keep the screenshots without asking (the default when not run interactively)")
+    cleanup.add_argument('--delete-screenshots', action='store_true',
+                         help="Delete the screenshots after building the PDF without asking")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main function to capture slides and create PDF"""
+    args = parse_args(argv)
+    
     print("=" * 50)
     print("VMG Presentation PDF Generator")
     print("=" * 50)
     
     try:
         # Capture all slides
-        screenshots = capture_slides()
+        screenshots = capture_slides(force=args.force)
         
         # Create PDF
         if screenshots:
-            pdf_file = create_pdf_from_screenshots(screenshots, "VMG_Presentation.pdf")
-            print("\n✨ Success! Your presentation has been saved as VMG_Presentation.pdf")
-            print(f"   Location: {Path.cwd() / 'VMG_Presentation.pdf'}")
+            pdf_file = create_pdf_from_screenshots(screenshots, args.output)
+            print(f"\n✨ Success! Your presentation has been saved as {args.output}")
+            print(f"   Location: {Path.cwd() / args.output}")
             
-            # Optionally clean up screenshot files
-            cleanup = input("\n🧹 Delete screenshot files? (y/n): ").lower()
+            # Optionally clean up screenshot files; only ask when someone can answer
+            if args.delete_screenshots:
+                cleanup = 'y'
+            elif args.keep_screenshots or not sys.stdin.isatty():
+                cleanup = 'n'
+            else:
+                cleanup = input("\n🧹 Delete screenshot files? (y/n): ").lower()
             if cleanup == 'y':
                 for f in screenshots:
                     f.unlink()
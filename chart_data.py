@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Chart datasets kept in slides.db instead of inside slide scripts
+Each row of the chart_data table holds one dataset as compact JSON, keyed by
+slide name and chart id. A slide reads the dataset from a
+<script type="application/json" id="chart-data-<chart id>"> element whose
+contents are the slide's own defaults; the builder overwrites them from the
+table and stamps each with a short content hash (data-hash), so changing a
+number means updating a row rather than editing HTML
+
+Builds still regenerate every slide; the hash only makes a dataset change
+visible in the built page, so the capture step (which compares built pages
+against its manifest) recaptures just the slides that embed it
+
+Usage:
+    python chart_data.py list
+    python chart_data.py show <slide> <chart id>
+    python chart_data.py set <slide> <chart id> data.json
+    python chart_data.py extract              # seed the table from the slides' defaults
+
+The prioritization matrix and maturity chart are generated by
+scoring_engine.py and maturity_assessment.py (ENGINE_CHARTS); set
+refuses them and extract skips them
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+DB_PATH = 'slides.db'
+SLIDES_DIR = Path("slides_complete")
+
+# Data scripts are found by this id prefix plus the chart id
+SCRIPT_ID_PREFIX = 'chart-data-'
+
+# Datasets the engines generate from their own tables; the builder always
+# uses the engine's data for these, so rows for them would be overwritten
+ENGINE_CHARTS = {
+    ('slide_14_strategic_prioritization', 'initiatives'): 'scoring_engine.py',
+    ('slide_12_assessment_graph', 'maturity-scores'): 'maturity_assessment.py',
+}
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS chart_data (
+        slide TEXT NOT NULL,
+        chart_id TEXT NOT NULL,
+        data TEXT NOT NULL,
+        PRIMARY KEY (slide, chart_id)
+    )
+'''
+
+
+def compact_json(data):
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+
+def dataset_hash(text, length=12):
+    """Short content hash of a dataset's compact JSON"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:length]
+
+
+def load_chart_data(db_path=DB_PATH):
+    """{slide name: {chart id: compact JSON}}; empty for databases without the table"""
+    if not Path(db_path).exists():
+        return {}
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute('SELECT slide, chart_id, data FROM chart_data ORDER BY slide, chart_id').fetchall()
+    except sqlite3.OperationalError:
+        return {}
+    finally:
+        conn.close()
+    datasets = {}
+    for slide, chart_id, data in rows:
+        datasets.setdefault(slide, {})[chart_id] = compact_json(json.loads(data))
+    return datasets
+
+
+def load_initiative_scores(db_path=DB_PATH, client=None):
+    """Weighted initiative scores from scoring_engine (needs numpy), with the
+    client's own weights where it has any, or None to keep the slides' own
+    figures"""
+    try:
+        from scoring_engine import load_scoring, score_initiatives
+    except ImportError as e:
+        print(f"  ⚠️  Keeping the slides' own initiative scores ({e})")
+        return None
+    scoring = load_scoring(db_path, client)
+    return score_initiatives(scoring) if scoring else None
+
+
+def load_maturity(client=None, db_path=DB_PATH):
+    """Gap analysis of the client's maturity profile, else the house profile,
+    from maturity_assessment (needs numpy), or None to keep the slide's own
+    figures"""
+    try:
+        from maturity_assessment import HOUSE_PROFILE, gap_analysis, load_assessments
+    except ImportError as e:
+        print(f"  ⚠️  Keeping the slide's own maturity assessment ({e})")
+        return None
+    assessments = load_assessments(db_path)
+    if not assessments:
+        return None
+    analyses = gap_analysis(assessments)
+    if client and client not in analyses:
+        print(f"  ℹ️  No maturity profile for {client}; using the {HOUSE_PROFILE} assessment")
+    return analyses.get(client) or analyses.get(HOUSE_PROFILE)
+
+
+def build_datasets(db_path=DB_PATH, initiative_scores=None, maturity=None):
+    """Every dataset a build embeds: {slide name: {chart id: compact JSON}}
+
+    The table's rows, with the engine-generated charts (ENGINE_CHARTS) drawn
+    from initiative_scores and maturity where those are available
+    """
+    datasets = load_chart_data(db_path)
+    if initiative_scores:
+        from scoring_engine import MATRIX_CHART_ID, MATRIX_SLIDE, matrix_dataset
+        datasets.setdefault(MATRIX_SLIDE, {})[MATRIX_CHART_ID] = matrix_dataset(initiative_scores)
+    if maturity:
+        from maturity_assessment import ASSESSMENT_CHART_ID, ASSESSMENT_SLIDE, assessment_dataset
+        datasets.setdefault(ASSESSMENT_SLIDE, {})[ASSESSMENT_CHART_ID] = assessment_dataset(maturity)
+    return datasets
+
+
+def save_dataset(conn, slide, chart_id, data):
+    """Insert or replace one dataset; returns its hash"""
+    conn.execute(SCHEMA)
+    text = compact_json(data)
+    conn.execute('INSERT OR REPLACE INTO chart_data (slide, chart_id, data) VALUES (?, ?, ?)',
+                 (slide, chart_id, text))
+    return dataset_hash(text)
+
+
+def embed_chart_data(soup, datasets):
+    """Fill a slide's data scripts from {chart id: compact JSON}
+
+    Returns the chart ids that have no data script in the slide
+    """
+    missing = []
+    for chart_id, text in datasets.items():
+        script = soup.find('script', id=SCRIPT_ID_PREFIX + chart_id)
+        if script is None:
+            missing.append(chart_id)
+            continue
+        script.string = text.replace('</', '<\\/')
+        script['data-hash'] = dataset_hash(text)
+    return missing
+
+
+def slide_datasets(soup):
+    """{chart id: data} from a slide's data scripts"""
+    datasets = {}
+    for script in soup.find_all('script', id=lambda value: value and value.startswith(SCRIPT_ID_PREFIX)):
+        datasets[script['id'][len(SCRIPT_ID_PREFIX):]] = json.loads(script.string or 'null')
+    return datasets
+
+
+def extract(db_path=DB_PATH, overwrite=False):
+    """Copy every slide's default datasets into the table
+
+    Existing rows are kept unless overwrite is set, and engine-generated
+    charts are skipped. Returns (slide, chart id) pairs written
+    """
+    from bs4 import BeautifulSoup
+
+    conn = sqlite3.connect(db_path)
+    written = []
+    try:
+        conn.execute(SCHEMA)
+        existing = set(conn.execute('SELECT slide, chart_id FROM chart_data').fetchall())
+        for name, source in conn.execute('SELECT name, source FROM slides ORDER BY CAST(num AS INTEGER)').fetchall():
+            path = SLIDES_DIR / source
+            if not path.exists():
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                soup = BeautifulSoup(f.read(), 'html.parser')
+            for chart_id, data in slide_datasets(soup).items():
+                if (name, chart_id) in ENGINE_CHARTS:
+                    continue
+                if overwrite or (name, chart_id) not in existing:
+                    save_dataset(conn, name, chart_id, data)
+                    written.append((name, chart_id))
+        conn.commit()
+    finally:
+        conn.close()
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage chart datasets stored in slides.db")
+    parser.add_argument('--db', default=DB_PATH, help=f"Database path (default: {DB_PATH})")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('list', help="List datasets with their hashes")
+    show = commands.add_parser('show', help="Print a dataset as JSON")
+    set_parser = commands.add_parser('set', help="Store a dataset from a JSON file ('-' for stdin)")
+    for command in (show, set_parser):
+        command.add_argument('slide', help="Slide name, e.g. slide_14_strategic_prioritization")
+        command.add_argument('chart_id', help="Chart id, e.g. initiatives")
+    set_parser.add_argument('file', help="JSON file")
+    extract_parser = commands.add_parser('extract', help="Seed the table from the slides' data scripts")
+    extract_parser.add_argument('--overwrite', action='store_true', help="Replace datasets already in the table")
+    args = parser.parse_args(argv)
+
+    if not Path(args.db).exists():
+        print(f"❌ Error: {args.db} not found!")
+        sys.exit(1)
+
+    if args.command == 'list':
+        datasets = load_chart_data(args.db)
+        if not datasets:
+            print("No chart data yet; run `python chart_data.py extract` to seed it from the slides")
+            return
+        print(f"📊 Chart data in {args.db}:")
+        for slide, charts in datasets.items():
+            for chart_id, text in charts.items():
+                print(f"  {slide:<40} {chart_id:<20} {dataset_hash(text)}  {len(text):>6,} bytes")
+    elif args.command == 'show':
+        text = load_chart_data(args.db).get(args.slide, {}).get(args.chart_id)
+        if text is None:
+            print(f"❌ No dataset {args.chart_id!r} for {args.slide}")
+            sys.exit(1)
+        print(json.dumps(json.loads(text), indent=2))
+    elif args.command == 'set':
+        owner = ENGINE_CHARTS.get((args.slide, args.chart_id))
+        if owner:
+            print(f"❌ {args.slide}/{args.chart_id} is generated by {owner}; change its data there")
+            sys.exit(1)
+        try:
+            if args.file == '-':
+                data = json.load(sys.stdin)
+            else:
+                with open(args.file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error reading {args.file}: {e}")
+            sys.exit(1)
+        conn = sqlite3.connect(args.db)
+        try:
+            digest = save_dataset(conn, args.slide, args.chart_id, data)
+            conn.commit()
+        finally:
+            conn.close()
+        print(f"✅ Stored {args.slide}/{args.chart_id} ({digest})")
+    else:
+        written = extract(args.db, args.overwrite)
+        for slide, chart_id in written:
+            print(f"  ✅ {slide}/{chart_id}")
+        print(f"📊 Seeded {len(written)} dataset(s)")
+
+
+if __name__ == "__main__":
+    main()
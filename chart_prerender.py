@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Pre-render data-driven slide charts to static SVG at build time
+Each chart whose dataset lives in a chart-data script (see chart_data.py)
+and whose script names its container (data-chart="<element id>") is drawn
+here with the slide's layout and inlined into that container, so the slide
+paints its chart immediately and screenshots do not wait on Plotly. The
+slide loads Plotly and swaps in the interactive chart only when the chart
+is first pointed at, clicked or focused
+
+Renders are cached in .chart_cache/ by chart id and dataset hash, so an
+unchanged dataset is never rendered twice. Script tags for chart libraries
+that no inline script uses are dropped from every slide
+
+Usage:
+    python chart_prerender.py                     # render every dataset a build embeds
+    python chart_prerender.py --client acme-logistics
+    python chart_prerender.py --output-dir svgs/
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+from pathlib import Path
+
+from chart_data import DB_PATH, SCRIPT_ID_PREFIX, build_datasets, compact_json, load_initiative_scores, load_maturity
+
+CHART_CACHE_DIR = Path(".chart_cache")
+
+# Bump when a renderer's output changes, so cached SVGs are redrawn
+RENDERER_VERSION = 3
+
+# Library script src marker -> pattern of inline code that uses the library
+CHART_LIBRARIES = {
+    'plot.ly': re.compile(r'\bPlotly\b'),
+    'chart.js': re.compile(r'\bnew Chart\b|\bChart\.'),
+}
+
+FONT = "-apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif"
+GRID_COLOR = '#e0e0e0'
+
+
+def _attrs(**attributes):
+    """SVG attributes from keyword arguments (font_size -> font-size)"""
+    return ' '.join(f'{name.replace("_", "-")}="{html.escape(str(value), quote=True)}"'
+                    for name, value in attributes.items() if value is not None)
+
+
+def _text(x, y, content, **attributes):
+    return f'<text {_attrs(x=f"{x:.1f}", y=f"{y:.1f}", **attributes)}>{html.escape(str(content))}</text>'
+
+
+def _svg(width, height, label, body):
+    return (f'<svg class="chart-prerender" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+            f'width="100%" height="100%" preserveAspectRatio="xMidYMid meet" role="img" '
+            f'aria-label="{html.escape(label, quote=True)}" font-family="{html.escape(FONT, quote=True)}">'
+            + ''.join(body) + '</svg>')
+
+
+class Axes:
+    """Linear data -> pixel mapping for a plot area inside margins"""
+
+    def __init__(self, width, height, margin, x_range, y_range):
+        left, right, top, bottom = margin
+        self.left, self.right = left, width - right
+        self.top, self.bottom = top, height - bottom
+        self.x_range, self.y_range = x_range, y_range
+
+    def x(self, value):
+        low, high = self.x_range
+        return self.left + (value - low) / (high - low) * (self.right - self.left)
+
+    def y(self, value):
+        low, high = self.y_range
+        return self.bottom - (value - low) / (high - low) * (self.bottom - self.top)
+
+
+def render_initiatives(initiatives):
+    """Bubble matrix of slide_14_strategic_prioritization (ease x impact)"""
+    width, height = 700, 450
+    axes = Axes(width, height, (60, 20, 20, 60), (3, 10), (6.5, 10.5))
+    body = [f'<rect {_attrs(width=width, height=height, fill="white")}/>']
+
+    # Quadrant shading and labels
+    for x0, x1, fill, label, color in ((6.5, 10, '#e8eaf6', 'QUICK WINS', '#667eea'),
+                                       (3, 6.5, '#f3e5f5', 'STRATEGIC', '#764ba2')):
+        body.append(f'<rect {_attrs(x=f"{axes.x(x0):.1f}", y=f"{axes.y(10.5):.1f}", width=f"{axes.x(x1) - axes.x(x0):.1f}", height=f"{axes.y(8.5) - axes.y(10.5):.1f}", fill=fill, opacity=0.3)}/>')
+        body.append(_text(axes.x((x0 + x1) / 2), axes.y(10.2), label, fill=color, font_size=10,
+                          text_anchor='middle', dominant_baseline='central', font_family='Open Sans, sans-serif'))
+
+    for value in range(3, 11):
+        x = axes.x(value)
+        body.append(f'<line {_attrs(x1=f"{x:.1f}", x2=f"{x:.1f}", y1=axes.top, y2=axes.bottom, stroke=GRID_COLOR)}/>')
+        body.append(_text(x, axes.bottom + 18, value, fill='#444', font_size=12, text_anchor='middle'))
+    for value in range(7, 11):
+        y = axes.y(value)
+        body.append(f'<line {_attrs(x1=axes.left, x2=axes.right, y1=f"{y:.1f}", y2=f"{y:.1f}", stroke=GRID_COLOR)}/>')
+        body.append(_text(axes.left - 8, y, value, fill='#444', font_size=12, text_anchor='end',
+                          dominant_baseline='central'))
+    body.append(_text((axes.left + axes.right) / 2, height - 15, 'Implementation Ease →', fill='#444',
+                      font_size=14, text_anchor='middle'))
+    body.append(_text(0, 0, 'Business Impact →', fill='#444', font_size=14, text_anchor='middle',
+                      transform=f'translate(18 {(axes.top + axes.bottom) / 2:.1f}) rotate(-90)'))
+
+    for initiative in initiatives:
+        x, y = axes.x(initiative['ease']), axes.y(initiative['impact'])
+        body.append(f'<g><title>{html.escape(str(initiative["name"]))}</title>'
+                    f'<circle {_attrs(cx=f"{x:.1f}", cy=f"{y:.1f}", r=initiative["size"] / 2, fill=initiative["color"], fill_opacity=0.7, stroke="white", stroke_width=2)}/>'
+                    + _text(x, y, initiative['priority'], fill='white', font_size=14, text_anchor='middle',
+                            dominant_baseline='central', font_family='Arial Black, sans-serif')
+                    + '</g>')
+    return _svg(width, height, 'Initiative prioritization matrix', body)
+
+
+# Level names for datasets without their own (see maturity_assessment.py)
+MATURITY_LEVELS = ['Aware', 'Reactive', 'Proactive', 'Managed', 'Optimizing']
+
+MATURITY_SERIES = [
+    ('current', 'Current Level', '#0076a8', None, 'circle'),
+    ('target', '12-Month Target', '#00a74f', '9,9', 'diamond'),
+]
+
+
+def _marker(shape, x, y, color):
+    if shape == 'diamond':
+        points = f'{x:.1f},{y - 7:.1f} {x + 7:.1f},{y:.1f} {x:.1f},{y + 7:.1f} {x - 7:.1f},{y:.1f}'
+        return f'<polygon {_attrs(points=points, fill=color, stroke="white", stroke_width=2)}/>'
+    return f'<circle {_attrs(cx=f"{x:.1f}", cy=f"{y:.1f}", r=6, fill=color, stroke="white", stroke_width=2)}/>'
+
+
+def render_maturity_scores(scores):
+    """Current vs. target maturity lines of slide_12_assessment_graph"""
+    width, height = 900, 380
+    categories = scores['categories']
+    levels = scores.get('levels', MATURITY_LEVELS)
+    averages = [(scores.get(f'{key}Average', round(sum(scores[key]) / len(scores[key]), 1)), label, color)
+                for key, label, color in (('current', 'Current Avg', '#ff6b6b'), ('target', 'Target Avg', '#00a74f'))]
+    axes = Axes(width, height, (80, 80, 40, 80), (-0.5, len(categories) - 0.5), (0, len(levels)))
+    body = [f'<rect {_attrs(width=width, height=height, fill="white")}/>',
+            f'<rect {_attrs(x=axes.left, y=axes.top, width=axes.right - axes.left, height=axes.bottom - axes.top, fill="#fafafa")}/>']
+
+    for level in range(0, len(levels) + 1):
+        y = axes.y(level)
+        body.append(f'<line {_attrs(x1=axes.left, x2=axes.right, y1=f"{y:.1f}", y2=f"{y:.1f}", stroke=GRID_COLOR)}/>')
+        if level:
+            body.append(f'<text {_attrs(x=axes.left - 10, y=f"{y - 4:.1f}", fill="#333", font_size=12, text_anchor="end")}>'
+                        f'<tspan>{level}.0</tspan><tspan {_attrs(x=axes.left - 10, dy=14)}>{html.escape(levels[level - 1])}</tspan></text>')
+    for i, category in enumerate(categories):
+        x = axes.x(i)
+        body.append(f'<line {_attrs(x1=f"{x:.1f}", x2=f"{x:.1f}", y1=axes.top, y2=axes.bottom, stroke=GRID_COLOR)}/>')
+        body.append(_text(x, axes.bottom + 22, category, fill='#333', font_size=14, text_anchor='middle'))
+    body.append(_text((axes.left + axes.right) / 2, axes.bottom + 58, 'Building Blocks', fill='#666',
+                      font_size=16, text_anchor='middle'))
+    body.append(_text(0, 0, 'Maturity Level', fill='#666', font_size=16, text_anchor='middle',
+                      transform=f'translate(22 {(axes.top + axes.bottom) / 2:.1f}) rotate(-90)'))
+
+    y = axes.y(averages[0][0])
+    body.append(f'<line {_attrs(x1=axes.left, x2=axes.right, y1=f"{y:.1f}", y2=f"{y:.1f}", stroke="#ff6b6b", stroke_width=2, stroke_dasharray="3,3")}/>')
+
+    for key, name, color, dash, shape in MATURITY_SERIES:
+        points = [(axes.x(i), axes.y(value)) for i, value in enumerate(scores[key])]
+        body.append(f'<polyline {_attrs(points=" ".join(f"{x:.1f},{y:.1f}" for x, y in points), fill="none", stroke=color, stroke_width=3, stroke_dasharray=dash)}/>')
+        body.extend(_marker(shape, x, y, color) for x, y in points)
+
+    for value, name, color in averages:
+        label = f"{name}: {value:.1f}"
+        x, y = axes.x(len(categories) - 0.8), axes.y(value)
+        box_width = 7 * len(label) + 8
+        body.append(f'<rect {_attrs(x=f"{x - box_width / 2:.1f}", y=f"{y - 10:.1f}", width=box_width, height=20, fill="white", stroke=color)}/>')
+        body.append(_text(x, y, label, fill=color, font_size=12, text_anchor='middle', dominant_baseline='central'))
+
+    # Legend in the top-left corner of the plot
+    legend_x = axes.left + 0.02 * (axes.right - axes.left)
+    legend_y = axes.top + 0.02 * (axes.bottom - axes.top)
+    body.append(f'<rect {_attrs(x=f"{legend_x:.1f}", y=f"{legend_y:.1f}", width=150, height=48, fill="white", fill_opacity=0.9, stroke=GRID_COLOR)}/>')
+    for row, (_, name, color, dash, shape) in enumerate(MATURITY_SERIES):
+        y = legend_y + 14 + row * 20
+        body.append(f'<line {_attrs(x1=f"{legend_x + 8:.1f}", x2=f"{legend_x + 38:.1f}", y1=f"{y:.1f}", y2=f"{y:.1f}", stroke=color, stroke_width=3, stroke_dasharray="5,4" if dash else None)}/>')
+        body.append(_marker(shape, legend_x + 23, y, color))
+        body.append(_text(legend_x + 46, y, name, fill='#333', font_size=12, dominant_baseline='central'))
+    return _svg(width, height, 'AI maturity: current level and 12-month target by building block', body)
+
+
+# Chart id (as in chart_data) -> renderer of its dataset
+RENDERERS = {
+    'initiatives': render_initiatives,
+    'maturity-scores': render_maturity_scores,
+}
+
+
+def render_key(chart_id, text):
+    """Cache key of a chart's render: chart id, dataset and renderer version"""
+    digest = hashlib.sha256(f"{chart_id}\0{RENDERER_VERSION}\0{text}".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def render_chart(chart_id, text, cache_dir=CHART_CACHE_DIR):
+    """SVG of a dataset's chart from the cache, rendering it on a miss
+
+    Returns (svg, cached)
+    """
+    cache_path = Path(cache_dir) / f"{chart_id}.{render_key(chart_id, text)}.svg"
+    if cache_path.exists():
+        return cache_path.read_text(encoding='utf-8'), True
+    svg = RENDERERS[chart_id](json.loads(text))
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+    tmp_path.write_text(svg, encoding='utf-8')
+    tmp_path.replace(cache_path)
+    return svg, False
+
+
+def drop_unused_libraries(soup):
+    """Remove chart library script tags that no inline script uses; returns their srcs
+
+    Slides that load other external scripts are left alone, since those may use the libraries
+    """
+    libraries = [script for script in soup.find_all('script', src=True)
+                 if any(marker in script['src'].lower() for marker in CHART_LIBRARIES)]
+    if len(libraries) < len(soup.find_all('script', src=True)):
+        return []
+    inline = '\n'.join(script.string or '' for script in soup.find_all('script', src=False))
+    dropped = []
+    for script in libraries:
+        src = script['src']
+        for marker, usage in CHART_LIBRARIES.items():
+            if marker in src.lower() and not usage.search(inline):
+                dropped.append(src)
+                script.decompose()
+                break
+    return dropped
+
+
+def prerender_charts(soup, cache_dir=CHART_CACHE_DIR):
+    """Inline the SVG of every renderable chart into its container
+
+    Returns (chart ids rendered, chart ids served from the cache)
+    """
+    from bs4 import BeautifulSoup
+
+    rendered, cached = [], []
+    for script in soup.find_all('script', id=lambda value: value and value.startswith(SCRIPT_ID_PREFIX)):
+        chart_id = script['id'][len(SCRIPT_ID_PREFIX):]
+        container = soup.find(id=script.get('data-chart'))
+        if chart_id not in RENDERERS or container is None:
+            continue
+        text = compact_json(json.loads(script.string or 'null'))
+        svg, hit = render_chart(chart_id, text, cache_dir)
+        container.clear()
+        container.append(BeautifulSoup(svg, 'html.parser'))
+        (cached if hit else rendered).append(chart_id)
+    return rendered, cached
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-render the chart datasets a build embeds to SVG")
+    parser.add_argument('--db', default=DB_PATH, help=f"Database path (default: {DB_PATH})")
+    parser.add_argument('--client', default=None,
+                        help="Render the charts with this client's weights and maturity profile (default: the house ones)")
+    parser.add_argument('--output-dir', default=None,
+                        help="Also copy each SVG here as <slide>.<chart id>.svg")
+    parser.add_argument('--cache-dir', default=str(CHART_CACHE_DIR),
+                        help=f"Render cache (default: {CHART_CACHE_DIR})")
+    args = parser.parse_args(argv)
+
+    # The same datasets the builder embeds, engine-generated charts included
+    datasets = build_datasets(args.db, load_initiative_scores(args.db, args.client),
+                              load_maturity(args.client, args.db))
+    if not datasets:
+        print(f"No chart data in {args.db}")
+        return
+    print("🖌️  Pre-rendering charts:")
+    for slide, charts in datasets.items():
+        for chart_id, text in charts.items():
+            if chart_id not in RENDERERS:
+                print(f"  ⏭️  {slide}/{chart_id}: no renderer")
+                continue
+            svg, hit = render_chart(chart_id, text, args.cache_dir)
+            if args.output_dir:
+                output_dir = Path(args.output_dir)
+                output_dir.mkdir(parents=True, exist_ok=True)
+                (output_dir / f"{slide}.{chart_id}.svg").write_text(svg, encoding='utf-8')
+            print(f"  ✅ {slide}/{chart_id}: {len(svg) / 1024:.1f} KB ({'cached' if hit else 'rendered'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Batch what-if runs of the financial model for many client decks
+Reads a CSV with one row per prospective client: a `client` column plus any
+financial_model inputs (blank cells keep the slide defaults). Every client
+is evaluated in one vectorized pass, and each client's inputs are stored as
+overrides in slides.db (client_inputs), with headline results in clients.
+`build_linked_presentation_v2.py --client <id>` then builds that client's
+deck: the ROI slide opens on the client's inputs, and the growth and
+cost-benefit slides are computed from them. `build` runs those builds for
+many clients in parallel
+
+CSV columns use the model's input names (rev_per_customer, operating_cost,
+...), with or without dashes, e.g.
+
+    client,rev_per_customer,customers_per_quarter,operating_cost
+    Acme Logistics,1500,2,2800
+    Northwind,800,,2100
+
+Usage:
+    python client_batch.py import clients.csv          # evaluate and store overrides
+    python client_batch.py list
+    python client_batch.py build --workers 8 --minify   # build every client deck
+    python client_batch.py build acme-logistics northwind
+"""
+
+import argparse
+import csv
+import io
+import math
+import os
+import re
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import numpy as np
+
+import financial_model
+from scenario_sweep import evaluate_scenarios
+
+DB_PATH = 'slides.db'
+
+# Client decks are built under clients/<client id>/
+CLIENTS_DIR = Path("clients")
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS clients (
+        client TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        npv REAL,
+        irr REAL,
+        payback_month INTEGER
+    );
+    CREATE TABLE IF NOT EXISTS client_inputs (
+        client TEXT NOT NULL,
+        input TEXT NOT NULL,
+        value REAL NOT NULL,
+        PRIMARY KEY (client, input)
+    );
+'''
+
+
+def client_id(name):
+    """Directory- and URL-safe id of a client name"""
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+
+def read_clients(lines):
+    """[(client id, name, {input: value})] from CSV lines
+
+    Raises ValueError naming the offending row for unknown columns, extra
+    fields, bad or out-of-range numbers, missing or duplicate clients
+    """
+    reader = csv.DictReader(lines)
+    columns = {column: column.strip().lower().replace('-', '_') for column in reader.fieldnames or []}
+    if 'client' not in columns.values():
+        raise ValueError("the CSV needs a 'client' column")
+    unknown = set(columns.values()) - set(financial_model.DEFAULT_INPUTS) - {'client'}
+    if unknown:
+        raise ValueError(f"unknown column(s): {', '.join(sorted(unknown))} "
+                         f"(model inputs are {', '.join(financial_model.DEFAULT_INPUTS)})")
+
+    clients = []
+    seen = set()
+    for line, row in enumerate(reader, start=2):
+        if None in row:
+            # DictReader files fields beyond the header under None
+            raise ValueError(f"row {line}: more fields than columns (quote values such as \"$2,000\")")
+        row = {columns[column]: (value or '').strip() for column, value in row.items() if column in columns}
+        name = row.pop('client')
+        if not name:
+            raise ValueError(f"row {line}: missing client name")
+        identifier = client_id(name)
+        if identifier in seen:
+            raise ValueError(f"row {line}: duplicate client {name!r}")
+        seen.add(identifier)
+        overrides = {}
+        for column, value in row.items():
+            if not value:
+                continue
+            try:
+                overrides[column] = float(value.replace(',', '').lstrip('$').rstrip('%'))
+            except ValueError:
+                raise ValueError(f"row {line}: {column} is not a number ({value!r})") from None
+            try:
+                financial_model.check_input(column, overrides[column])
+            except ValueError as e:
+                raise ValueError(f"row {line}: {e}") from None
+        clients.append((identifier, name, overrides))
+    return clients
+
+
+def evaluate_clients(clients):
+    """NPV, IRR and payback month of every client in one vectorized pass"""
+    scenarios = {
+        name: np.array([overrides.get(name, default) for _, _, overrides in clients], dtype=float)
+        for name, default in financial_model.DEFAULT_INPUTS.items()
+    }
+    return evaluate_scenarios(scenarios)
+
+
+def save_clients(db_path, clients, results):
+    """Replace the stored overrides and results of the given clients"""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(SCHEMA)
+        for i, (identifier, name, overrides) in enumerate(clients):
+            irr = float(results['irr'][i])
+            conn.execute('INSERT OR REPLACE INTO clients VALUES (?, ?, ?, ?, ?)',
+                         (identifier, name, float(results['npv'][i]), None if math.isnan(irr) else irr,
+                          int(results['payback_month'][i]) or None))
+            conn.execute('DELETE FROM client_inputs WHERE client = ?', (identifier,))
+            conn.executemany('INSERT INTO client_inputs VALUES (?, ?, ?)',
+                             [(identifier, input_name, value) for input_name, value in overrides.items()])
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _query(db_path, sql, params=()):
+    if not Path(db_path).exists():
+        return []
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(sql, params).fetchall()
+    except sqlite3.OperationalError:
+        return []
+    finally:
+        conn.close()
+
+
+def load_clients(db_path=DB_PATH):
+    """Stored clients as dicts, by id"""
+    rows = _query(db_path, 'SELECT client, name, npv, irr, payback_month FROM clients ORDER BY client')
+    return [dict(zip(('client', 'name', 'npv', 'irr', 'payback_month'), row)) for row in rows]
+
+
+def load_client_inputs(client, db_path=DB_PATH):
+    """A client's model input overrides, or None for unknown clients"""
+    if not _query(db_path, 'SELECT 1 FROM clients WHERE client = ?', (client,)):
+        return None
+    inputs = dict(_query(db_path, 'SELECT input, value FROM client_inputs WHERE client = ?', (client,)))
+    if 'npv_years' in inputs:
+        inputs['npv_years'] = int(inputs['npv_years'])
+    return inputs
+
+
+def _build_client(client, build_args, db_path=DB_PATH):
+    """Worker entry point: build one client's deck quietly; returns (client, output dir, seconds)"""
+    import build_linked_presentation_v2 as builder
+
+    started = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        output_dir = builder.main(['--client', client, '--db', str(db_path)] + build_args)
+    return client, output_dir, time.perf_counter() - started
+
+
+def build_clients(clients, build_args=(), workers=None, db_path=DB_PATH):
+    """Build each client's deck from db_path, in parallel worker processes
+
+    Yields (client, output dir, seconds) as builds finish
+    """
+    build_args = list(build_args)
+    if len(clients) == 1 or workers == 1:
+        for client in clients:
+            yield _build_client(client, build_args, db_path)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_build_client, client, build_args, db_path) for client in clients]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _money(value):
+    if value is None:
+        return "N/A"
+    return f"-${-value:,.0f}" if value < 0 else f"${value:,.0f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate the financial model for many clients and build their decks")
+    parser.add_argument('--db', default=DB_PATH, help=f"Database path (default: {DB_PATH})")
+    commands = parser.add_subparsers(dest='command', required=True)
+    import_parser = commands.add_parser('import', help="Evaluate a CSV of client inputs and store them as overrides")
+    import_parser.add_argument('csv', help="CSV file ('-' for stdin)")
+    commands.add_parser('list', help="List stored clients with their headline results")
+    build = commands.add_parser('build', help="Build client decks (all stored clients by default)")
+    build.add_argument('clients', nargs='*', help="Client ids")
+    build.add_argument('--workers', type=int, default=None, help="Parallel builds (default: CPU count)")
+    build.add_argument('--minify', action='store_true', help="Pass --minify to the builder")
+    build.add_argument('--offline', action='store_true', help="Pass --offline to the builder")
+    args = parser.parse_args(argv)
+
+    if not Path(args.db).exists():
+        print(f"❌ Error: {args.db} not found!")
+        sys.exit(1)
+
+    if args.command == 'import':
+        try:
+            if args.csv == '-':
+                clients = read_clients(sys.stdin)
+            else:
+                with open(args.csv, 'r', encoding='utf-8-sig', newline='') as f:
+                    clients = read_clients(f)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error reading {args.csv}: {e}")
+            sys.exit(1)
+        if not clients:
+            print(f"No clients in {args.csv}")
+            return
+        started = time.perf_counter()
+        results = evaluate_clients(clients)
+        elapsed = time.perf_counter() - started
+        save_clients(args.db, clients, results)
+        print(f"📊 Evaluated {len(clients):,} client(s) in {elapsed * 1000:.0f} ms and stored their overrides")
+        positive = int((results['npv'] > 0).sum())
+        print(f"  NPV positive for {positive:,} of {len(clients):,}")
+        print("  Build their decks with `python client_batch.py build`")
+    elif args.command == 'list':
+        clients = load_clients(args.db)
+        if not clients:
+            print("No clients yet; run `python client_batch.py import clients.csv`")
+            return
+        print(f"👥 Clients in {args.db}:")
+        print(f"  {'Client':<30} {'NPV':>14} {'IRR':>8} {'Payback':>9}")
+        for client in clients:
+            irr = f"{client['irr']:.1%}" if client['irr'] is not None else 'N/A'
+            payback = f"Month {client['payback_month']}" if client['payback_month'] else 'never'
+            print(f"  {client['client']:<30} {_money(client['npv']):>14} {irr:>8} {payback:>9}")
+    else:
+        known = {client['client'] for client in load_clients(args.db)}
+        clients = args.clients or sorted(known)
+        missing = [client for client in clients if client not in known]
+        if missing:
+            print(f"❌ Unknown client(s): {', '.join(missing)}")
+            sys.exit(1)
+        if not clients:
+            print("No clients yet; run `python client_batch.py import clients.csv`")
+            return
+        build_args = [flag for flag, enabled in (('--minify', args.minify), ('--offline', args.offline)) if enabled]
+        workers = args.workers or min(len(clients), os.cpu_count() or 1)
+        print(f"🚀 Building {len(clients):,} client deck(s) with {workers} worker(s)")
+        started = time.perf_counter()
+        for client, output_dir, seconds in build_clients(clients, build_args, workers, args.db):
+            print(f"  ✅ {client:<30} {seconds:5.1f}s  {output_dir}/")
+        print(f"✨ Built {len(clients):,} deck(s) in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
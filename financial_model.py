@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+"""
+Financial model behind the ROI slide (slide_18_roi_analysis.html)
+Reproduces the slide's JavaScript model with NumPy arrays: the monthly
+customer schedule and cash flows, annual cash flows, cumulative NPV, IRR and
+payback month. The builder precomputes the slide's figures from its default
+inputs and embeds them, and analysts can run the model from the command line
+
+Every input may be a scalar or an array of scenarios (npv_years excepted,
+since it sets the length of the cash-flow arrays); results then carry the
+same leading shape
+
+Usage:
+    python financial_model.py
+    python financial_model.py --rev-per-customer 1500 --customers-per-quarter 2
+    python financial_model.py --json
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+
+import growth_projection
+
+# The slide's input defaults; rates are percentages as typed on the slide
+DEFAULT_INPUTS = {
+    'discount_rate': 10.0,
+    'npv_years': 5,
+    'initial_investment': 110400.0,
+    'rev_per_customer': 1000.0,
+    'customers_per_quarter': 1.0,
+    'operating_cost': 2440.0,
+    'op_cost_growth': 5.0,
+    'launch_delay': 0,  # months before the first customer; not on the slide
+    'monthly_churn': 0.0,  # % of each cohort lost per month; not on the slide
+    'ramp_months': 0,  # months for cohorts to reach full size; not on the slide
+}
+
+# Range each input may take, as (lowest, highest); None leaves that side
+# open. npv_years stops at the growth projection's horizon, as on the slide
+INPUT_BOUNDS = {
+    'discount_rate': (0.0, 100.0),
+    'npv_years': (1, growth_projection.PROJECTION_YEARS),
+    'initial_investment': (0.0, None),
+    'rev_per_customer': (0.0, None),
+    'customers_per_quarter': (0.0, None),
+    'operating_cost': (0.0, None),
+    'op_cost_growth': (-100.0, 100.0),
+    'launch_delay': (0.0, growth_projection.PROJECTION_YEARS * 12),
+    'monthly_churn': (0.0, 100.0),
+    'ramp_months': (0.0, growth_projection.PROJECTION_YEARS * 12),
+}
+
+# Model input -> id of its <input> on the ROI slide
+INPUT_IDS = {
+    'discount_rate': 'discountRate',
+    'npv_years': 'npvYears',
+    'initial_investment': 'initialInvestment',
+    'rev_per_customer': 'revPerCustomer',
+    'customers_per_quarter': 'customersPerQuarter',
+    'operating_cost': 'operatingCost',
+    'op_cost_growth': 'opCostGrowth',
+}
+
+# Id of the JSON results the builder embeds in the ROI slide
+RESULTS_ID = 'roi-model-results'
+
+# Sweeps and simulations over a set of inputs, cached by a hash of their
+# parameters so repeated and parallel (client) builds compute each only once
+ANALYSIS_CACHE_DIR = Path(".analysis_cache")
+
+_analyses = {}
+
+IRR_TOLERANCE = 1e-10
+IRR_MAX_ITERATIONS = 100
+IRR_LOWER_BOUND = -0.9999
+IRR_UPPER_LIMIT = 1e6
+
+
+def check_input(name, value):
+    """Raise ValueError unless a scalar input lies within its INPUT_BOUNDS"""
+    low, high = INPUT_BOUNDS[name]
+    if name == 'npv_years' and value != int(value):
+        raise ValueError("npv_years must be a whole number")
+    if not math.isfinite(value) or (low is not None and value < low) or (high is not None and value > high):
+        if high is None:
+            raise ValueError(f"{name} must be at least {low:g}")
+        raise ValueError(f"{name} must be between {low:g} and {high:g}")
+
+
+def model_inputs(**overrides):
+    """DEFAULT_INPUTS with overrides applied, rejecting unknown names and
+    out-of-range years"""
+    unknown = set(overrides) - set(DEFAULT_INPUTS)
+    if unknown:
+        raise ValueError(f"Unknown model input(s): {', '.join(sorted(unknown))}")
+    inputs = dict(DEFAULT_INPUTS, **overrides)
+    check_input('npv_years', int(inputs['npv_years']))
+    return inputs
+
+
+def _plain(value):
+    """Numbers as floats (so 5 and 5.0 years hash alike), containers as lists and dicts"""
+    if isinstance(value, dict):
+        return {str(k): _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_plain(v) for v in value]
+    if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def inputs_key(name, **params):
+    """Hash of an analysis name and its parameters (model inputs, sample
+    counts, seeds, distributions)"""
+    text = json.dumps([name, _plain(params)], sort_keys=True)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def cached_analysis(name, compute, cache_dir=ANALYSIS_CACHE_DIR, **params):
+    """compute() once per analysis name and parameter hash
+
+    Results (JSON-ready) are kept in memory and in cache_dir, so builds in
+    other processes and later builds reuse them
+    """
+    key = inputs_key(name, **params)
+    if key in _analyses:
+        return _analyses[key]
+    cache_path = Path(cache_dir) / f"{name}.{key}.json"
+    if cache_path.exists():
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            result = json.load(f)
+    else:
+        result = compute()
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+        tmp_path.write_text(json.dumps(result, separators=(',', ':')), encoding='utf-8')
+        tmp_path.replace(cache_path)
+    _analyses[key] = result
+    return result
+
+
+def _param(value):
+    """Scenario array with a trailing axis for broadcasting over months"""
+    return np.asarray(value, dtype=float)[..., None]
+
+
+def customer_schedule(customers_per_quarter, months, launch_delay=0, monthly_churn=0.0, ramp_months=0):
+    """Customers in months 1..months, from the shared growth projection
+
+    The slide adds customers_per_quarter at the start of every third month
+    after its three-month development offset, so without churn or ramp
+    month m has ceil(m / 3) cohorts; a launch delay of d months shifts the
+    schedule by d
+    """
+    return growth_projection.customer_schedule(customers_per_quarter, months, launch_delay, monthly_churn,
+                                               ramp_months)
+
+
+def monthly_cash_flows(inputs):
+    """Monthly customers, revenue, cost and net cash flow
+
+    Index 0 is the initial investment; months 1..npv_years * 12 follow
+    """
+    months = int(inputs['npv_years']) * 12
+    batch = np.broadcast_shapes(*(np.shape(value) for name, value in inputs.items() if name != 'npv_years'))
+    shape = batch + (months,)
+
+    customers = np.broadcast_to(customer_schedule(inputs['customers_per_quarter'], months, inputs['launch_delay'],
+                                                  inputs['monthly_churn'], inputs['ramp_months']), shape)
+    revenue = customers * _param(inputs['rev_per_customer'])
+    # Operating cost grows once a year
+    year_index = np.arange(months) // 12
+    cost = np.broadcast_to(
+        _param(inputs['operating_cost']) * (1 + _param(inputs['op_cost_growth']) / 100) ** year_index, shape)
+
+    zeros = np.zeros(batch + (1,))
+    initial = np.broadcast_to(_param(inputs['initial_investment']), batch + (1,))
+    revenue = np.concatenate([zeros, revenue], axis=-1)
+    cost = np.concatenate([initial, cost], axis=-1)
+    return {
+        'customers': np.concatenate([zeros, customers], axis=-1),
+        'revenue': revenue,
+        'cost': cost,
+        'net': revenue - cost,
+    }
+
+
+def annual_totals(monthly):
+    """Sum months 1..n into years; year 0 holds month 0 (the investment)"""
+    shape = monthly.shape[:-1] + (-1, 12)
+    return np.concatenate([monthly[..., :1], monthly[..., 1:].reshape(shape).sum(axis=-1)], axis=-1)
+
+
+def cumulative_npv(cash_flows, rate):
+    """Running NPV of periodic cash flows at a per-period rate, in one pass"""
+    periods = np.arange(cash_flows.shape[-1])
+    return np.cumsum(cash_flows * (1 + _param(rate)) ** -periods, axis=-1)
+
+
+def _npv_and_slope(cash_flows, rate):
+    periods = np.arange(cash_flows.shape[-1])
+    growth = (1 + rate[..., None]) ** -periods
+    npv = (cash_flows * growth).sum(axis=-1)
+    slope = (-periods * cash_flows * growth / (1 + rate[..., None])).sum(axis=-1)
+    return npv, slope
+
+
+def irr(cash_flows):
+    """Internal rate of return of periodic cash flows (NaN when there is none)
+
+    A safeguarded Newton iteration: Newton steps from 10% (the slide's
+    starting guess) inside a bracket around a sign change of the NPV, with a
+    bisection step whenever Newton would leave the bracket
+    """
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    batch = cash_flows.shape[:-1]
+    low = np.full(batch, IRR_LOWER_BOUND)
+    high = np.ones(batch)
+    npv_low, _ = _npv_and_slope(cash_flows, low)
+    npv_high, _ = _npv_and_slope(cash_flows, high)
+
+    # Widen the bracket until the NPV changes sign
+    unbracketed = np.sign(npv_low) == np.sign(npv_high)
+    while unbracketed.any() and (high[unbracketed] < IRR_UPPER_LIMIT).any():
+        high = np.where(unbracketed, high * 4, high)
+        npv_high, _ = _npv_and_slope(cash_flows, high)
+        unbracketed = np.sign(npv_low) == np.sign(npv_high)
+
+    rate = np.clip(np.full(batch, 0.1), low, high)
+    falling = npv_low > 0  # NPV decreases through the root
+    # Converged rates are frozen, so a result never depends on its batch
+    converged = unbracketed.copy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(IRR_MAX_ITERATIONS):
+            npv, slope = _npv_and_slope(cash_flows, rate)
+            above = (npv > 0) == falling
+            low = np.where(above, rate, low)
+            high = np.where(above, high, rate)
+
+            newton = rate - npv / slope
+            inside = np.isfinite(newton) & (newton > low) & (newton < high)
+            next_rate = np.where(inside, newton, (low + high) / 2)
+            step_converged = np.abs(next_rate - rate) <= IRR_TOLERANCE * (1 + np.abs(rate))
+            rate = np.where(converged, rate, next_rate)
+            converged |= step_converged
+            if converged.all():
+                break
+
+    return np.where(unbracketed, np.nan, rate)
+
+
+def payback_month(net):
+    """First month whose cumulative cash flow is positive (0 when never)"""
+    positive = np.cumsum(net, axis=-1) > 0
+    return np.where(positive.any(axis=-1), positive.argmax(axis=-1), 0)
+
+
+def evaluate(inputs):
+    """Run the model over scalar or array inputs"""
+    monthly = monthly_cash_flows(inputs)
+    annual_cash_flows = annual_totals(monthly['net'])
+    annual_revenues = annual_totals(monthly['revenue'])
+    npv_curve = cumulative_npv(annual_cash_flows, np.asarray(inputs['discount_rate'], dtype=float) / 100)
+    return {
+        'monthly': monthly,
+        'annual_cash_flows': annual_cash_flows,
+        'annual_revenues': annual_revenues,
+        'cumulative_npv': npv_curve,
+        'npv': npv_curve[..., -1],
+        'irr': irr(annual_cash_flows),
+        'payback_month': payback_month(monthly['net']),
+    }
+
+
+def run_model(**overrides):
+    """Model results for one set of inputs, as plain JSON-ready values
+
+    'yearly' uses the field names of the slide's chart data
+    """
+    inputs = model_inputs(**overrides)
+    results = evaluate(inputs)
+    irr_value = float(results['irr'])
+    month = int(results['payback_month'])
+    return {
+        'inputs': inputs,
+        'npv': float(results['npv']),
+        'irr': None if math.isnan(irr_value) else irr_value,
+        'payback_month': month or None,
+        'payback_years': math.ceil(month / 12) if month else None,
+        'yearly': [
+            {
+                'year': year,
+                'cashFlow': float(cash_flow),
+                'revenue': float(revenue),
+                'cumulativeNPV': float(npv),
+            }
+            for year, (cash_flow, revenue, npv) in enumerate(zip(
+                results['annual_cash_flows'], results['annual_revenues'], results['cumulative_npv']))
+        ],
+    }
+
+
+def _round(value):
+    """Round half up, like JavaScript's Math.round"""
+    return math.floor(value + 0.5)
+
+
+def _number(value):
+    """Format like JavaScript's toLocaleString() in en-US"""
+    return f"{value:,}" if value != int(value) else f"{int(value):,}"
+
+
+def display_values(results):
+    """Text of the slide's result elements, formatted as updateAnalysis() does"""
+    npv = '$' + _number(_round(results['npv']))
+    irr_text = f"{results['irr'] * 100:.1f}%" if results['irr'] is not None else 'N/A'
+    years = results['payback_years']
+    return {
+        'subtitle-payback': f"{years} {'Year' if years == 1 else 'Years'}" if years else 'N/A',
+        'subtitle-npv': npv,
+        'subtitle-years': str(results['inputs']['npv_years']),
+        'subtitle-irr': irr_text,
+        'initial-investment-display': '-$' + _number(results['inputs']['initial_investment']),
+        'irr-value': irr_text,
+        'payback-period': f"Month {results['payback_month']}" if results['payback_month'] else 'N/A',
+        'total-npv': npv,
+    }
+
+
+def _thousands(value):
+    """Whole thousands of dollars, e.g. -$110k"""
+    thousands = _round(value / 1000)
+    return f"-${-thousands:,}k" if thousands < 0 else f"${thousands:,}k"
+
+
+def cost_benefit_values(results):
+    """Text of the cost-benefit slide's figures, from the model results and
+    the growth projection behind them"""
+    inputs = results['inputs']
+    values = display_values(results)
+    customers = growth_projection.year_end_customers(inputs)
+    yearly = results['yearly']
+
+    # Operating break even: enough customers to cover the first year's monthly cost
+    break_even = math.ceil(inputs['operating_cost'] / inputs['rev_per_customer'] - 1e-9)
+    break_even_year = next((year for year, count in enumerate(customers) if year and count >= break_even), None)
+    cash_positive_year = next((row['year'] for row in yearly if row['year'] and row['cashFlow'] > 0), None)
+    npv_positive_year = next((row['year'] for row in yearly if row['cumulativeNPV'] > 0), None)
+    count = growth_projection.format_count
+
+    return {
+        'cb-payback-years': values['subtitle-payback'],
+        'cb-npv': values['total-npv'],
+        'cb-npv-years': values['subtitle-years'],
+        'cb-irr': values['irr-value'],
+        'cb-break-even-customers': (f"{break_even} Customers (year {break_even_year})" if break_even_year
+                                    else f"{break_even} Customers"),
+        'cb-growth-by-year': ' | '.join(f"Y{row['year']}: {count(customers[row['year']])} ({_thousands(row['revenue'])})"
+                                        for row in yearly[1:]),
+        'cb-growth-multiple': (f"{count(customers[-1] / customers[1])}x Growth" if len(customers) > 1 and customers[1]
+                               else 'N/A'),
+        'cb-npv-by-year': ' | '.join(f"Y{row['year']}: {_thousands(row['cumulativeNPV'])}" for row in yearly[1:]),
+        'cb-npv-summary': f"{values['total-npv']} | IRR {values['irr-value']}",
+        'cb-break-even': ' | '.join([
+            f"Cash flow positive Year {cash_positive_year}" if cash_positive_year else "Cash flow never positive",
+            f"NPV positive Year {npv_positive_year}" if npv_positive_year else "NPV not positive",
+            values['payback-period'].replace('Month', 'Payback Month') if results['payback_month'] else "No payback",
+        ]),
+        'cb-payback-month': values['payback-period'],
+    }
+
+
+def embed_cost_benefit(soup, inputs=None):
+    """Fill the cost-benefit slide's figures from the model
+
+    Returns the results, or None for slides without those figures
+    """
+    if soup.find(id='cb-growth-by-year') is None:
+        return None
+    results = run_model(**(inputs or {}))
+    for element_id, text in cost_benefit_values(results).items():
+        element = soup.find(id=element_id)
+        if element is not None:
+            element.string = text
+    return results
+
+
+def slide_inputs(soup):
+    """Model inputs from the default values of the ROI slide's input fields
+
+    Returns None when the slide has no ROI inputs
+    """
+    inputs = {}
+    for name, input_id in INPUT_IDS.items():
+        field = soup.find('input', id=input_id)
+        if field is None:
+            return None
+        try:
+            inputs[name] = int(field.get('value')) if name == 'npv_years' else float(field.get('value'))
+        except (TypeError, ValueError):
+            inputs[name] = DEFAULT_INPUTS[name]
+    return inputs
+
+
+def apply_slide_inputs(soup, inputs):
+    """Set the ROI slide's input fields to the given model inputs, so the
+    slide opens on them (e.g. a client's figures)"""
+    for name, input_id in INPUT_IDS.items():
+        field = soup.find('input', id=input_id)
+        if field is not None and name in inputs:
+            field['value'] = str(int(inputs[name])) if name == 'npv_years' else f"{float(inputs[name]):g}"
+
+
+def embed_results(soup, base=None):
+    """Fill the ROI slide's figures from the model and embed its chart data
+
+    The slide's input values override base (model inputs not on the slide,
+    such as churn). The slide draws its first chart from the embedded
+    results instead of rerunning the model on load. Returns the results, or
+    None for slides without ROI inputs
+    """
+    inputs = slide_inputs(soup)
+    if inputs is None:
+        return None
+    results = run_model(**dict(base or {}, **inputs))
+
+    for element_id, text in display_values(results).items():
+        element = soup.find(id=element_id)
+        if element is not None:
+            element.string = text
+
+    script = soup.find('script', id=RESULTS_ID)
+    if script is None:
+        script = soup.new_tag('script', id=RESULTS_ID, type='application/json')
+        (soup.body or soup).append(script)
+    script.string = json.dumps(results, separators=(',', ':')).replace('</', '<\\/')
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the ROI slide's financial model")
+    for name, default in DEFAULT_INPUTS.items():
+        parser.add_argument('--' + name.replace('_', '-'), type=type(default), default=default,
+                            help=f"(default: {default:g})")
+    parser.add_argument('--json', action='store_true', help="Print the full results as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        results = run_model(**{name: getattr(args, name) for name in DEFAULT_INPUTS})
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    values = display_values(results)
+    print(f"📈 ROI model ({results['inputs']['npv_years']} years, "
+          f"{results['inputs']['discount_rate']:g}% discount rate)")
+    print(f"  Cumulative NPV: {values['total-npv']}")
+    print(f"  IRR:            {values['irr-value']}")
+    print(f"  Payback:        {values['payback-period']} ({values['subtitle-payback']})")
+    print(f"\n  {'Year':>4}  {'Revenue':>12}  {'Cash Flow':>12}  {'Cumulative NPV':>15}")
+    for row in results['yearly']:
+        print(f"  {row['year']:>4}  {row['revenue']:>12,.0f}  {row['cashFlow']:>12,.0f}  {row['cumulativeNPV']:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Customer growth projection shared by the growth, cost-benefit and ROI slides
+Customers arrive in quarterly cohorts from the first month after launch; each
+cohort then loses a fixed share of its customers every month (churn), and an
+optional sales ramp scales the cohorts that arrive during the first months.
+The projection is computed once per parameter set for one customer per cohort
+and cached by a hash of its parameters; callers scale it by the real cohort
+size and shift it by any launch delay, so the growth table, the cost-benefit
+figures and financial_model (and through it the ROI slide, its lookup tables,
+the sweeps and the risk simulation) all use the same schedule
+
+With no churn and no ramp (the defaults) month m has ceil(m / 3) cohorts,
+the schedule the slides have always assumed
+
+Usage:
+    python growth_projection.py
+    python growth_projection.py --monthly-churn 1.5 --ramp-months 6
+"""
+
+import argparse
+import hashlib
+import json
+import math
+
+import numpy as np
+
+COHORT_INTERVAL = 3  # months between cohorts (one cohort a quarter)
+
+GROWTH_DEFAULTS = {
+    'monthly_churn': 0.0,  # percent of each cohort lost per month
+    'ramp_months': 0,      # cohorts reach full size over this many months (0: no ramp)
+}
+
+# Each consultant looks after this many customers (slide 16's key assumption)
+CUSTOMERS_PER_CONSULTANT = 2
+
+# Id of the unit projection embedded in the ROI slide, and of the growth table body
+PROJECTION_ID = 'growth-projection'
+TABLE_BODY_ID = 'customerTableBody'
+
+# Longest horizon the ROI slide's Years input allows
+PROJECTION_YEARS = 10
+
+_projections = {}
+
+
+def projection_key(months, monthly_churn=0.0, ramp_months=0):
+    """Hash of the parameters that determine a unit projection"""
+    params = {'months': int(months), 'monthly_churn': float(monthly_churn), 'ramp_months': float(ramp_months),
+              'cohort_interval': COHORT_INTERVAL}
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+def unit_projection(months, monthly_churn=0.0, ramp_months=0):
+    """Monthly arrays for one customer per cohort and no launch delay
+
+    Index 0 is launch (no customers); months 1..months follow. Cached by
+    projection_key, and returned read-only since callers share them
+    """
+    monthly_churn, ramp_months = float(monthly_churn), float(ramp_months)
+    if not 0 <= monthly_churn <= 100:
+        raise ValueError("monthly_churn must be between 0 and 100")
+    if ramp_months < 0:
+        raise ValueError("ramp_months must not be negative")
+
+    key = projection_key(months, monthly_churn, ramp_months)
+    projection = _projections.get(key)
+    if projection is not None:
+        return projection
+
+    arrivals = np.arange(1, months + 1, COHORT_INTERVAL)
+    sizes = np.minimum(1.0, arrivals / ramp_months) if ramp_months else np.ones(len(arrivals))
+    ages = np.arange(months + 1)[None, :] - arrivals[:, None]
+    survival = np.where(ages >= 0, (1 - monthly_churn / 100) ** np.maximum(ages, 0), 0.0)
+    active = sizes @ survival
+    new = np.zeros(months + 1)
+    new[arrivals] = sizes
+    active.flags.writeable = new.flags.writeable = False
+    projection = {'key': key, 'active': active, 'new': new}
+    _projections[key] = projection
+    return projection
+
+
+def customer_schedule(customers_per_quarter, months, launch_delay=0, monthly_churn=0.0, ramp_months=0):
+    """Customers in months 1..months
+
+    Every argument but months may be an array of scenarios; the unit
+    projection is shifted by the delay and scaled by the cohort size
+    """
+    churn, ramp = np.broadcast_arrays(np.asarray(monthly_churn, dtype=float), np.asarray(ramp_months, dtype=float))
+    index = np.clip(np.arange(1, months + 1) - np.asarray(launch_delay, dtype=float)[..., None], 0, months).astype(int)
+    if churn.ndim == 0:
+        active = unit_projection(months, churn, ramp)['active'][index]
+    else:
+        # One cached projection per distinct churn and ramp pair
+        shape = np.broadcast_shapes(churn.shape, index.shape[:-1])
+        churn, ramp = np.broadcast_to(churn, shape), np.broadcast_to(ramp, shape)
+        index = np.broadcast_to(index, shape + (months,))
+        active = np.empty(index.shape)
+        for pair in np.unique(np.stack([churn.ravel(), ramp.ravel()], axis=-1), axis=0):
+            rows = (churn == pair[0]) & (ramp == pair[1])
+            active[rows] = unit_projection(months, *pair)['active'][index[rows]]
+    return np.asarray(customers_per_quarter, dtype=float)[..., None] * active
+
+
+def year_end_customers(inputs):
+    """Customers at the end of years 0..npv_years for scalar model inputs"""
+    years = int(inputs['npv_years'])
+    schedule = customer_schedule(inputs['customers_per_quarter'], years * 12, inputs['launch_delay'],
+                                 inputs.get('monthly_churn', 0.0), inputs.get('ramp_months', 0))
+    return np.concatenate([[0], schedule[11::12]])
+
+
+def format_count(value):
+    """Whole customers without decimals, fractional ones with one"""
+    return f"{value:,.0f}" if abs(value - round(value)) < 1e-9 else f"{value:,.1f}"
+
+
+def growth_rows(inputs):
+    """Rows of the growth table: end-of-year customers, net additions,
+    growth rate and annual revenue run rate"""
+    customers = year_end_customers(inputs)
+    fee = float(inputs['rev_per_customer'])
+    rows = []
+    for year, count in enumerate(customers):
+        previous = customers[year - 1] if year else 0
+        growth = (count - previous) / previous if previous > 0 else None
+        rows.append({
+            'year': year,
+            'customers': float(count),
+            'added': float(count - previous),
+            'growth': growth,
+            'monthly_revenue': fee,
+            'annual_revenue': float(count * fee * 12),
+        })
+    return rows
+
+
+def growth_text(growth):
+    return 'N/A' if growth is None else f"{growth:.0%}"
+
+
+def growth_class(growth):
+    if growth is None:
+        return 'growth-rate'
+    if growth >= 0.75:
+        return 'growth-rate high'
+    if growth >= 0.4:
+        return 'growth-rate moderate'
+    return 'growth-rate low'
+
+
+def embed_growth_table(soup, inputs):
+    """Fill the growth slide's table and the figures quoted around it
+
+    Returns the rows, or None for slides without the table
+    """
+    from bs4 import BeautifulSoup
+
+    tbody = soup.find(id=TABLE_BODY_ID)
+    if tbody is None:
+        return None
+    rows = growth_rows(inputs)
+    markup = ''.join(
+        f'<tr><td><strong>Year {row["year"]}</strong></td>'
+        f'<td>{format_count(row["customers"])}</td>'
+        f'<td>{format_count(row["added"])}</td>'
+        f'<td class="{growth_class(row["growth"])}">{growth_text(row["growth"])}</td>'
+        f'<td>${row["monthly_revenue"]:,.0f}</td>'
+        f'<td>${row["annual_revenue"]:,.0f}</td></tr>'
+        for row in rows)
+    tbody.clear()
+    tbody.append(BeautifulSoup(markup, 'html.parser'))
+
+    first, last = rows[1]['customers'] if len(rows) > 1 else 0, rows[-1]['customers']
+    figures = {
+        'growth-multiple': f"{format_count(last / first)}x" if first else 'N/A',
+        'consultants-needed': str(math.ceil(last / CUSTOMERS_PER_CONSULTANT - 1e-9)),
+        'growth-years': str(rows[-1]['year']),
+        'growth-title-years': str(rows[-1]['year']),
+    }
+    for element_id, text in figures.items():
+        element = soup.find(id=element_id)
+        if element is not None:
+            element.string = text
+    return rows
+
+
+def embed_projection(soup, inputs):
+    """Embed the unit projection the ROI slide's live model scales by its
+    own customers-per-quarter input
+
+    Returns the projection key, or None for slides without ROI inputs
+    """
+    if soup.find('input', id='customersPerQuarter') is None:
+        return None
+    projection = unit_projection(PROJECTION_YEARS * 12, inputs.get('monthly_churn', 0.0), inputs.get('ramp_months', 0))
+    script = soup.find('script', id=PROJECTION_ID)
+    if script is None:
+        script = soup.new_tag('script', id=PROJECTION_ID, type='application/json')
+        (soup.body or soup).append(script)
+    script['data-hash'] = projection['key']
+    script.string = json.dumps({'launchDelay': int(inputs['launch_delay']),
+                                'active': [round(value, 6) for value in projection['active'].tolist()]},
+                               separators=(',', ':'))
+    return projection['key']
+
+
+def main(argv=None):
+    import financial_model
+
+    parser = argparse.ArgumentParser(description="Project customers from quarterly cohorts with churn and ramp")
+    parser.add_argument('--customers-per-quarter', type=float, default=financial_model.DEFAULT_INPUTS['customers_per_quarter'])
+    parser.add_argument('--years', type=int, default=financial_model.DEFAULT_INPUTS['npv_years'])
+    parser.add_argument('--launch-delay', type=int, default=0, help="Months before the first cohort (default: 0)")
+    parser.add_argument('--monthly-churn', type=float, default=GROWTH_DEFAULTS['monthly_churn'],
+                        help="Percent of each cohort lost per month (default: 0)")
+    parser.add_argument('--ramp-months', type=float, default=GROWTH_DEFAULTS['ramp_months'],
+                        help="Months for cohorts to reach full size (default: 0, no ramp)")
+    args = parser.parse_args(argv)
+
+    try:
+        inputs = financial_model.model_inputs(
+            customers_per_quarter=args.customers_per_quarter, npv_years=args.years, launch_delay=args.launch_delay,
+            monthly_churn=args.monthly_churn, ramp_months=args.ramp_months)
+        rows = growth_rows(inputs)
+    except ValueError as e:
+        parser.error(str(e))
+
+    key = projection_key(args.years * 12, args.monthly_churn, args.ramp_months)
+    print(f"👥 Customer growth ({args.customers_per_quarter:g} per quarter, {args.monthly_churn:g}% monthly churn, "
+          f"{args.ramp_months:g}-month ramp) [{key}]")
+    print(f"\n  {'Year':>4}  {'Customers':>9}  {'Added':>7}  {'Growth':>7}  {'Annual Run Rate':>15}")
+    for row in rows:
+        print(f"  {row['year']:>4}  {format_count(row['customers']):>9}  {format_count(row['added']):>7}  {growth_text(row['growth']):>7}  "
+              f"{'$' + format(row['annual_revenue'], ',.0f'):>15}")
+
+
+if __name__ == "__main__":
+    main()
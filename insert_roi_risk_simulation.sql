@@ -0,0 +1,11 @@
+-- Add the ROI risk simulation slide (percentile bands filled in at build time by monte_carlo.py)
+
+BEGIN TRANSACTION;
+
+INSERT INTO slides (num, name, source, title, agenda_section)
+VALUES ('35', 'slide_35_roi_risk_simulation', 'slide_35_roi_risk_simulation.html', 'ROI Risk Simulation', 'Financial Analysis');
+
+COMMIT;
+
+-- Verify the result
+SELECT num, name, title, agenda_section FROM slides WHERE agenda_section = 'Financial Analysis' ORDER BY CAST(num AS INTEGER);
@@ -0,0 +1,11 @@
+-- Add the ROI sensitivity slide (data filled in at build time by scenario_sweep.py)
+
+BEGIN TRANSACTION;
+
+INSERT INTO slides (num, name, source, title, agenda_section)
+VALUES ('34', 'slide_34_roi_sensitivity', 'slide_34_roi_sensitivity.html', 'ROI Sensitivity', 'Financial Analysis');
+
+COMMIT;
+
+-- Verify the result
+SELECT num, name, title, agenda_section FROM slides WHERE agenda_section = 'Financial Analysis' ORDER BY CAST(num AS INTEGER);
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+AI maturity assessments kept in slides.db
+The maturity levels, the dimensions (building blocks) and every profile's
+current and 12-month target score per dimension live in slides.db. Gap
+analysis (averages, status, strongest and weakest dimensions, focus areas)
+is computed with NumPy for all profiles at once, and the builder generates
+the assessment slide's chart dataset and insight cards from the house
+profile, or from a client's profile for `--client` builds
+
+The chart is drawn by chart_prerender, whose renders are cached by dataset
+hash, so assessing and rendering dozens of profiles is one batch run
+
+Usage:
+    python maturity_assessment.py                                  # list profiles
+    python maturity_assessment.py show acme-logistics              # gap analysis
+    python maturity_assessment.py import maturity.csv              # store client profiles
+    python maturity_assessment.py set acme-logistics Governance 2 3.5
+    python maturity_assessment.py render --output-dir maturity/    # SVGs + gap_analysis.csv
+    python maturity_assessment.py seed                             # house profile from the slide
+"""
+
+import argparse
+import csv
+import html
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from chart_data import SCRIPT_ID_PREFIX, compact_json
+
+DB_PATH = 'slides.db'
+SLIDES_DIR = Path("slides_complete")
+
+# The deck's own assessment; clients' profiles use their client_batch ids
+HOUSE_PROFILE = 'vmg'
+
+# The assessment slide and its chart dataset
+ASSESSMENT_SLIDE = 'slide_12_assessment_graph'
+ASSESSMENT_CHART_ID = 'maturity-scores'
+
+# Used by `seed`: level names, lowest first (level 1 = Aware)
+SEED_LEVELS = ['Aware', 'Reactive', 'Proactive', 'Managed', 'Optimizing']
+
+# Overall status by current average: (upper bound, label)
+STATUSES = [(2.5, 'At Risk'), (3.5, 'Developing'), (float('inf'), 'Established')]
+
+# Dimensions named on each insight card
+STRENGTH_COUNT = 2
+GAP_COUNT = 2
+FOCUS_COUNT = 3
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS maturity_levels (
+        level INTEGER PRIMARY KEY,
+        name TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS maturity_dimensions (
+        dimension TEXT PRIMARY KEY,
+        position INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS maturity_scores (
+        profile TEXT NOT NULL,
+        dimension TEXT NOT NULL,
+        current REAL NOT NULL,
+        target REAL NOT NULL,
+        PRIMARY KEY (profile, dimension)
+    );
+'''
+
+
+def load_assessments(db_path=DB_PATH):
+    """Levels, dimensions and (profiles, dimensions) score matrices
+
+    Profiles missing a dimension are left out. Returns None for databases
+    without the maturity tables
+    """
+    if not Path(db_path).exists():
+        return None
+    conn = sqlite3.connect(db_path)
+    try:
+        levels = [name for _, name in conn.execute('SELECT level, name FROM maturity_levels ORDER BY level')]
+        dimensions = [d for d, in conn.execute('SELECT dimension FROM maturity_dimensions ORDER BY position')]
+        rows = conn.execute('SELECT profile, dimension, current, target FROM maturity_scores ORDER BY profile').fetchall()
+    except sqlite3.OperationalError:
+        return None
+    finally:
+        conn.close()
+    if not levels or not dimensions:
+        return None
+
+    profiles = sorted({row[0] for row in rows})
+    row_index = {profile: i for i, profile in enumerate(profiles)}
+    column_index = {dimension: j for j, dimension in enumerate(dimensions)}
+    scores = np.full((2, len(profiles), len(dimensions)), np.nan)
+    for profile, dimension, current, target in rows:
+        if dimension in column_index:
+            scores[:, row_index[profile], column_index[dimension]] = current, target
+    complete = ~np.isnan(scores).any(axis=(0, 2))
+    return {
+        'levels': levels,
+        'dimensions': dimensions,
+        'profiles': [profile for profile, keep in zip(profiles, complete) if keep],
+        'current': scores[0, complete],
+        'target': scores[1, complete],
+    }
+
+
+def status_label(average):
+    return next(label for bound, label in STATUSES if average < bound)
+
+
+def _pick(values, count, order):
+    """Indices of the count highest (order=-1) or lowest (order=1) values;
+    ties keep the dimensions' order"""
+    return np.argsort(order * values, axis=-1, kind='stable')[..., :count]
+
+
+def gap_analysis(assessments):
+    """Per-profile averages, status and the dimensions each insight card names
+
+    Computed for every profile at once; returns {profile: analysis}
+    """
+    current, target = assessments['current'], assessments['target']
+    gaps = target - current
+    current_average = current.mean(axis=-1)
+    target_average = target.mean(axis=-1)
+    growth = gaps.mean(axis=-1)
+    strengths = _pick(current, STRENGTH_COUNT, -1)
+    weakest = _pick(current, GAP_COUNT, 1)
+    focus = _pick(gaps, FOCUS_COUNT, -1)
+
+    dimensions = assessments['dimensions']
+    analyses = {}
+    for i, profile in enumerate(assessments['profiles']):
+        def named(indices, values):
+            return [{'dimension': dimensions[j], 'score': float(values[i, j])} for j in indices[i]]
+
+        analyses[profile] = {
+            'profile': profile,
+            'levels': assessments['levels'],
+            'dimensions': dimensions,
+            'current': current[i].tolist(),
+            'target': target[i].tolist(),
+            'current_average': float(current_average[i]),
+            'target_average': float(target_average[i]),
+            'growth': float(growth[i]),
+            'status': status_label(round(float(current_average[i]), 1)),
+            'strengths': named(strengths, current),
+            'gaps': named(weakest, current),
+            'focus': [item for item in named(focus, gaps) if item['score'] > 0],
+        }
+    return analyses
+
+
+def assessment_dataset(analysis):
+    """The assessment chart's dataset as compact JSON"""
+    return compact_json({
+        'categories': analysis['dimensions'],
+        'current': analysis['current'],
+        'target': analysis['target'],
+        'levels': analysis['levels'],
+        'currentAverage': round(analysis['current_average'], 1),
+        'targetAverage': round(analysis['target_average'], 1),
+    })
+
+
+def _and(names):
+    if len(names) < 2:
+        return ''.join(names)
+    return f"{', '.join(names[:-1])} and {names[-1]}"
+
+
+def _metrics(items):
+    return ''.join(
+        f'<div class="metric-item"><span class="metric-value">{html.escape(value)}</span>'
+        f'<div class="metric-label">{html.escape(label)}</div></div>'
+        for value, label in items)
+
+
+def embed_gap_analysis(soup, slide_name, analysis):
+    """Fill the assessment slide's status line and insight cards (elements
+    marked data-maturity)
+
+    Returns the number of elements filled; 0 for other slides
+    """
+    from bs4 import BeautifulSoup
+
+    if slide_name != ASSESSMENT_SLIDE:
+        return 0
+
+    strengths = [item['dimension'] for item in analysis['strengths']]
+    gaps = [item['dimension'] for item in analysis['gaps']]
+    texts = {
+        'overall': f"{analysis['current_average']:.1f}",
+        'status': analysis['status'],
+        'strength-names': ' & '.join(strengths),
+        'gap-names': ' & '.join(gaps),
+        'focus-names': _and([item['dimension'].lower() for item in analysis['focus']]) or 'sustaining current levels',
+    }
+    metrics = {
+        'strength-metrics': [(f"{item['score']:.1f}", f"{item['dimension']} Score") for item in analysis['strengths']],
+        'gap-metrics': [(f"{item['score']:.1f}", item['dimension']) for item in analysis['gaps']],
+        'focus-metrics': [(f"{analysis['growth']:+.1f}", 'Avg. Growth'),
+                          (f"{analysis['target_average']:.1f}", 'Target Score')],
+    }
+    filled = 0
+    for element in soup.find_all(attrs={'data-maturity': True}):
+        key = element['data-maturity']
+        if key in texts:
+            element.string = texts[key]
+        elif key in metrics:
+            element.clear()
+            element.append(BeautifulSoup(_metrics(metrics[key]), 'html.parser'))
+        else:
+            continue
+        filled += 1
+    return filled
+
+
+def save_scores(conn, profile, scores):
+    """Replace a profile's scores from {dimension: (current, target)}"""
+    conn.execute('DELETE FROM maturity_scores WHERE profile = ?', (profile,))
+    conn.executemany('INSERT INTO maturity_scores VALUES (?, ?, ?, ?)',
+                     [(profile, dimension, current, target) for dimension, (current, target) in scores.items()])
+
+
+def check_scores(current, target, levels):
+    """Raise ValueError unless both levels lie on the 1..len(levels) scale"""
+    if not all(1 <= value <= len(levels) for value in (current, target)):
+        raise ValueError(f"scores must be between 1 and {len(levels)}")
+
+
+def read_profiles(lines, dimensions, levels):
+    """{profile id: {dimension: (current, target)}} from CSV lines with
+    client, dimension, current and target columns
+
+    Raises ValueError naming the offending row for unknown dimensions,
+    out-of-range scores and incomplete profiles
+    """
+    from client_batch import client_id
+
+    reader = csv.DictReader(lines)
+    missing = {'client', 'dimension', 'current', 'target'} - {(name or '').strip().lower() for name in reader.fieldnames or []}
+    if missing:
+        raise ValueError(f"missing column(s): {', '.join(sorted(missing))}")
+    known = {dimension.lower(): dimension for dimension in dimensions}
+    profiles = {}
+    for line, row in enumerate(reader, start=2):
+        row = {(name or '').strip().lower(): (value or '').strip() for name, value in row.items()}
+        profile = client_id(row['client'])
+        if not profile:
+            raise ValueError(f"row {line}: missing client name")
+        dimension = known.get(row['dimension'].lower())
+        if dimension is None:
+            raise ValueError(f"row {line}: unknown dimension {row['dimension']!r} "
+                             f"(dimensions are {', '.join(dimensions)})")
+        try:
+            current, target = float(row['current']), float(row['target'])
+        except ValueError:
+            raise ValueError(f"row {line}: current and target must be numbers") from None
+        try:
+            check_scores(current, target, levels)
+        except ValueError as e:
+            raise ValueError(f"row {line}: {e}") from None
+        profiles.setdefault(profile, {})[dimension] = (current, target)
+    for profile, scores in profiles.items():
+        absent = [dimension for dimension in dimensions if dimension not in scores]
+        if absent:
+            raise ValueError(f"{profile}: no scores for {', '.join(absent)}")
+    return profiles
+
+
+def seed(db_path=DB_PATH, overwrite=False):
+    """Fill the maturity tables from the assessment slide's default dataset
+
+    Returns the number of dimensions written to the house profile
+    """
+    from bs4 import BeautifulSoup
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(SCHEMA)
+        if overwrite:
+            conn.executescript('DELETE FROM maturity_levels; DELETE FROM maturity_dimensions;')
+        source = conn.execute('SELECT source FROM slides WHERE name = ?', (ASSESSMENT_SLIDE,)).fetchone()
+        path = SLIDES_DIR / (source[0] if source else f'{ASSESSMENT_SLIDE}.html')
+        with open(path, 'r', encoding='utf-8') as f:
+            soup = BeautifulSoup(f.read(), 'html.parser')
+        data = json.loads(soup.find('script', id=SCRIPT_ID_PREFIX + ASSESSMENT_CHART_ID).string)
+        conn.executemany('INSERT OR IGNORE INTO maturity_levels VALUES (?, ?)',
+                         list(enumerate(data.get('levels', SEED_LEVELS), start=1)))
+        conn.executemany('INSERT OR IGNORE INTO maturity_dimensions VALUES (?, ?)',
+                         [(dimension, position) for position, dimension in enumerate(data['categories'])])
+        if overwrite or not conn.execute('SELECT 1 FROM maturity_scores WHERE profile = ?', (HOUSE_PROFILE,)).fetchone():
+            save_scores(conn, HOUSE_PROFILE, dict(zip(data['categories'], zip(data['current'], data['target']))))
+        conn.commit()
+    finally:
+        conn.close()
+    return len(data['categories'])
+
+
+def print_analysis(analysis):
+    print(f"🧭 {analysis['profile']}: overall {analysis['current_average']:.1f} → target "
+          f"{analysis['target_average']:.1f} ({analysis['growth']:+.1f}), status {analysis['status']}")
+    print(f"\n  {'Dimension':<20} {'Current':>8} {'Target':>7} {'Gap':>6}")
+    for dimension, current, target in zip(analysis['dimensions'], analysis['current'], analysis['target']):
+        print(f"  {dimension:<20} {current:>8.1f} {target:>7.1f} {target - current:>+6.1f}")
+    print(f"\n  Strengths: {', '.join(item['dimension'] for item in analysis['strengths'])}")
+    print(f"  Critical gaps: {', '.join(item['dimension'] for item in analysis['gaps'])}")
+    print(f"  Focus: {', '.join(item['dimension'] for item in analysis['focus']) or 'none'}")
+
+
+def render_profiles(analyses, output_dir):
+    """Write <profile>.svg per profile and one gap_analysis.csv
+
+    Returns the number of SVGs rendered rather than served from the chart cache
+    """
+    from chart_prerender import render_chart
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    rendered = 0
+    with open(output_dir / 'gap_analysis.csv', 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['profile', 'current_average', 'target_average', 'growth', 'status',
+                         'strengths', 'gaps', 'focus'])
+        for profile, analysis in analyses.items():
+            svg, cached = render_chart(ASSESSMENT_CHART_ID, assessment_dataset(analysis))
+            (output_dir / f"{profile}.svg").write_text(svg, encoding='utf-8')
+            rendered += not cached
+            writer.writerow([profile, f"{analysis['current_average']:.2f}", f"{analysis['target_average']:.2f}",
+                             f"{analysis['growth']:.2f}", analysis['status']]
+                            + ['; '.join(item['dimension'] for item in analysis[key])
+                               for key in ('strengths', 'gaps', 'focus')])
+    return rendered
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AI maturity assessments stored in slides.db")
+    parser.add_argument('--db', default=DB_PATH, help=f"Database path (default: {DB_PATH})")
+    commands = parser.add_subparsers(dest='command')
+    commands.add_parser('list', help="List profiles with their overall scores (the default command)")
+    show = commands.add_parser('show', help="Print a profile's gap analysis")
+    show.add_argument('profile', nargs='?', default=HOUSE_PROFILE, help=f"Profile id (default: {HOUSE_PROFILE})")
+    import_parser = commands.add_parser('import', help="Store client profiles from a CSV "
+                                                       "(client, dimension, current, target)")
+    import_parser.add_argument('csv', help="CSV file ('-' for stdin)")
+    set_parser = commands.add_parser('set', help="Set one dimension of a profile")
+    set_parser.add_argument('profile', help="Profile id")
+    set_parser.add_argument('dimension', help="Dimension, e.g. Governance")
+    set_parser.add_argument('current', type=float, help="Current level")
+    set_parser.add_argument('target', type=float, help="12-month target level")
+    render = commands.add_parser('render', help="Render profiles' charts and write their gap analysis")
+    render.add_argument('profiles', nargs='*', help="Profile ids (default: all)")
+    render.add_argument('--output-dir', default='maturity', help="Output directory (default: maturity)")
+    seed_parser = commands.add_parser('seed', help="Seed the tables from the assessment slide")
+    seed_parser.add_argument('--overwrite', action='store_true', help="Replace the levels, dimensions and house profile")
+    args = parser.parse_args(argv)
+
+    if not Path(args.db).exists():
+        print(f"❌ Error: {args.db} not found!")
+        sys.exit(1)
+
+    if args.command == 'seed':
+        written = seed(args.db, args.overwrite)
+        print(f"📊 Seeded {written} dimension(s) of the {HOUSE_PROFILE} profile")
+        return
+
+    assessments = load_assessments(args.db)
+    if assessments is None:
+        print("No maturity tables yet; run `python maturity_assessment.py seed` to seed them from the slide")
+        sys.exit(1)
+
+    if args.command in ('import', 'set'):
+        if args.command == 'import':
+            try:
+                if args.csv == '-':
+                    profiles = read_profiles(sys.stdin, assessments['dimensions'], assessments['levels'])
+                else:
+                    with open(args.csv, 'r', encoding='utf-8-sig', newline='') as f:
+                        profiles = read_profiles(f, assessments['dimensions'], assessments['levels'])
+            except (OSError, ValueError) as e:
+                print(f"❌ Error reading {args.csv}: {e}")
+                sys.exit(1)
+        else:
+            if args.profile not in assessments['profiles']:
+                parser.error(f"unknown profile {args.profile!r}; import it first")
+            if args.dimension not in assessments['dimensions']:
+                parser.error(f"unknown dimension {args.dimension!r} (dimensions are {', '.join(assessments['dimensions'])})")
+            try:
+                check_scores(args.current, args.target, assessments['levels'])
+            except ValueError as e:
+                parser.error(str(e))
+            i = assessments['profiles'].index(args.profile)
+            scores = dict(zip(assessments['dimensions'], zip(assessments['current'][i].tolist(),
+                                                             assessments['target'][i].tolist())))
+            scores[args.dimension] = (args.current, args.target)
+            profiles = {args.profile: scores}
+        conn = sqlite3.connect(args.db)
+        try:
+            for profile, scores in profiles.items():
+                save_scores(conn, profile, scores)
+            conn.commit()
+        finally:
+            conn.close()
+        print(f"✅ Stored {len(profiles):,} profile(s)")
+        analyses = gap_analysis(load_assessments(args.db))
+        if len(profiles) == 1:
+            print_analysis(analyses[next(iter(profiles))])
+        return
+
+    analyses = gap_analysis(assessments)
+    if args.command == 'show':
+        if args.profile not in analyses:
+            print(f"❌ No maturity profile {args.profile!r}")
+            sys.exit(1)
+        print_analysis(analyses[args.profile])
+    elif args.command == 'render':
+        missing = [profile for profile in args.profiles if profile not in analyses]
+        if missing:
+            print(f"❌ Unknown profile(s): {', '.join(missing)}")
+            sys.exit(1)
+        selected = {profile: analyses[profile] for profile in args.profiles or analyses}
+        output_dir = Path(args.output_dir)
+        rendered = render_profiles(selected, output_dir)
+        print(f"🖌️  Wrote {len(selected):,} chart(s) ({rendered:,} rendered, "
+              f"{len(selected) - rendered:,} cached) and gap_analysis.csv to {output_dir}/")
+    else:
+        print(f"🧭 Maturity profiles in {args.db}:")
+        print(f"  {'Profile':<30} {'Current':>8} {'Target':>7} {'Status':>12}")
+        for profile, analysis in analyses.items():
+            print(f"  {profile:<30} {analysis['current_average']:>8.1f} {analysis['target_average']:>7.1f} "
+                  f"{analysis['status']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Minification stage for the presentation builder
+Collapses markup whitespace, strips comments and minifies inline CSS/JS
+Works on the BeautifulSoup tree during the navigation injection pass
+Each CSS/JS block is cached by content hash, so the navigation CSS and
+keyboard script shared by every slide are only minified once per build
+"""
+
+import hashlib
+import re
+
+from bs4 import Comment, NavigableString
+
+# Elements whose text content must be kept byte-for-byte
+PRESERVE_WHITESPACE = {'pre', 'textarea', 'code'}
+
+# Containers where whitespace between child elements never renders
+BLOCK_CONTAINERS = {'html', 'head', 'body', 'ul', 'ol', 'table', 'thead', 'tbody', 'tfoot', 'tr', 'select', 'picture'}
+
+JS_TYPES = {'', 'text/javascript', 'application/javascript', 'module'}
+
+# Characters after which a '/' starts a regex literal rather than a division
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+
+CSS_COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.S)
+CSS_STRING_PATTERN = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')')
+CSS_SPACE_AROUND_PATTERN = re.compile(r'\s*([{};,>])\s*')
+CSS_SPACE_AFTER_COLON_PATTERN = re.compile(r':\s+')
+CSS_TRAILING_SEMICOLON_PATTERN = re.compile(r';}')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+JS_LINE_BREAK_PATTERN = re.compile(r'[^\S\n]*\n\s*')
+JS_SPACE_PATTERN = re.compile(r'[^\S\n]+')
+
+_block_cache = {}
+
+
+def _cached(kind, text, minifier):
+    """Minify a block once per unique content hash"""
+    key = (kind, hashlib.sha1(text.encode('utf-8')).hexdigest())
+    if key not in _block_cache:
+        _block_cache[key] = minifier(text)
+    return _block_cache[key]
+
+
+def minify_css(css):
+    """Strip comments and collapse whitespace in CSS, leaving strings untouched"""
+    parts = CSS_STRING_PATTERN.split(CSS_COMMENT_PATTERN.sub('', css))
+    for i in range(0, len(parts), 2):  # even indexes are outside strings
+        code = WHITESPACE_PATTERN.sub(' ', parts[i])
+        code = CSS_SPACE_AROUND_PATTERN.sub(r'\1', code)
+        code = CSS_SPACE_AFTER_COLON_PATTERN.sub(':', code)
+        parts[i] = CSS_TRAILING_SEMICOLON_PATTERN.sub('}', code)
+    return ''.join(parts).strip()
+
+
+def _minify_js_code(code):
+    """Collapse whitespace in JavaScript outside literals: blank lines and
+    indentation go, one line break is kept wherever the source had one"""
+    return JS_SPACE_PATTERN.sub(' ', JS_LINE_BREAK_PATTERN.sub('\n', code))
+
+
+def minify_js(js):
+    """Strip comments and indentation from JavaScript
+
+    Line breaks are kept so automatic semicolon insertion behaves exactly
+    as in the source; strings, template literals and regex literals are
+    copied verbatim.
+
+    >>> minify_js('  const a = "x    y";\\n\\n  // note\\n  f(a);')
+    'const a = "x    y";\\nf(a);'
+    >>> minify_js('const t = `<ul>\\n    <li>${a}</li>\\n\\n</ul>`;')
+    'const t = `<ul>\\n    <li>${a}</li>\\n\\n</ul>`;'
+    """
+    out = []  # alternating code and literal spans, code first
+    code = []
+    i, n = 0, len(js)
+    last_significant = ''
+
+    def literal(text):
+        out.append(_minify_js_code(''.join(code)))
+        out.append(text)
+        code.clear()
+
+    while i < n:
+        ch = js[i]
+        nxt = js[i + 1] if i + 1 < n else ''
+
+        if ch in '"\'`':
+            start = i
+            i += 1
+            while i < n and js[i] != ch:
+                i += 2 if js[i] == '\\' else 1
+            i += 1
+            literal(js[start:i])
+            last_significant = ch
+        elif ch == '/' and nxt == '/':
+            while i < n and js[i] != '\n':
+                i += 1
+        elif ch == '/' and nxt == '*':
+            end = js.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+            code.append(' ')
+        elif ch == '/' and (last_significant in REGEX_PRECEDERS or last_significant == ''):
+            start = i
+            i += 1
+            in_class = False
+            while i < n and js[i] != '\n':
+                if js[i] == '\\':
+                    i += 2
+                    continue
+                if js[i] == '[':
+                    in_class = True
+                elif js[i] == ']':
+                    in_class = False
+                elif js[i] == '/' and not in_class:
+                    break
+                i += 1
+            i += 1
+            literal(js[start:i])
+            last_significant = '/'
+        else:
+            code.append(ch)
+            if not ch.isspace():
+                last_significant = ch
+            i += 1
+
+    out.append(_minify_js_code(''.join(code)))
+    out[0] = out[0].lstrip()
+    out[-1] = out[-1].rstrip()
+    return ''.join(out)
+
+
+def _inside_preserved(node):
+    """Check whether a text node sits inside an element that keeps its whitespace"""
+    return any(parent.name in PRESERVE_WHITESPACE for parent in node.parents)
+
+
+def minify_soup(soup):
+    """Minify a parsed document in place"""
+    # Drop comments, keeping IE conditional comments
+    for comment in soup.find_all(string=lambda s: isinstance(s, Comment)):
+        if not comment.strip().startswith('[if'):
+            comment.extract()
+
+    for style in soup.find_all('style'):
+        if style.string:
+            style.string = _cached('css', style.string, minify_css)
+
+    for script in soup.find_all('script'):
+        if script.string and script.get('type', '').lower() in JS_TYPES:
+            script.string = _cached('js', script.string, minify_js)
+
+    for tag in soup.find_all(style=True):
+        tag['style'] = _cached('css', tag['style'], minify_css).rstrip(';')
+
+    # Collapse whitespace in text nodes
+    for text in soup.find_all(string=True):
+        if type(text) is not NavigableString or text.parent.name in ('style', 'script'):
+            continue
+        if _inside_preserved(text):
+            continue
+        if text.isspace() and text.parent.name in BLOCK_CONTAINERS:
+            text.extract()
+            continue
+        collapsed = WHITESPACE_PATTERN.sub(' ', text)
+        if collapsed != text:
+            text.replace_with(collapsed)
+
+    return soup
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo risk simulation over the ROI model
+Samples the uncertain drivers behind the financial slides (customer
+acquisition rate, price, operating cost growth and launch delay, following
+the adoption, pricing and delivery risks on the risk assessment slide) and
+runs each path through financial_model. Paths are simulated in chunks, each
+with its own seeded random stream, across worker processes; results are
+folded into fixed-bin histograms as they arrive, so memory stays constant
+however many paths run, and the same seed always gives the same bands
+
+Writes risk_simulation.json with percentile bands of cumulative NPV per
+year (the fan chart on the ROI risk slide) and of NPV, IRR and payback month
+
+The drivers are centred on the deck's inputs (a client's, for client decks)
+and every other input is held at them; the builder's bands are cached by a
+hash of those inputs, so each distinct set is simulated once
+
+Usage:
+    python monte_carlo.py                            # 200,000 paths
+    python monte_carlo.py --paths 5000000 --seed 7
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import financial_model
+
+OUTPUT_FILE = "risk_simulation.json"
+
+# Id of the JSON data script in the ROI risk slide
+DATA_ID = 'risk-simulation-data'
+
+# Sampled inputs around the default inputs: ('triangular', low, mode, high)
+# or ('discrete', values, weights); see risk_distributions for other inputs
+RISK_DISTRIBUTIONS = {
+    # Adoption risk: consultants and clients slower (or faster) to sign up
+    'customers_per_quarter': ('triangular', 0.5, 1.0, 1.5),
+    # Pricing risk: the $1,000/month platform fee is not yet validated
+    'rev_per_customer': ('triangular', 700.0, 1000.0, 1200.0),
+    # Cost risk: operating costs may grow faster than planned
+    'op_cost_growth': ('triangular', 2.0, 5.0, 12.0),
+    # Delivery risk: months of delay before the first customer
+    'launch_delay': ('discrete', (0, 1, 2, 3, 6), (0.4, 0.25, 0.15, 0.1, 0.1)),
+}
+
+PERCENTILES = (5, 25, 50, 75, 95)
+DEFAULT_PATHS = 200000
+DEFAULT_CHUNK_SIZE = 20000
+PILOT_PATHS = 20000
+HISTOGRAM_BINS = 8192
+
+
+class Histogram:
+    """Fixed-bin histograms of one or more series, merged across chunks
+
+    Values outside the edges land in the end bins; exact extremes and sums
+    are kept alongside, so the mean is exact and percentiles are accurate
+    to a bin width
+    """
+
+    def __init__(self, low, high, series=1, bins=HISTOGRAM_BINS):
+        self.edges = np.linspace(low, high, bins + 1)
+        self.counts = np.zeros((series, bins), dtype=np.int64)
+        self.missing = np.zeros(series, dtype=np.int64)
+        self.sums = np.zeros(series)
+        self.minimum = np.full(series, np.inf)
+        self.maximum = np.full(series, -np.inf)
+
+    def add(self, values):
+        """Fold in a (series, n) array; NaNs are counted as missing"""
+        values = np.atleast_2d(values)
+        bins = len(self.edges) - 1
+        for i, row in enumerate(values):
+            finite = row[np.isfinite(row)]
+            self.missing[i] += len(row) - len(finite)
+            if not len(finite):
+                continue
+            index = np.clip(np.searchsorted(self.edges, finite, side='right') - 1, 0, bins - 1)
+            self.counts[i] += np.bincount(index, minlength=bins)
+            self.sums[i] += finite.sum()
+            self.minimum[i] = min(self.minimum[i], finite.min())
+            self.maximum[i] = max(self.maximum[i], finite.max())
+
+    def merge(self, other):
+        self.counts += other.counts
+        self.missing += other.missing
+        self.sums += other.sums
+        self.minimum = np.minimum(self.minimum, other.minimum)
+        self.maximum = np.maximum(self.maximum, other.maximum)
+
+    def percentiles(self, percentiles=PERCENTILES):
+        """Per series {'p5': ..., 'mean': ...}, interpolated within bins"""
+        summaries = []
+        for i, counts in enumerate(self.counts):
+            total = counts.sum()
+            if not total:
+                summaries.append(None)
+                continue
+            cumulative = np.cumsum(counts)
+            summary = {}
+            for p in percentiles:
+                target = p / 100 * total
+                index = int(np.searchsorted(cumulative, target))
+                before = cumulative[index - 1] if index else 0
+                fraction = (target - before) / counts[index] if counts[index] else 0
+                value = self.edges[index] + fraction * (self.edges[index + 1] - self.edges[index])
+                summary[f'p{p}'] = float(np.clip(value, self.minimum[i], self.maximum[i]))
+            summary['mean'] = float(self.sums[i] / total)
+            summaries.append(summary)
+        return summaries
+
+
+def risk_distributions(base=None):
+    """RISK_DISTRIBUTIONS centred on the base inputs
+
+    Triangular ranges scale with the base value over the mode (or shift by
+    the difference when either is zero); launch delays shift by the base delay
+    """
+    base = financial_model.model_inputs(**(base or {}))
+    distributions = {}
+    for name, distribution in RISK_DISTRIBUTIONS.items():
+        if distribution[0] == 'triangular':
+            _, low, mode, high = distribution
+            value = float(base[name])
+            if mode > 0 and value > 0:
+                scale = value / mode
+                distributions[name] = ('triangular', low * scale, value, high * scale)
+            else:
+                distributions[name] = ('triangular', low + value - mode, value, high + value - mode)
+        else:
+            _, values, weights = distribution
+            shift = int(base[name])
+            distributions[name] = ('discrete', tuple(v + shift for v in values), weights)
+    return distributions
+
+
+def sample_inputs(rng, paths, distributions=RISK_DISTRIBUTIONS):
+    """Draw every risk driver for a batch of paths"""
+    inputs = {}
+    for name, distribution in distributions.items():
+        if distribution[0] == 'triangular':
+            _, low, mode, high = distribution
+            inputs[name] = rng.triangular(low, mode, high, paths)
+        else:
+            _, values, weights = distribution
+            inputs[name] = rng.choice(values, size=paths, p=weights)
+    return inputs
+
+
+def simulate_paths(seed_sequence, paths, years, base=None):
+    """Model results for one chunk of paths from its own random stream;
+    inputs that are not sampled stay at base"""
+    rng = np.random.default_rng(seed_sequence)
+    inputs = financial_model.model_inputs(**dict(base or {}, npv_years=years,
+                                                 **sample_inputs(rng, paths, risk_distributions(base))))
+    return financial_model.evaluate(inputs)
+
+
+def _simulate_chunk(job):
+    """Worker entry point: simulate a chunk and return its histograms only"""
+    seed_sequence, paths, years, npv_range, irr_range, base = job
+    results = simulate_paths(seed_sequence, paths, years, base)
+    npv = Histogram(*npv_range, series=years + 1)
+    npv.add(results['cumulative_npv'].T)
+    irr = Histogram(*irr_range)
+    irr.add(results['irr'])
+    payback = np.bincount(results['payback_month'], minlength=years * 12 + 1)
+    return npv, irr, payback, int((results['npv'] > 0).sum())
+
+
+def _padded_range(values, padding=0.5):
+    low, high = np.nanmin(values), np.nanmax(values)
+    span = (high - low) or abs(high) or 1.0
+    return float(low - padding * span), float(high + padding * span)
+
+
+def simulate(paths=DEFAULT_PATHS, seed=0, years=None, chunk_size=DEFAULT_CHUNK_SIZE, workers=None, base=None):
+    """Run the simulation around the base inputs and aggregate it into
+    histograms and counts
+
+    A pilot batch (from its own stream) fixes the histogram ranges; chunk i
+    then draws from stream i of the seed, so for a given seed and chunk size
+    the results do not depend on the number of workers
+    """
+    base = financial_model.model_inputs(**(base or {}))
+    years = int(years or base['npv_years'])
+    pilot_seed, *chunk_seeds = np.random.SeedSequence(seed).spawn(1 + math.ceil(paths / chunk_size))
+    pilot = simulate_paths(pilot_seed, min(PILOT_PATHS, paths), years, base)
+    npv_range = _padded_range(pilot['cumulative_npv'])
+    irr_range = _padded_range(pilot['irr']) if np.isfinite(pilot['irr']).any() else (-1.0, 1.0)
+
+    jobs = [(chunk_seed, min(chunk_size, paths - i * chunk_size), years, npv_range, irr_range, base)
+            for i, chunk_seed in enumerate(chunk_seeds)]
+    npv = Histogram(*npv_range, series=years + 1)
+    irr = Histogram(*irr_range)
+    payback = np.zeros(years * 12 + 1, dtype=np.int64)
+    positive = 0
+
+    if len(jobs) > 1 and workers != 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        chunks = pool.map(_simulate_chunk, jobs)
+    else:
+        pool = None
+        chunks = map(_simulate_chunk, jobs)
+    try:
+        # Fold each chunk in as it arrives; only histograms are kept
+        for chunk_npv, chunk_irr, chunk_payback, chunk_positive in chunks:
+            npv.merge(chunk_npv)
+            irr.merge(chunk_irr)
+            payback += chunk_payback
+            positive += chunk_positive
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return {'npv': npv, 'irr': irr, 'payback': payback, 'positive_npv': positive}
+
+
+def payback_percentiles(payback, percentiles=PERCENTILES):
+    """Payback month percentiles; None where the path never pays back
+
+    payback[0] counts paths that never pay back, which sort last
+    """
+    months = np.append(payback[1:], payback[0])
+    cumulative = np.cumsum(months)
+    summary = {}
+    for p in percentiles:
+        index = int(np.searchsorted(cumulative, p / 100 * cumulative[-1]))
+        summary[f'p{p}'] = index + 1 if index < len(months) - 1 else None
+    summary['never_share'] = float(payback[0] / cumulative[-1])
+    return summary
+
+
+def risk_bands(paths=DEFAULT_PATHS, seed=0, chunk_size=DEFAULT_CHUNK_SIZE, workers=None, base=None):
+    """Percentile bands for the fan chart and the headline results, around the base inputs"""
+    base = financial_model.model_inputs(**(base or {}))
+    simulation = simulate(paths, seed, chunk_size=chunk_size, workers=workers, base=base)
+    yearly = simulation['npv'].percentiles()
+    irr_summary = simulation['irr'].percentiles()[0]
+    return {
+        'paths': paths,
+        'seed': seed,
+        'distributions': {name: [list(part) if isinstance(part, tuple) else part for part in distribution]
+                          for name, distribution in risk_distributions(base).items()},
+        'fan': {
+            'years': list(range(len(yearly))),
+            'bands': {key: [year[key] for year in yearly] for key in yearly[-1]},
+            'base_case': [row['cumulativeNPV'] for row in financial_model.run_model(**base)['yearly']],
+        },
+        'npv': dict(yearly[-1], positive_share=simulation['positive_npv'] / paths),
+        'irr': dict(irr_summary or {}, undefined_share=float(simulation['irr'].missing[0] / paths)),
+        'payback_month': payback_percentiles(simulation['payback']),
+    }
+
+
+def embed_risk_bands(soup, base=None, paths=DEFAULT_PATHS):
+    """Fill the risk slide's data script in place, simulating around the
+    base inputs (cached by their hash)
+
+    Returns the bands, or None for slides without one
+    """
+    script = soup.find('script', id=DATA_ID)
+    if script is None:
+        return None
+    base = financial_model.model_inputs(**(base or {}))
+    data = financial_model.cached_analysis(
+        'risk', lambda: risk_bands(paths, workers=1, base=base),
+        paths=paths, seed=0, chunk_size=DEFAULT_CHUNK_SIZE, base=base, distributions=RISK_DISTRIBUTIONS)
+    script.string = json.dumps(data, separators=(',', ':')).replace('</', '<\\/')
+    return data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo risk simulation of the ROI model")
+    parser.add_argument('--paths', type=int, default=DEFAULT_PATHS,
+                        help=f"Simulated paths (default: {DEFAULT_PATHS:,})")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Paths simulated per array pass (default: {DEFAULT_CHUNK_SIZE:,})")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--output', default=OUTPUT_FILE, help=f"Percentile band file (default: {OUTPUT_FILE})")
+    args = parser.parse_args(argv)
+
+    if args.paths < 1 or args.chunk_size < 1:
+        print("❌ Error: --paths and --chunk-size must be positive")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    data = risk_bands(args.paths, args.seed, args.chunk_size, args.workers)
+    elapsed = time.perf_counter() - started
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+    npv, irr, payback = data['npv'], data['irr'], data['payback_month']
+    print(f"🎲 {args.paths:,} paths (seed {args.seed}) in {elapsed:.2f}s")
+    print(f"  NPV:     p5 ${npv['p5']:,.0f} | median ${npv['p50']:,.0f} | p95 ${npv['p95']:,.0f} "
+          f"(positive in {npv['positive_share']:.0%})")
+    if 'p50' in irr:
+        print(f"  IRR:     p5 {irr['p5']:.1%} | median {irr['p50']:.1%} | p95 {irr['p95']:.1%}")
+    months = {key: f"Month {value}" if value else 'never' for key, value in payback.items() if key.startswith('p')}
+    print(f"  Payback: p5 {months['p5']} | median {months['p50']} | p95 {months['p95']} "
+          f"(never in {payback['never_share']:.0%})")
+    print(f"  ✅ Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
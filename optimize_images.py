@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Image optimization stage for the presentation builder
+Downsizes slide images to their largest rendered size (1920x1080 at 1x and 2x),
+recompresses them and emits WebP/AVIF variants for responsive srcset markup
+Encoding runs in a process pool and results are cached by content hash
+
+Can also be run directly to shrink screenshots before PDF export:
+    python optimize_images.py slide_captures/
+"""
+
+import argparse
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from asset_pipeline import ASSET_CACHE_DIR
+
+# Slides are designed for a 1920x1080 viewport
+RENDER_WIDTH = 1920
+RENDER_HEIGHT = 1080
+DENSITIES = (1, 2)
+
+# Encoder settings per output format; the source format is always kept as a
+# fallback. JPEG settings only apply to downsized or converted images: a JPEG
+# at its own size keeps its original bytes
+ENCODER_OPTIONS = {
+    'PNG': {'optimize': True},
+    'JPEG': {'quality': 90, 'optimize': True, 'progressive': True},
+    'WEBP': {'quality': 85, 'method': 6},
+    'AVIF': {'quality': 60},
+}
+
+FORMAT_EXTENSIONS = {'PNG': '.png', 'JPEG': '.jpg', 'WEBP': '.webp', 'AVIF': '.avif'}
+MIME_TYPES = {'WEBP': 'image/webp', 'AVIF': 'image/avif'}
+
+OPTIMIZABLE_EXTENSIONS = {'.png', '.jpg', '.jpeg'}
+
+
+def supported_modern_formats():
+    """Return the modern formats this Pillow build can encode, best first"""
+    from PIL import features
+
+    formats = []
+    for name in ('AVIF', 'WEBP'):
+        try:
+            if features.check(name.lower()):
+                formats.append(name)
+        except (ValueError, KeyError):
+            pass
+    return formats
+
+
+def fit_within(size, bound):
+    """Scale (width, height) down to fit inside bound, never up"""
+    width, height = size
+    scale = min(bound[0] / width, bound[1] / height, 1.0)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def plan_variants(source_path, content_hash, formats=None):
+    """Work out which variants an image needs without decoding its pixels"""
+    from PIL import Image
+
+    source_path = Path(source_path)
+    with Image.open(source_path) as img:
+        size = img.size
+        source_format = img.format if img.format in ENCODER_OPTIONS else 'PNG'
+
+    if formats is None:
+        formats = supported_modern_formats()
+
+    variants = []
+    previous_size = None
+    for density in DENSITIES:
+        target = fit_within(size, (RENDER_WIDTH * density, RENDER_HEIGHT * density))
+        # A small image has nothing to gain from a larger density variant
+        if target == previous_size:
+            continue
+        previous_size = target
+        for fmt in [source_format] + formats:
+            variants.append({
+                'name': f"{source_path.stem}.{content_hash}.{target[0]}w{FORMAT_EXTENSIONS[fmt]}",
+                'width': target[0],
+                'height': target[1],
+                'density': density,
+                'format': fmt,
+                'fallback': fmt == source_format,
+            })
+    return variants
+
+
+def render_variant(source_path, variant, blob_path):
+    """Encode a single variant into the blob cache (runs in a worker process)
+
+    A variant in the source's own size and format keeps the source bytes when
+    re-encoding would not make it smaller, and a JPEG is never re-encoded at
+    its own size, since that only loses quality
+    """
+    from PIL import Image
+
+    source_path, blob_path = Path(source_path), Path(blob_path)
+    tmp_path = blob_path.with_name(f'{blob_path.name}.{os.getpid()}.tmp')
+    with Image.open(source_path) as img:
+        unchanged = img.size == (variant['width'], variant['height']) and img.format == variant['format']
+        keep_source = unchanged and variant['format'] == 'JPEG'
+        if not keep_source:
+            img.load()
+            if img.size != (variant['width'], variant['height']):
+                img = img.resize((variant['width'], variant['height']), Image.LANCZOS)
+            if variant['format'] == 'JPEG' and img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
+            img.save(tmp_path, format=variant['format'], **ENCODER_OPTIONS[variant['format']])
+
+    if unchanged and not keep_source and tmp_path.stat().st_size >= source_path.stat().st_size:
+        tmp_path.unlink()
+        keep_source = True
+    if keep_source:
+        if blob_path.resolve() == source_path.resolve():
+            return blob_path.stat().st_size
+        shutil.copyfile(source_path, tmp_path)
+    os.replace(tmp_path, blob_path)
+    return blob_path.stat().st_size
+
+
+def build_srcset(variants, url_prefix, fmt):
+    """Build a density-descriptor srcset for one format"""
+    return ', '.join(f"{url_prefix}{v['name']} {v['density']}x"
+                     for v in variants if v['format'] == fmt)
+
+
+class ImageOptimizer:
+    """Schedules variant encoding in a process pool, reusing cached blobs"""
+
+    def __init__(self, cache_dir=ASSET_CACHE_DIR, workers=None, formats=None):
+        self.cache_dir = Path(cache_dir)
+        self.workers = workers
+        self.formats = supported_modern_formats() if formats is None else formats
+        self.pool = None
+        self.pending = []
+        self.planned = {}  # resolved source path -> variants
+        self.stats = {'encoded': 0, 'cached': 0, 'bytes_in': 0, 'bytes_out': 0}
+
+    def submit(self, source_path, content_hash):
+        """Plan an image's variants and queue any that are not cached yet"""
+        source_path = Path(source_path).resolve()
+        if source_path in self.planned:
+            return self.planned[source_path]
+
+        variants = plan_variants(source_path, content_hash, self.formats)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.stats['bytes_in'] += source_path.stat().st_size
+
+        for variant in variants:
+            blob_path = self.cache_dir / variant['name']
+            if blob_path.exists():
+                self.stats['cached'] += 1
+                self.stats['bytes_out'] += blob_path.stat().st_size
+                continue
+            if self.pool is None:
+                self.pool = ProcessPoolExecutor(max_workers=self.workers)
+            self.pending.append(self.pool.submit(render_variant, str(source_path), variant, str(blob_path)))
+
+        self.planned[source_path] = variants
+        return variants
+
+    def wait(self):
+        """Block until every queued variant has been written to the cache"""
+        for future in self.pending:
+            self.stats['bytes_out'] += future.result()
+            self.stats['encoded'] += 1
+        self.pending = []
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def report(self):
+        """Print a summary of the optimization stage"""
+        print(f"  ✅ Images: {len(self.planned)} optimized "
+              f"({self.stats['encoded']} variants encoded, {self.stats['cached']} from cache, "
+              f"formats: {', '.join(self.formats) or 'source only'})")
+        print(f"     {self.stats['bytes_in'] / 1024:.0f} KB source → "
+              f"{self.stats['bytes_out'] / 1024:.0f} KB across all variants")
+
+
+def optimize_in_place(paths, density=1, workers=None):
+    """Downsize and losslessly recompress images in place (e.g. slide_captures/)
+
+    Files that would not get smaller are left as they are; JPEGs are only
+    re-encoded when they are downsized
+    """
+    jobs = []
+    for path in paths:
+        path = Path(path)
+        plan = plan_variants(path, 'tmp', formats=[])
+        variant = max((v for v in plan if v['density'] <= density), key=lambda v: v['density'])
+        jobs.append((path, variant))
+
+    before = sum(path.stat().st_size for path, _ in jobs)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(render_variant, [str(p) for p, _ in jobs], [v for _, v in jobs], [str(p) for p, _ in jobs]))
+    after = sum(path.stat().st_size for path, _ in jobs)
+    return before, after
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Downsize and recompress slide images in place")
+    parser.add_argument('paths', nargs='+', help="Image files or directories (e.g. slide_captures/)")
+    parser.add_argument('--density', type=int, choices=DENSITIES, default=1,
+                        help="Keep up to this multiple of 1920x1080 (default: 1)")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    files = []
+    for path in map(Path, args.paths):
+        if path.is_dir():
+            files.extend(sorted(p for p in path.iterdir() if p.suffix.lower() in OPTIMIZABLE_EXTENSIONS))
+        elif path.suffix.lower() in OPTIMIZABLE_EXTENSIONS:
+            files.append(path)
+
+    if not files:
+        print("❌ No PNG/JPEG images found")
+        sys.exit(1)
+
+    print(f"🖼️  Optimizing {len(files)} image(s)...")
+    before, after = optimize_in_place(files, args.density, args.workers)
+    print(f"✅ {before / 1024:.0f} KB → {after / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Minimal precompiled template engine for the generated pages
+Templates in templates/ (and presenter.html) are compiled once per process
+into Python generator functions and cached; rendering streams chunks straight
+to the output file instead of building the page by string concatenation
+
+Syntax:
+    {{ expr }}          HTML-escaped value
+    {{ expr|safe }}     raw value
+    {{ expr|json }}     JSON literal, for embedding data in scripts
+    {% for x in expr %} ... {% endfor %}
+    {% if expr %} ... {% elif expr %} ... {% else %} ... {% endif %}
+
+A block tag alone on its line consumes the whole line, so templates keep
+their indentation without leaving blank lines in the output
+"""
+
+import html
+import json
+import re
+import types
+from functools import lru_cache
+from pathlib import Path
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+
+# Tags never span lines; group 1 is a block tag alone on its line
+TOKEN_PATTERN = re.compile(r'^[ \t]*({%.*?%})[ \t]*\n|({%.*?%})|({{.*?}})', re.M)
+
+# Filter name -> function applied to the value (None is the default escape)
+FILTERS = {
+    'safe': 'str',
+    'json': '_json',
+    None: '_escape',
+}
+
+
+def _escape(value):
+    return html.escape(str(value), quote=True)
+
+
+def _json(value):
+    # Keep "</script>" and friends from closing the surrounding script tag
+    return json.dumps(value, ensure_ascii=False).replace('</', '<\\/')
+
+
+# Names available to every template
+TEMPLATE_GLOBALS = {
+    '_escape': _escape,
+    '_json': _json,
+    'enumerate': enumerate,
+    'len': len,
+    'int': int,
+}
+
+
+class TemplateSyntaxError(ValueError):
+    pass
+
+
+def compile_template(source, name='<template>'):
+    """Compile template source into a code object for a generator function"""
+    lines = ['def _render():']
+    indent = 1
+    stack = []
+    position = 0
+
+    def emit(line):
+        lines.append('    ' * indent + line)
+
+    def literal(text):
+        if text:
+            emit(f'yield {text!r}')
+
+    for match in TOKEN_PATTERN.finditer(source):
+        literal(source[position:match.start()])
+        position = match.end()
+        block = match.group(1) or match.group(2)
+
+        if block is None:
+            expression, _, filter_name = match.group(3)[2:-2].strip().rpartition('|')
+            filter_name = filter_name.strip()
+            if not expression or filter_name not in FILTERS:
+                # No filter; the whole tag is the expression
+                expression, filter_name = match.group(3)[2:-2], None
+            emit(f'yield {FILTERS[filter_name]}({expression.strip()})')
+            continue
+
+        keyword, _, argument = block[2:-2].strip().partition(' ')
+        if keyword in ('for', 'if'):
+            emit(f'{keyword} {argument}:')
+            stack.append(keyword)
+            indent += 1
+            emit('pass')
+        elif keyword in ('elif', 'else'):
+            if not stack or stack[-1] != 'if':
+                raise TemplateSyntaxError(f"{name}: '{keyword}' outside of an if block")
+            indent -= 1
+            emit(f'elif {argument}:' if keyword == 'elif' else 'else:')
+            indent += 1
+            emit('pass')
+        elif keyword in ('endfor', 'endif'):
+            if not stack or stack.pop() != keyword[3:]:
+                raise TemplateSyntaxError(f"{name}: unexpected '{keyword}'")
+            indent -= 1
+        else:
+            raise TemplateSyntaxError(f"{name}: unknown tag '{keyword}'")
+
+    if stack:
+        raise TemplateSyntaxError(f"{name}: unclosed '{stack[-1]}' block")
+    literal(source[position:])
+    emit('return')
+
+    module = compile('\n'.join(lines), name, 'exec')
+    # The module code object defines _render; keep just the function's code
+    return next(const for const in module.co_consts if isinstance(const, types.CodeType))
+
+
+class Template:
+    """A compiled template; render() yields the output in chunks"""
+
+    def __init__(self, source, name='<template>'):
+        self.name = name
+        self.code = compile_template(source, name)
+
+    def render(self, **context):
+        namespace = dict(TEMPLATE_GLOBALS, **context)
+        return types.FunctionType(self.code, namespace)()
+
+    def render_string(self, **context):
+        return ''.join(self.render(**context))
+
+    def render_to(self, path, **context):
+        """Stream the rendered output to a file"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for chunk in self.render(**context):
+                f.write(chunk)
+
+
+@lru_cache(maxsize=None)
+def _load_template(path, mtime_ns):
+    return Template(Path(path).read_text(encoding='utf-8'), Path(path).name)
+
+
+def get_template(name):
+    """Compiled template from templates/ (or a path), cached per process"""
+    path = Path(name)
+    if not path.is_absolute() and not path.exists():
+        path = TEMPLATE_DIR / name
+    return _load_template(str(path), path.stat().st_mtime_ns)
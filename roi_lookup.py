@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Lookup tables for the ROI slide's live what-if inputs
+The model's annual cash flows are linear in revenue per cohort (monthly fee
+x new customers per quarter) and operating cost, with fixed per-year
+weights, so the builder precomputes those weights, the cumulative monthly
+weights for the payback search, and an IRR table over the two
+investment-relative drivers (IRR does not change when every cash flow is
+scaled). The tables are embedded in the slide as one base64 typed-array
+payload; the slide interpolates the IRR from the table and polishes it with
+Newton steps, and recomputes the model live only when the cost growth or
+horizon differ from the table's or a point falls outside it
+
+Usage:
+    python roi_lookup.py                  # table size and interpolation error
+"""
+
+import argparse
+import base64
+import json
+
+import numpy as np
+
+import financial_model
+
+LOOKUP_ID = 'roi-lookup'
+
+# Likely input ranges during a what-if session; the IRR table covers every
+# combination of them
+LOOKUP_RANGES = {
+    'rev_per_customer': (200.0, 3000.0),
+    'customers_per_quarter': (0.5, 5.0),
+    'operating_cost': (500.0, 10000.0),
+    'initial_investment': (25000.0, 500000.0),
+}
+GRID_SIZE = 64
+
+
+def yearly_weights(inputs):
+    """Per-year multipliers of revenue per cohort and of monthly operating cost"""
+    months = int(inputs['npv_years']) * 12
+    cohorts = financial_model.customer_schedule(1.0, months, inputs['launch_delay'], inputs['monthly_churn'],
+                                                inputs['ramp_months'])
+    cost = (1 + inputs['op_cost_growth'] / 100) ** (np.arange(months) // 12)
+    return {
+        'cohorts': cohorts,
+        'cost': cost,
+        'revenue_weights': cohorts.reshape(-1, 12).sum(axis=1),
+        'cost_weights': cost.reshape(-1, 12).sum(axis=1),
+    }
+
+
+def grid_axes():
+    """Log-spaced axes of revenue per cohort and annual operating cost, both
+    relative to the initial investment"""
+    low_investment, high_investment = LOOKUP_RANGES['initial_investment']
+    revenue = np.multiply(LOOKUP_RANGES['rev_per_customer'], LOOKUP_RANGES['customers_per_quarter'])
+    cost = np.multiply(LOOKUP_RANGES['operating_cost'], 12)
+    x_range = (revenue[0] / high_investment, revenue[1] / low_investment)
+    z_range = (cost[0] / high_investment, cost[1] / low_investment)
+    return (np.geomspace(*x_range, GRID_SIZE), np.geomspace(*z_range, GRID_SIZE))
+
+
+def irr_table(weights):
+    """IRR of cash flows (-1, x * revenue_weights - z * cost_weights / 12) over the grid"""
+    x, z = grid_axes()
+    z_grid, x_grid = np.meshgrid(z, x, indexing='ij')
+    flows = (x_grid[..., None] * weights['revenue_weights']
+             - z_grid[..., None] * weights['cost_weights'] / 12)
+    flows = np.concatenate([-np.ones(flows.shape[:-1] + (1,)), flows], axis=-1)
+    return financial_model.irr(flows)
+
+
+def build_lookup(inputs=None):
+    """Arrays and layout for the slide; float64 first so every view is aligned"""
+    inputs = financial_model.model_inputs(**(inputs or {}))
+    weights = yearly_weights(inputs)
+    x, z = grid_axes()
+    arrays = [
+        ('revenueWeights', 'f8', weights['revenue_weights']),
+        ('costWeights', 'f8', weights['cost_weights']),
+        ('cohortsCumulative', 'f8', np.concatenate([[0], np.cumsum(weights['cohorts'])])),
+        ('costCumulative', 'f8', np.concatenate([[0], np.cumsum(weights['cost'])])),
+        ('irr', 'f4', irr_table(weights)),
+    ]
+    layout = {
+        'years': int(inputs['npv_years']),
+        'opCostGrowth': float(inputs['op_cost_growth']),
+        'x': [float(np.log(x[0])), float(np.log(x[-1])), len(x)],
+        'z': [float(np.log(z[0])), float(np.log(z[-1])), len(z)],
+        'arrays': [],
+    }
+    payload = bytearray()
+    for name, dtype, values in arrays:
+        data = np.ascontiguousarray(values, dtype='<' + dtype).tobytes()
+        layout['arrays'].append([name, dtype, len(payload), int(np.size(values))])
+        payload += data
+    return layout, bytes(payload)
+
+
+def embed_lookup(soup, base=None):
+    """Add (or refresh) the lookup payload in the ROI slide, built for its
+    default inputs on top of base
+
+    Returns the layout, or None for slides without ROI inputs
+    """
+    inputs = financial_model.slide_inputs(soup)
+    if inputs is None:
+        return None
+    layout, payload = build_lookup(dict(base or {}, **inputs))
+    script = soup.find('script', id=LOOKUP_ID)
+    if script is None:
+        script = soup.new_tag('script', id=LOOKUP_ID, type='application/octet-stream')
+        (soup.body or soup).append(script)
+    script['data-layout'] = json.dumps(layout, separators=(',', ':'))
+    script.string = base64.b64encode(payload).decode('ascii')
+    return layout
+
+
+def interpolation_error(samples=20000, seed=0):
+    """Median and largest IRR error of bilinear interpolation alone (before
+    the Newton steps) at random points inside the table"""
+    inputs = financial_model.model_inputs()
+    weights = yearly_weights(inputs)
+    table = irr_table(weights)
+    x, z = grid_axes()
+    rng = np.random.default_rng(seed)
+    log_x = rng.uniform(np.log(x[0]), np.log(x[-1]), samples)
+    log_z = rng.uniform(np.log(z[0]), np.log(z[-1]), samples)
+
+    step_x = (np.log(x[-1]) - np.log(x[0])) / (len(x) - 1)
+    step_z = (np.log(z[-1]) - np.log(z[0])) / (len(z) - 1)
+    fx = (log_x - np.log(x[0])) / step_x
+    fz = (log_z - np.log(z[0])) / step_z
+    i = np.minimum(fx.astype(int), len(x) - 2)
+    j = np.minimum(fz.astype(int), len(z) - 2)
+    tx, tz = fx - i, fz - j
+    estimate = ((1 - tz) * ((1 - tx) * table[j, i] + tx * table[j, i + 1])
+                + tz * ((1 - tx) * table[j + 1, i] + tx * table[j + 1, i + 1]))
+
+    flows = (np.exp(log_x)[:, None] * weights['revenue_weights']
+             - np.exp(log_z)[:, None] * weights['cost_weights'] / 12)
+    exact = financial_model.irr(np.concatenate([-np.ones((samples, 1)), flows], axis=1))
+    valid = np.isfinite(estimate) & np.isfinite(exact) & (np.abs(exact) < 1)
+    errors = np.abs(estimate - exact)[valid]
+    return float(np.median(errors)), float(errors.max()), float(valid.mean())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the ROI slide's lookup tables and report their accuracy")
+    parser.parse_args(argv)
+
+    layout, payload = build_lookup()
+    encoded = base64.b64encode(payload)
+    median, largest, coverage = interpolation_error()
+    print(f"📦 ROI lookup: {layout['x'][2]}×{layout['z'][2]} IRR grid, {layout['years']} years, "
+          f"{layout['opCostGrowth']:g}% cost growth")
+    print(f"  Payload: {len(payload) / 1024:.1f} KB ({len(encoded) / 1024:.1f} KB base64)")
+    print(f"  Bilinear IRR error before the Newton steps: median {median * 100:.3f} points, "
+          f"max {largest * 100:.2f} points ({coverage:.0%} of sampled points have IRR between -100% and 100%)")
+
+
+if __name__ == "__main__":
+    main()
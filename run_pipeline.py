@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Run the presentation pipeline as a dependency graph of stages
+Each stage declares its input files and upstream stages; a stage is skipped
+when its inputs (and everything upstream) are unchanged since its last run,
+independent stages run concurrently, and results such as the slide list and
+screenshot paths are handed to downstream stages in memory
+
+Usage:
+    python run_pipeline.py                  # build (default target)
+    python run_pipeline.py pdf              # build → capture → pdf
+    python run_pipeline.py pdf --force      # ignore the stage cache
+    python run_pipeline.py build --with-setup --build-args="--minify --fullscreen-persistence"
+"""
+
+import argparse
+import hashlib
+import json
+import shlex
+import subprocess
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+STATE_FILE = Path(".pipeline_state.json")
+
+
+class Stage:
+    """A pipeline step with declared inputs, upstream stages and outputs"""
+
+    def __init__(self, name, run, inputs=(), deps=(), outputs=(), description=""):
+        self.name = name
+        self.run = run
+        self.inputs = list(inputs)  # glob patterns relative to the repo root
+        self.deps = list(deps)
+        self.outputs = list(outputs)
+        self.description = description
+
+    def input_files(self, options=None):
+        files = set()
+        for pattern in self.inputs:
+            if callable(pattern):  # a path that depends on the run's options
+                pattern = pattern(options or {})
+            files.update(p for p in Path('.').glob(pattern) if p.is_file())
+        return sorted(files)
+
+    def fingerprint(self, options, upstream):
+        """Hash of input file stats, stage options and upstream fingerprints"""
+        digest = hashlib.sha256(self.name.encode('utf-8'))
+        for path in self.input_files(options):
+            stat = path.stat()
+            digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8'))
+        digest.update(json.dumps(options.get(self.name), sort_keys=True).encode('utf-8'))
+        for dep in self.deps:
+            digest.update(upstream.get(dep, '').encode('utf-8'))
+        return digest.hexdigest()
+
+    def outputs_exist(self):
+        return all(Path(output).exists() for output in self.outputs)
+
+
+def run_setup_db(context, options):
+    """Recreate slides.db from setup_slides_db_v2.SLIDES"""
+    import setup_slides_db_v2
+    setup_slides_db_v2.create_database()
+    return None
+
+
+def run_organize(context, options):
+    """Copy development slides into slides_complete/"""
+    subprocess.run(['bash', 'organize_slides.sh'], check=True)
+    return None
+
+
+def builder_db(options):
+    """The database the builder reads: its --db option, else slides.db"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--db', default='slides.db')
+    return parser.parse_known_args(options.get('build', []))[0].db
+
+
+def run_load_slides(context, options):
+    """Read the slide list once and share it with downstream stages"""
+    from build_linked_presentation_v2 import load_slides_from_db
+    return load_slides_from_db(builder_db(options))
+
+
+def run_build(context, options):
+    """Build the linked presentation from the in-memory slide list"""
+    import build_linked_presentation_v2
+    output_dir = build_linked_presentation_v2.main(options.get('build', []), slides=context.get('load_slides'))
+    if output_dir is None:
+        raise RuntimeError("the build stopped early; see its messages above")
+    return str(output_dir)
+
+
+def run_capture(context, options):
+    """Screenshot every slide of the latest build whose page changed"""
+    import capture_slides_to_pdf
+    return [str(path) for path in capture_slides_to_pdf.capture_slides(force=options.get('force', False))]
+
+
+def run_pdf(context, options):
+    """Assemble the captured screenshots into VMG_Presentation.pdf"""
+    import capture_slides_to_pdf
+    screenshots = [Path(path) for path in context['capture']]
+    return str(capture_slides_to_pdf.create_pdf_from_screenshots(screenshots, "VMG_Presentation.pdf"))
+
+
+BUILDER_MODULES = ['build_linked_presentation_v2.py', 'asset_pipeline.py', 'minify_html.py',
+                   'optimize_images.py', 'service_worker.py', 'serve_presentation.py', 'page_templates.py',
+                   'search_index.py', 'chart_data.py', 'chart_prerender.py', 'scoring_engine.py',
+                   'maturity_assessment.py', 'financial_model.py', 'growth_projection.py', 'roi_lookup.py',
+                   'scenario_sweep.py', 'monte_carlo.py']
+
+STAGES = {stage.name: stage for stage in [
+    Stage('setup_db', run_setup_db, inputs=['setup_slides_db_v2.py'], outputs=['slides.db'],
+          description="Recreate slides.db (opt-in: overwrites the curated order)"),
+    Stage('organize', run_organize, inputs=['organize_slides.sh', 'slides_dev/**/*.html'],
+          outputs=['slides_complete'],
+          description="Copy slides_dev/ into slides_complete/ (opt-in)"),
+    Stage('load_slides', run_load_slides, inputs=[builder_db], deps=['setup_db'],
+          description="Load the slide list from slides.db (or the builder's --db)"),
+    Stage('build', run_build,
+          inputs=['slides_complete/*', 'presenter.html', 'templates/*'] + BUILDER_MODULES,
+          deps=['load_slides', 'organize'], outputs=['vmg_presentation_latest'],
+          description="Build the linked presentation"),
+    Stage('capture', run_capture, inputs=['capture_slides_to_pdf.py'], deps=['build'],
+          outputs=['slide_captures'], description="Screenshot every slide with Selenium"),
+    Stage('pdf', run_pdf, deps=['capture'], outputs=['VMG_Presentation.pdf'],
+          description="Assemble screenshots into VMG_Presentation.pdf"),
+]}
+
+# Stages that overwrite hand-maintained inputs only run when asked for
+OPT_IN_STAGES = {'setup_db', 'organize'}
+
+
+def load_state():
+    if STATE_FILE.exists():
+        with open(STATE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def save_state(state):
+    tmp_path = STATE_FILE.with_name(STATE_FILE.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=1)
+    tmp_path.replace(STATE_FILE)
+
+
+def resolve_stages(targets, enabled_opt_in):
+    """Return the targets plus their transitive dependencies"""
+    needed = set()
+
+    def visit(name):
+        if name in needed or (name in OPT_IN_STAGES and name not in enabled_opt_in):
+            return
+        needed.add(name)
+        for dep in STAGES[name].deps:
+            visit(dep)
+
+    for target in targets:
+        visit(target)
+    return needed
+
+
+def run_pipeline(targets, force=False, jobs=2, dry_run=False, enabled_opt_in=(), options=None):
+    """Run the needed stages in dependency order, concurrently where possible"""
+    options = options or {}
+    needed = resolve_stages(targets, set(enabled_opt_in))
+    state = load_state()
+    context = {}
+    fingerprints = {}
+    done = set()
+    remaining = set(needed)
+
+    print("🚀 Running VMG pipeline: " + ', '.join(name for name in STAGES if name in needed))
+    print("=" * 50)
+
+    def ready(name):
+        return all(dep in done or dep not in needed for dep in STAGES[name].deps)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        running = {}
+        while remaining or running:
+            for name in [n for n in STAGES if n in remaining and ready(n)]:
+                remaining.discard(name)
+                stage = STAGES[name]
+                fingerprint = stage.fingerprint(options, fingerprints)
+                fingerprints[name] = fingerprint
+                cached = state.get(name)
+
+                if not force and cached and cached['fingerprint'] == fingerprint and stage.outputs_exist():
+                    print(f"  ⏭️  {name}: up to date")
+                    context[name] = cached.get('result')
+                    done.add(name)
+                    continue
+                if dry_run:
+                    print(f"  🔸 {name}: would run ({stage.description})")
+                    done.add(name)
+                    continue
+
+                print(f"  ▶️  {name}: {stage.description}")
+                upstream = {dep: context.get(dep) for dep in stage.deps}
+                running[pool.submit(stage.run, upstream, options)] = name
+
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                result = future.result()  # a failed stage stops the pipeline
+                context[name] = result
+                state[name] = {'fingerprint': fingerprints[name], 'result': result}
+                save_state(state)
+                done.add(name)
+                print(f"  ✅ {name}: done")
+
+    print("=" * 50)
+    print("✨ Pipeline complete")
+    return context
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the VMG presentation pipeline")
+    parser.add_argument('targets', nargs='*', metavar='target',
+                        help=f"Stages to bring up to date (default: build; any of {', '.join(STAGES)})")
+    parser.add_argument('--force', action='store_true', help="Rerun stages even if their inputs are unchanged")
+    parser.add_argument('--dry-run', action='store_true', help="Show which stages would run")
+    parser.add_argument('--jobs', type=int, default=2, help="Stages to run concurrently (default: 2)")
+    parser.add_argument('--with-setup', action='store_true',
+                        help="Also run setup_db and organize (overwrites slides.db and slides_complete/)")
+    parser.add_argument('--build-args', default='',
+                        help="Options forwarded to the builder, e.g. --build-args=\"--minify --offline\"")
+    args = parser.parse_args(argv)
+    unknown = [target for target in args.targets if target not in STAGES]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)}")
+
+    enabled_opt_in = OPT_IN_STAGES if args.with_setup else set(args.targets) & OPT_IN_STAGES
+    options = {'build': shlex.split(args.build_args), 'force': args.force}
+    run_pipeline(args.targets or ['build'], args.force, args.jobs, args.dry_run, enabled_opt_in, options)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Scenario sweeps and sensitivity analysis over the ROI model
+Evaluates financial_model over a full Cartesian grid or a Latin-hypercube
+sample of the ROI slide's inputs. Scenarios are evaluated a chunk at a time
+(bounding memory) across worker processes, and the results are written to
+sensitivity.json: tornado-chart bars (the NPV swing of each input over its
+range), an NPV heatmap over two inputs, and percentiles of the whole sweep.
+The builder embeds the same data in the ROI sensitivity slide, around the
+deck's inputs (a client's, for client decks); the sweep is cached by a hash
+of the inputs it does not sweep, so client decks that differ only in swept
+inputs share it
+
+Usage:
+    python scenario_sweep.py                        # 20,000-scenario Latin hypercube
+    python scenario_sweep.py --grid --steps 9       # every combination, 9 values per input
+    python scenario_sweep.py --heatmap discount_rate operating_cost --csv scenarios.csv
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import financial_model
+
+OUTPUT_FILE = "sensitivity.json"
+
+# Id of the JSON data script in the sensitivity slide
+DATA_ID = 'sensitivity-data'
+
+# Inputs swept and their (low, high) range; the rest stay at the base inputs
+SWEEP_RANGES = {
+    'rev_per_customer': (500.0, 2000.0),
+    'operating_cost': (1500.0, 4000.0),
+    'op_cost_growth': (0.0, 15.0),
+    'customers_per_quarter': (0.5, 3.0),
+    'discount_rate': (5.0, 20.0),
+    'npv_years': (3, 10),
+}
+
+# Labels as on the ROI slide's input card
+INPUT_LABELS = {
+    'discount_rate': 'Discount %',
+    'npv_years': 'Years',
+    'initial_investment': 'Initial Invest ($)',
+    'rev_per_customer': 'Monthly Inflows/Customer ($)',
+    'customers_per_quarter': 'New Cust/Qtr',
+    'operating_cost': 'Op Cost ($/month)',
+    'op_cost_growth': 'Annual Cost Growth %',
+}
+
+DEFAULT_SAMPLES = 20000
+DEFAULT_CHUNK_SIZE = 20000
+DEFAULT_HEATMAP = ('customers_per_quarter', 'rev_per_customer')
+HEATMAP_STEPS = 11
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def axis_values(name, steps):
+    """Evenly spaced values of an input over its sweep range"""
+    low, high = SWEEP_RANGES[name]
+    values = np.linspace(low, high, steps)
+    return np.unique(np.round(values)) if name == 'npv_years' else values
+
+
+def grid_size(steps):
+    return math.prod(len(axis_values(name, steps)) for name in SWEEP_RANGES)
+
+
+def grid_chunk(steps, start, stop):
+    """Scenarios start..stop of the Cartesian grid, generated without the full grid"""
+    axes = [axis_values(name, steps) for name in SWEEP_RANGES]
+    indices = np.unravel_index(np.arange(start, stop), [len(axis) for axis in axes])
+    return {name: axis[index] for (name, axis), index in zip(zip(SWEEP_RANGES, axes), indices)}
+
+
+def latin_hypercube(samples, seed=0):
+    """Latin-hypercube sample of the sweep ranges: each input's range is cut
+    into `samples` strata and every stratum is used exactly once"""
+    rng = np.random.default_rng(seed)
+    scenarios = {}
+    for name, (low, high) in SWEEP_RANGES.items():
+        strata = (rng.permutation(samples) + rng.random(samples)) / samples
+        if name == 'npv_years':
+            # Equal-width bins per whole year
+            scenarios[name] = np.floor(low + strata * (high - low + 1)).clip(low, high)
+        else:
+            scenarios[name] = low + strata * (high - low)
+    return scenarios
+
+
+def evaluate_scenarios(scenarios):
+    """NPV, IRR and payback month of each scenario
+
+    financial_model needs one horizon per call, so scenarios are grouped by
+    npv_years and each group is evaluated as one array
+    """
+    years = np.asarray(scenarios.get('npv_years', financial_model.DEFAULT_INPUTS['npv_years']))
+    size = max(len(np.atleast_1d(values)) for values in scenarios.values())
+    years = np.broadcast_to(years, (size,)).astype(int)
+    results = {key: np.empty(size) for key in ('npv', 'irr', 'payback_month')}
+
+    for horizon in np.unique(years):
+        rows = years == horizon
+        inputs = financial_model.model_inputs(**{
+            name: np.broadcast_to(values, (size,))[rows]
+            for name, values in scenarios.items() if name != 'npv_years'
+        })
+        inputs['npv_years'] = int(horizon)
+        evaluated = financial_model.evaluate(inputs)
+        for key in results:
+            results[key][rows] = evaluated[key]
+    return results
+
+
+def _evaluate_chunk(job):
+    """Worker entry point: job is (base, 'grid', steps, start, stop) or (base, 'sample', scenarios)"""
+    base, kind, *args = job
+    scenarios = grid_chunk(*args) if kind == 'grid' else args[0]
+    return scenarios, evaluate_scenarios(dict(base, **scenarios))
+
+
+def sweep(grid_steps=None, samples=DEFAULT_SAMPLES, seed=0, chunk_size=DEFAULT_CHUNK_SIZE, workers=None,
+          base=None):
+    """Evaluate a Cartesian grid (grid_steps values per input) or a
+    Latin-hypercube sample, with the inputs not swept at base; returns the
+    scenario inputs and their results"""
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be at least 1")
+    if grid_steps is not None and grid_steps < 1:
+        raise ValueError("A grid needs at least 1 step per input")
+    if not grid_steps and samples < 1:
+        raise ValueError("The sweep needs at least 1 sample")
+    base = fixed_inputs(base)
+    if grid_steps:
+        total = grid_size(grid_steps)
+        jobs = [(base, 'grid', grid_steps, start, min(start + chunk_size, total))
+                for start in range(0, total, chunk_size)]
+    else:
+        sample = latin_hypercube(samples, seed)
+        jobs = [(base, 'sample', {name: values[start:start + chunk_size] for name, values in sample.items()})
+                for start in range(0, samples, chunk_size)]
+
+    if len(jobs) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_evaluate_chunk, jobs))
+    else:
+        chunks = [_evaluate_chunk(job) for job in jobs]
+
+    scenarios = {name: np.concatenate([chunk[0][name] for chunk in chunks]) for name in SWEEP_RANGES}
+    results = {key: np.concatenate([chunk[1][key] for chunk in chunks]) for key in chunks[0][1]}
+    return scenarios, results
+
+
+def fixed_inputs(base=None):
+    """The base inputs a sweep holds fixed (those it does not sweep)"""
+    inputs = financial_model.model_inputs(**(base or {}))
+    return {name: value for name, value in inputs.items() if name not in SWEEP_RANGES}
+
+
+def tornado(base=None):
+    """NPV and IRR with each input at the ends of its range, others at the
+    base case, widest NPV swing first"""
+    base = financial_model.model_inputs(**(base or {}))
+    bars = []
+    for name, (low, high) in SWEEP_RANGES.items():
+        ends = evaluate_scenarios(dict(base, **{name: np.array([low, high])}))
+        bars.append({
+            'input': name,
+            'label': INPUT_LABELS[name],
+            'low': low,
+            'high': high,
+            'npv_low': float(ends['npv'][0]),
+            'npv_high': float(ends['npv'][1]),
+            'irr_low': _optional(ends['irr'][0]),
+            'irr_high': _optional(ends['irr'][1]),
+        })
+    bars.sort(key=lambda bar: -abs(bar['npv_high'] - bar['npv_low']))
+    return {'base_npv': float(evaluate_scenarios(base)['npv'][0]), 'bars': bars}
+
+
+def check_heatmap_inputs(x_input, y_input):
+    """Raise ValueError unless the heatmap axes are two different sweep inputs"""
+    for name in (x_input, y_input):
+        if name not in SWEEP_RANGES:
+            raise ValueError(f"Unknown sweep input: {name} (choose from {', '.join(SWEEP_RANGES)})")
+    if x_input == y_input:
+        raise ValueError(f"The heatmap needs two different inputs, not {x_input} twice")
+
+
+def heatmap(x_input, y_input, steps=HEATMAP_STEPS, base=None):
+    """NPV over a grid of two inputs, others at the base case"""
+    check_heatmap_inputs(x_input, y_input)
+    base = financial_model.model_inputs(**(base or {}))
+    x_values, y_values = axis_values(x_input, steps), axis_values(y_input, steps)
+    y_grid, x_grid = np.meshgrid(y_values, x_values, indexing='ij')
+    npv = evaluate_scenarios(dict(base, **{x_input: x_grid.ravel(), y_input: y_grid.ravel()}))['npv']
+    return {
+        'x': {'input': x_input, 'label': INPUT_LABELS[x_input], 'values': x_values.tolist()},
+        'y': {'input': y_input, 'label': INPUT_LABELS[y_input], 'values': y_values.tolist()},
+        'npv': npv.reshape(y_grid.shape).round(2).tolist(),
+    }
+
+
+def summarize(results):
+    """Percentiles of each result across the sweep"""
+    payback = results['payback_month'].astype(float)
+    payback[payback == 0] = np.nan  # never paid back
+    summary = {'scenarios': len(results['npv']),
+               'positive_npv_share': float((results['npv'] > 0).mean()),
+               'payback_share': float(np.isfinite(payback).mean())}
+    for key, values in (('npv', results['npv']), ('irr', results['irr']), ('payback_month', payback)):
+        finite = values[np.isfinite(values)]
+        summary[key] = ({f'p{p}': float(v) for p, v in zip(PERCENTILES, np.percentile(finite, PERCENTILES))}
+                        if len(finite) else None)
+    return summary
+
+
+def _optional(value):
+    return None if math.isnan(value) else float(value)
+
+
+def describe(grid_steps=None, seed=0):
+    return f'grid ({grid_steps} steps)' if grid_steps else f'latin hypercube (seed {seed})'
+
+
+def sensitivity_data(summary, method, heatmap_inputs=DEFAULT_HEATMAP, base=None):
+    """Tornado and heatmap around base, plus a sweep summary, as embedded
+    in the sensitivity slide"""
+    return {
+        'ranges': {name: list(bounds) for name, bounds in SWEEP_RANGES.items()},
+        'method': method,
+        'tornado': tornado(base),
+        'heatmap': heatmap(*heatmap_inputs, base=base),
+        'summary': summary,
+    }
+
+
+def sweep_summary(samples=DEFAULT_SAMPLES, seed=0, base=None):
+    """Summary of a Latin-hypercube sweep, cached by the inputs it holds fixed"""
+    def compute():
+        return summarize(sweep(samples=samples, seed=seed, workers=1, base=base)[1])
+
+    return financial_model.cached_analysis('sweep', compute, samples=samples, seed=seed,
+                                           base=fixed_inputs(base), ranges=SWEEP_RANGES)
+
+
+def embed_sensitivity(soup, base=None, samples=DEFAULT_SAMPLES):
+    """Fill the sensitivity slide's data script in place, around the base inputs
+
+    Returns the data, or None for slides without one
+    """
+    script = soup.find('script', id=DATA_ID)
+    if script is None:
+        return None
+    data = sensitivity_data(sweep_summary(samples, base=base), describe(), base=base)
+    script.string = json.dumps(data, separators=(',', ':')).replace('</', '<\\/')
+    return data
+
+
+def write_csv(path, scenarios, results):
+    """One row per scenario: its inputs then NPV, IRR and payback month"""
+    columns = list(scenarios) + list(results)
+    data = np.column_stack([scenarios[name] for name in scenarios] + [results[key] for key in results])
+    np.savetxt(path, data, delimiter=',', header=','.join(columns), comments='', fmt='%.6g')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep the ROI model's inputs and write sensitivity data")
+    parser.add_argument('--grid', action='store_true', help="Evaluate every combination instead of sampling")
+    parser.add_argument('--steps', type=int, default=7, help="Values per input with --grid (default: 7)")
+    parser.add_argument('--samples', type=int, default=DEFAULT_SAMPLES,
+                        help=f"Latin-hypercube scenarios (default: {DEFAULT_SAMPLES})")
+    parser.add_argument('--seed', type=int, default=0, help="Sampling seed (default: 0)")
+    parser.add_argument('--heatmap', nargs=2, default=DEFAULT_HEATMAP, metavar=('X', 'Y'),
+                        help=f"Inputs for the NPV heatmap (default: {' '.join(DEFAULT_HEATMAP)})")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Scenarios evaluated per array pass (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--output', default=OUTPUT_FILE, help=f"Sensitivity data file (default: {OUTPUT_FILE})")
+    parser.add_argument('--csv', help="Also write every scenario and its results to this CSV file")
+    args = parser.parse_args(argv)
+
+    grid_steps = args.steps if args.grid else None
+    started = time.perf_counter()
+    try:
+        check_heatmap_inputs(*args.heatmap)  # before the sweep, not after it
+        scenarios, results = sweep(grid_steps, args.samples, args.seed, args.chunk_size, args.workers)
+        data = sensitivity_data(summarize(results), describe(grid_steps, args.seed), args.heatmap)
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    if args.csv:
+        write_csv(args.csv, scenarios, results)
+
+    summary = data['summary']
+    print(f"📊 {summary['scenarios']:,} scenarios ({data['method']}) in {elapsed:.2f}s")
+    print(f"  NPV > 0 in {summary['positive_npv_share']:.0%} of scenarios")
+    print("  NPV percentiles: " + ', '.join(f"{p} ${v:,.0f}" for p, v in summary['npv'].items()))
+    print(f"  Widest NPV swings (base case ${data['tornado']['base_npv']:,.0f}):")
+    for bar in data['tornado']['bars']:
+        print(f"    {bar['label']:<30} ${bar['npv_low']:>12,.0f} → ${bar['npv_high']:>12,.0f}")
+    print(f"  ✅ Wrote {args.output}" + (f" and {args.csv}" if args.csv else ''))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Weighted scoring engine for the AI initiative slides
+The criteria (with their weights), the initiatives and every factor score
+and justification live in slides.db. Weighted totals on the slides' 10-point
+scale and the ranking are computed with NumPy for all initiatives at once,
+and the builder generates the five detailed score tables and the
+prioritization slide (ranked list and bubble matrix) from them, so the
+numbers on those slides always agree
+
+Re-weighting a criterion only changes the slides whose figures move; the
+capture manifest then recaptures just those. A client (by client_batch id)
+can have its own weights, which `--client` builds of its deck use
+
+Usage:
+    python scoring_engine.py                                  # ranking
+    python scoring_engine.py rank --weight "Legal Risk=2"     # preview weights without saving
+    python scoring_engine.py weight "Legal Risk" 2            # save a weight
+    python scoring_engine.py weight --client acme-logistics "Legal Risk" 2
+    python scoring_engine.py seed                             # seed the tables from the slides
+"""
+
+import argparse
+import html
+import math
+import sqlite3
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from chart_data import compact_json
+
+DB_PATH = 'slides.db'
+SLIDES_DIR = Path("slides_complete")
+
+MAX_FACTOR_SCORE = 5
+SCALE = 10
+
+# Category -> title of its table on the score slides
+CATEGORIES = {
+    'ease': 'Implementation Ease',
+    'impact': 'Business Impact',
+}
+
+# The prioritization slide: bubble matrix dataset and ranked list
+MATRIX_SLIDE = 'slide_14_strategic_prioritization'
+MATRIX_CHART_ID = 'initiatives'
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS score_criteria (
+        criterion TEXT PRIMARY KEY,
+        category TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        weight REAL NOT NULL DEFAULT 1.0
+    );
+    CREATE TABLE IF NOT EXISTS initiatives (
+        initiative TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        short_name TEXT NOT NULL,
+        slide TEXT NOT NULL,
+        color TEXT NOT NULL,
+        position INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS client_weights (
+        client TEXT NOT NULL,
+        criterion TEXT NOT NULL,
+        weight REAL NOT NULL,
+        PRIMARY KEY (client, criterion)
+    );
+    CREATE TABLE IF NOT EXISTS initiative_scores (
+        initiative TEXT NOT NULL,
+        criterion TEXT NOT NULL,
+        score INTEGER NOT NULL,
+        justification TEXT NOT NULL DEFAULT '',
+        PRIMARY KEY (initiative, criterion)
+    );
+'''
+
+# Used by `seed`: initiative id, score slide, matrix label, bubble color
+SEED_INITIATIVES = [
+    ('content_generation', 'slide_24_content_scores', 'Content Generation', '#667eea'),
+    ('discovery_suite', 'slide_26_discovery_scores', 'Discovery Suite', '#764ba2'),
+    ('command_center', 'slide_28_command_scores', 'Command Center', '#f39c12'),
+    ('continuous_monitor', 'slide_30_monitor_scores', 'Continuous Monitor', '#e67e22'),
+    ('knowledge_system', 'slide_32_knowledge_scores', 'Knowledge System', '#95a5a6'),
+]
+
+
+def load_client_weights(conn, client):
+    """{criterion: weight} a client overrides; empty without client_weights"""
+    try:
+        return dict(conn.execute('SELECT criterion, weight FROM client_weights WHERE client = ?',
+                                 (client,)).fetchall())
+    except sqlite3.OperationalError:
+        return {}
+
+
+def load_scoring(db_path=DB_PATH, client=None):
+    """Criteria, initiatives and score matrix from slides.db, with the
+    client's own weights (client_weights) where it has any
+
+    Returns None for databases without the scoring tables
+    """
+    if not Path(db_path).exists():
+        return None
+    conn = sqlite3.connect(db_path)
+    try:
+        criteria = conn.execute(
+            'SELECT criterion, category, weight FROM score_criteria ORDER BY position').fetchall()
+        initiatives = conn.execute(
+            'SELECT initiative, name, short_name, slide, color FROM initiatives ORDER BY position').fetchall()
+        rows = conn.execute('SELECT initiative, criterion, score, justification FROM initiative_scores').fetchall()
+        client_weights = load_client_weights(conn, client) if client else {}
+    except sqlite3.OperationalError:
+        return None
+    finally:
+        conn.close()
+    if not criteria or not initiatives:
+        return None
+    criteria = [(c, category, client_weights.get(c, w)) for c, category, w in criteria]
+
+    row_index = {row[0]: i for i, row in enumerate(initiatives)}
+    column_index = {row[0]: j for j, row in enumerate(criteria)}
+    scores = np.zeros((len(initiatives), len(criteria)))
+    justifications = [[''] * len(criteria) for _ in initiatives]
+    for initiative, criterion, score, justification in rows:
+        if initiative in row_index and criterion in column_index:
+            i, j = row_index[initiative], column_index[criterion]
+            scores[i, j] = score
+            justifications[i][j] = justification
+    return {
+        'criteria': [{'criterion': c, 'category': category, 'weight': w} for c, category, w in criteria],
+        'initiatives': [dict(zip(('initiative', 'name', 'short_name', 'slide', 'color'), row))
+                        for row in initiatives],
+        'scores': scores,
+        'justifications': justifications,
+    }
+
+
+def weighted_totals(scores, weights, categories):
+    """Weighted category totals on the 10-point scale
+
+    scores is (initiatives, criteria); weights is (criteria,) or a batch of
+    weight sets (..., criteria), giving totals of shape (..., initiatives,
+    categories) in the order of CATEGORIES
+    """
+    weights = np.asarray(weights, dtype=float)
+    membership = (np.asarray(categories)[None, :] == np.array(list(CATEGORIES))[:, None]).astype(float)
+    weighted = np.einsum('ic,...c,gc->...ig', scores, weights, membership)
+    maxima = MAX_FACTOR_SCORE * np.einsum('...c,gc->...g', weights, membership)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(maxima[..., None, :] > 0, SCALE * weighted / maxima[..., None, :], 0.0)
+
+
+def rankings(totals):
+    """1-based rank by combined total; ties keep the initiatives' order"""
+    combined = totals.sum(axis=-1)
+    order = np.argsort(-combined, axis=-1, kind='stable')
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, order.shape[-1] + 1), axis=-1)
+    return ranks
+
+
+def score_initiatives(scoring, weights=None):
+    """Per-initiative totals, rank and factor rows, in the initiatives' order
+
+    weights maps criterion names to weights overriding those in slides.db
+    """
+    weights = dict(weights or {})
+    unknown = set(weights) - {c['criterion'] for c in scoring['criteria']}
+    if unknown:
+        raise ValueError(f"Unknown criterion(s): {', '.join(sorted(unknown))}")
+    criteria = [dict(c, weight=float(weights.get(c['criterion'], c['weight']))) for c in scoring['criteria']]
+    totals = weighted_totals(scoring['scores'], [c['weight'] for c in criteria],
+                             [c['category'] for c in criteria])
+    ranks = rankings(totals)
+
+    results = []
+    for i, initiative in enumerate(scoring['initiatives']):
+        category_totals = dict(zip(CATEGORIES, totals[i].tolist()))
+        results.append(dict(
+            initiative,
+            **category_totals,
+            score=sum(category_totals.values()),
+            rank=int(ranks[i]),
+            factors=[dict(criterion, score=int(scoring['scores'][i, j]),
+                          justification=scoring['justifications'][i][j])
+                     for j, criterion in enumerate(criteria)],
+        ))
+    return results
+
+
+def _round(value):
+    """Round half up to one decimal, as shown on the slides"""
+    return math.floor(value * 10 + 0.5 + 1e-9) / 10
+
+
+def display_scores(result):
+    """Ease, impact and combined score as shown on the slides; the combined
+    score is the sum of the rounded figures so the three always add up"""
+    ease, impact = _round(result['ease']), _round(result['impact'])
+    return {'ease': f"{ease:.1f}", 'impact': f"{impact:.1f}", 'score': f"{ease + impact:.1f}"}
+
+
+def matrix_dataset(results):
+    """The prioritization matrix's chart dataset as compact JSON"""
+    return compact_json([
+        {
+            'name': result['short_name'],
+            'ease': round(result['ease'], 2),
+            'impact': round(result['impact'], 2),
+            'priority': str(result['rank']),
+            'color': result['color'],
+            'size': round(2 * result['score']),
+        }
+        for result in results
+    ])
+
+
+def _fragment(markup):
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(markup, 'html.parser')
+
+
+def score_rows(factors):
+    """<tr> markup for one category's factors"""
+    return ''.join(
+        f'<tr><td>{html.escape(f["criterion"])}</td>'
+        f'<td class="score-{f["score"]}">{f["score"]}/{MAX_FACTOR_SCORE}</td>'
+        f'<td>{html.escape(f["justification"])}</td></tr>'
+        for f in factors)
+
+
+def render_score_tables(soup, result):
+    """Rewrite a score slide's tables (marked data-score-category) and titles
+
+    Returns the number of tables written
+    """
+    shown = display_scores(result)
+    written = 0
+    for section in soup.find_all(attrs={'data-score-category': True}):
+        category = section['data-score-category']
+        if category not in CATEGORIES:
+            continue
+        title = section.find(class_='table-title')
+        if title is not None:
+            title.string = f"{CATEGORIES[category]} (Score: {shown[category]}/{SCALE})"
+        tbody = section.find('tbody')
+        if tbody is not None:
+            tbody.clear()
+            tbody.append(_fragment(score_rows([f for f in result['factors'] if f['category'] == category])))
+            written += 1
+    return written
+
+
+def render_ranked_list(soup, results):
+    """Rewrite the prioritization slide's ranked list and its top pick
+
+    Returns True when the slide has a list to fill
+    """
+    listing = soup.find(class_='matrix-list')
+    if listing is None:
+        return False
+    items = []
+    for result in sorted(results, key=lambda r: r['rank']):
+        shown = display_scores(result)
+        first = result['rank'] == 1
+        items.append(
+            f'<div class="initiative-item{" priority" if first else ""}">'
+            f'<div class="initiative-number">{result["rank"]}</div>'
+            f'<div class="initiative-details">'
+            f'<div class="initiative-name">{html.escape(result["name"])}</div>'
+            f'<div class="initiative-score">Impact: {shown["impact"]} | Ease: {shown["ease"]} | '
+            f'Score: {shown["score"]}</div>'
+            f'</div>'
+            + ('<div class="start-label">START HERE</div>' if first else '')
+            + '</div>')
+    listing.clear()
+    listing.append(_fragment(''.join(items)))
+    top = soup.find(attrs={'data-top-initiative': True})
+    if top is not None:
+        top.string = min(results, key=lambda r: r['rank'])['name']
+    return True
+
+
+def embed_scores(soup, slide_name, results):
+    """Generate the scoring figures of a score or prioritization slide
+
+    Returns True when the slide was one of them
+    """
+    if slide_name == MATRIX_SLIDE:
+        return render_ranked_list(soup, results)
+    for result in results:
+        if result['slide'] == slide_name:
+            return render_score_tables(soup, result) > 0
+    return False
+
+
+def affected_slides(before, after):
+    """Slides whose generated figures differ between two sets of results"""
+    def shown(result):
+        return display_scores(result), [(f['criterion'], f['score'], f['justification']) for f in result['factors']]
+
+    slides = [b['slide'] for b, a in zip(before, after) if shown(b) != shown(a)]
+    if slides or matrix_dataset(before) != matrix_dataset(after):
+        slides.insert(0, MATRIX_SLIDE)
+    return slides
+
+
+def seed(db_path=DB_PATH, overwrite=False):
+    """Fill the scoring tables from the score slides' own tables
+
+    Returns the number of factor scores written
+    """
+    from bs4 import BeautifulSoup
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(SCHEMA)
+        if overwrite:
+            conn.executescript('DELETE FROM score_criteria; DELETE FROM initiatives; DELETE FROM initiative_scores;')
+        sources = dict(conn.execute('SELECT name, source FROM slides').fetchall())
+        titles = {title: category for category, title in CATEGORIES.items()}
+        written = 0
+        for position, (initiative, slide, short_name, color) in enumerate(SEED_INITIATIVES):
+            path = SLIDES_DIR / sources.get(slide, f'{slide}.html')
+            if not path.exists():
+                print(f"  ⚠️  {path} not found, skipping {initiative}")
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                soup = BeautifulSoup(f.read(), 'html.parser')
+            name = soup.h1.get_text(strip=True).split(' - ')[0]
+            conn.execute('INSERT OR IGNORE INTO initiatives VALUES (?, ?, ?, ?, ?, ?)',
+                         (initiative, name, short_name, slide, color, position))
+            for section in soup.find_all(class_='table-section'):
+                title = section.find(class_='table-title').get_text(strip=True)
+                category = titles[title.split(' (')[0]]
+                for row in section.tbody.find_all('tr'):
+                    factor, score, justification = (td.get_text(strip=True) for td in row.find_all('td'))
+                    count = conn.execute('SELECT COUNT(*) FROM score_criteria').fetchone()[0]
+                    conn.execute('INSERT OR IGNORE INTO score_criteria (criterion, category, position) '
+                                 'VALUES (?, ?, ?)', (factor, category, count))
+                    conn.execute('INSERT OR IGNORE INTO initiative_scores VALUES (?, ?, ?, ?)',
+                                 (initiative, factor, int(score.split('/')[0]), justification))
+                    written += 1
+        conn.commit()
+    finally:
+        conn.close()
+    return written
+
+
+def _parse_weights(values, parser):
+    weights = {}
+    for value in values:
+        name, _, number = value.rpartition('=')
+        try:
+            weights[name] = float(number)
+        except ValueError:
+            parser.error(f"--weight expects NAME=VALUE, got {value!r}")
+        if not weights[name] >= 0:
+            parser.error("weights must not be negative")
+    return weights
+
+
+def print_ranking(results, weights=None, client=None):
+    preview = ', '.join(f"{name}={value:g}" for name, value in (weights or {}).items())
+    print(f"🏆 Initiative ranking{f' for {client}' if client else ''}"
+          f"{f' (preview weights: {preview})' if preview else ''}")
+    print(f"  {'#':>2}  {'Initiative':<34} {'Ease':>5} {'Impact':>7} {'Score':>6}")
+    for result in sorted(results, key=lambda r: r['rank']):
+        shown = display_scores(result)
+        print(f"  {result['rank']:>2}  {result['name']:<34} {shown['ease']:>5} {shown['impact']:>7} {shown['score']:>6}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Weighted initiative scores stored in slides.db")
+    parser.add_argument('--db', default=DB_PATH, help=f"Database path (default: {DB_PATH})")
+    commands = parser.add_subparsers(dest='command')
+    rank = commands.add_parser('rank', help="Print the ranking (the default command)")
+    rank.add_argument('--weight', action='append', default=[], metavar='NAME=VALUE',
+                      help="Preview a criterion weight without saving it (repeatable)")
+    rank.add_argument('--client', help="Rank with this client's weights (a client_batch id)")
+    weight = commands.add_parser('weight', help="Save a criterion weight")
+    weight.add_argument('--client', help="Save the weight for this client's decks only (a client_batch id)")
+    weight.add_argument('criterion', help="Criterion, e.g. 'Legal Risk'")
+    weight.add_argument('value', type=float, help="Weight (default weights are 1)")
+    seed_parser = commands.add_parser('seed', help="Seed the tables from the score slides")
+    seed_parser.add_argument('--overwrite', action='store_true', help="Replace the existing scoring tables")
+    args = parser.parse_args(argv)
+
+    if not Path(args.db).exists():
+        print(f"❌ Error: {args.db} not found!")
+        sys.exit(1)
+
+    if args.command == 'seed':
+        written = seed(args.db, args.overwrite)
+        print(f"📊 Seeded {written} factor score(s)")
+        return
+
+    client = getattr(args, 'client', None)
+    if client:
+        from client_batch import load_client_inputs
+        if load_client_inputs(client, args.db) is None:
+            parser.error(f"unknown client {client!r}; import it first with `python client_batch.py import`")
+    scoring = load_scoring(args.db, client)
+    if scoring is None:
+        print("No scoring tables yet; run `python scoring_engine.py seed` to seed them from the slides")
+        sys.exit(1)
+
+    if args.command == 'weight':
+        if not args.value >= 0:
+            parser.error("weights must not be negative")
+        before = score_initiatives(scoring)
+        try:
+            after = score_initiatives(scoring, {args.criterion: args.value})
+        except ValueError as e:
+            parser.error(str(e))
+        conn = sqlite3.connect(args.db)
+        try:
+            if client:
+                # Every other deck keeps the shared weight in score_criteria
+                conn.executescript(SCHEMA)
+                conn.execute('INSERT OR REPLACE INTO client_weights VALUES (?, ?, ?)',
+                             (client, args.criterion, args.value))
+            else:
+                conn.execute('UPDATE score_criteria SET weight = ? WHERE criterion = ?',
+                             (args.value, args.criterion))
+            conn.commit()
+        finally:
+            conn.close()
+        print(f"✅ {args.criterion} weight set to {args.value:g}{f' for {client}' if client else ''}")
+        print_ranking(after, client=client)
+        slides = affected_slides(before, after)
+        print(f"\n  Affected slides: {', '.join(slides) if slides else 'none'}")
+        return
+
+    weights = _parse_weights(getattr(args, 'weight', []), parser)
+    try:
+        results = score_initiatives(scoring, weights)
+    except ValueError as e:
+        parser.error(str(e))
+    print_ranking(results, weights, client)
+    if weights:
+        slides = affected_slides(score_initiatives(scoring), results)
+        print(f"\n  Slides that would change: {', '.join(slides) if slides else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
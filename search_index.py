@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Full-text search over slide content
+The builder feeds each slide's visible text into a SearchIndex while it
+processes the slide, and writes a compact inverted index (stemmed terms with
+position lists) to search_index.json; the same index is embedded in
+presenter.html for the in-browser search box
+
+Usage:
+    python search_index.py "competitive landscape"
+    python search_index.py '"market share"' --index vmg_presentation_latest/search_index.json
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+from pathlib import Path
+
+INDEX_FILE = "search_index.json"
+INDEX_VERSION = 1
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:['’][a-z]+)?")
+PHRASE_PATTERN = re.compile(r'"([^"]+)"|(\S+)')
+
+# Elements whose text is never shown on the slide
+HIDDEN_TAGS = ['script', 'style', 'noscript', 'template', 'head']
+
+STOP_WORDS = frozenset("""
+    a an and are as at be but by for from has have in into is it its of on or
+    that the their this to was were will with
+""".split())
+
+# Suffix rules for the light stemmer, tried in order; the first match wins.
+# presenter.html mirrors these rules, so keep the two in sync
+SUFFIX_RULES = [
+    ('ational', 'ate'), ('ization', 'ize'), ('fulness', 'ful'), ('iveness', 'ive'),
+    ('ations', 'ate'), ('ation', 'ate'), ('ments', ''), ('ment', ''), ('ness', ''),
+    ('ings', ''), ('ing', ''), ('edly', ''), ('sses', 'ss'), ('shes', 'sh'), ('ches', 'ch'),
+    ('xes', 'x'), ('ies', 'y'), ('ied', 'y'), ('ly', ''), ('ed', ''), ('s', ''),
+]
+MIN_STEM = 3
+
+
+def stem(word):
+    """Strip one common English suffix, then a trailing 'e'"""
+    if word.isdigit():
+        return word
+    for suffix, replacement in SUFFIX_RULES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM:
+            if suffix == 's' and word[-2] in 'su':
+                break
+            word = word[:-len(suffix)] + replacement
+            break
+    if word.endswith('e') and len(word) > MIN_STEM + 1:
+        word = word[:-1]
+    return word
+
+
+def tokenize(text):
+    """Lowercase, split and stem text, dropping stop words"""
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(text.lower().replace('’', "'")):
+        word = match.group().split("'")[0]
+        if word not in STOP_WORDS:
+            tokens.append(stem(word))
+    return tokens
+
+
+def visible_text(soup):
+    """Text of a parsed slide as the audience sees it"""
+    root = soup.body or soup
+    parts = []
+    for string in root.find_all(string=True):
+        if string.find_parent(HIDDEN_TAGS) is None and string.strip():
+            parts.append(string.strip())
+    return ' '.join(parts)
+
+
+class SearchIndex:
+    """Inverted index of stemmed terms to per-slide position lists"""
+
+    def __init__(self):
+        self.docs = []  # [number, title, file]
+        self.postings = {}  # term -> {doc id: [positions]}
+
+    def add_slide(self, slide_info, filename, soup):
+        """Index a slide's title and visible text"""
+        doc_id = len(self.docs)
+        self.docs.append([int(slide_info['num']), slide_info['title'], filename])
+        tokens = tokenize(slide_info['title']) + tokenize(visible_text(soup))
+        for position, term in enumerate(tokens):
+            self.postings.setdefault(term, {}).setdefault(doc_id, []).append(position)
+        return len(tokens)
+
+    def to_json(self):
+        """Compact form: each term maps to a flat list of
+        doc id, position count, then delta-encoded positions, per slide"""
+        terms = {}
+        for term in sorted(self.postings):
+            flat = []
+            for doc_id, positions in self.postings[term].items():
+                flat.extend([doc_id, len(positions)])
+                previous = 0
+                for position in positions:
+                    flat.append(position - previous)
+                    previous = position
+            terms[term] = flat
+        return {'version': INDEX_VERSION, 'docs': self.docs, 'terms': terms}
+
+    def write(self, output_dir):
+        """Write search_index.json into the build directory"""
+        path = Path(output_dir) / INDEX_FILE
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f, separators=(',', ':'), ensure_ascii=False)
+        print(f"  ✅ Created: {INDEX_FILE} ({len(self.docs)} slides, {len(self.postings)} terms, "
+              f"{path.stat().st_size / 1024:.1f} KB)")
+        return path
+
+
+def decode_postings(flat):
+    """Expand a term's flat posting list into {doc id: [positions]}"""
+    postings = {}
+    i = 0
+    while i < len(flat):
+        doc_id, count = flat[i], flat[i + 1]
+        positions = []
+        position = 0
+        for delta in flat[i + 2:i + 2 + count]:
+            position += delta
+            positions.append(position)
+        postings[doc_id] = positions
+        i += 2 + count
+    return postings
+
+
+def load_index(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    if index.get('version') != INDEX_VERSION:
+        raise ValueError(f"{path}: unsupported search index version {index.get('version')}")
+    return index
+
+
+def search(index, query, limit=20):
+    """Slides matching every word of the query; "quoted phrases" must be adjacent
+
+    Returns (score, number, title, file) tuples, best first
+    """
+    groups = []
+    for phrase, word in PHRASE_PATTERN.findall(query):
+        tokens = tokenize(phrase or word)
+        if tokens:
+            groups.append(tokens)
+    if not groups:
+        return []
+
+    total_docs = len(index['docs'])
+    cache = {}
+
+    def postings(term):
+        if term not in cache:
+            cache[term] = decode_postings(index['terms'].get(term, []))
+        return cache[term]
+
+    scores = None
+    for tokens in groups:
+        # Positions where the whole group occurs, keyed by doc
+        matches = dict(postings(tokens[0]))
+        for offset, term in enumerate(tokens[1:], 1):
+            term_postings = postings(term)
+            narrowed = {}
+            for doc_id, positions in matches.items():
+                following = set(term_postings.get(doc_id, ()))
+                kept = [p for p in positions if p + offset in following]
+                if kept:
+                    narrowed[doc_id] = kept
+            matches = narrowed
+
+        idf = math.log(1 + total_docs / (1 + len(matches)))
+        group_scores = {doc_id: len(positions) * idf for doc_id, positions in matches.items()}
+        if scores is None:
+            scores = group_scores
+        else:
+            scores = {doc_id: scores[doc_id] + score for doc_id, score in group_scores.items() if doc_id in scores}
+        if not scores:
+            return []
+
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [(round(score, 3), *index['docs'][doc_id]) for doc_id, score in ranked]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search slide content in a built presentation")
+    parser.add_argument('query', help='Words to find; wrap phrases in double quotes')
+    parser.add_argument('--index', default=f"vmg_presentation_latest/{INDEX_FILE}",
+                        help=f"Search index to query (default: vmg_presentation_latest/{INDEX_FILE})")
+    parser.add_argument('--limit', type=int, default=20, help="Maximum results (default: 20)")
+    args = parser.parse_args(argv)
+
+    if not Path(args.index).exists():
+        print(f"❌ Error: {args.index} not found!")
+        print("   Run build_linked_presentation_v2.py first to build the presentation")
+        sys.exit(1)
+
+    results = search(load_index(args.index), args.query, args.limit)
+    if not results:
+        print(f"🔍 No slides match: {args.query}")
+        return
+    print(f"🔍 {len(results)} slide(s) match: {args.query}")
+    for score, number, title, filename in results:
+        print(f"  {number:>3}. {title:<45} slides/{filename}  ({score:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Serve a built presentation over HTTP instead of file:// URLs
+Uses precompressed .br/.gz siblings generated at build time, strong ETags
+from content hashes, immutable caching for fingerprinted assets and
+HTTP/1.1 keep-alive
+
+Usage:
+    python serve_presentation.py [vmg_presentation_latest] [--port 8000]
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+import re
+import sys
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Text formats worth compressing; images and fonts are already compressed
+COMPRESSIBLE_EXTENSIONS = {'.html', '.css', '.js', '.json', '.svg', '.txt', '.xml', '.map'}
+MIN_COMPRESS_SIZE = 512
+
+# Preferred order when the client accepts several encodings
+ENCODING_SUFFIXES = [('br', '.br'), ('gzip', '.gz')]
+
+# Matches names written by asset_pipeline, e.g. image.ed1c48862983.png
+FINGERPRINT_PATTERN = re.compile(r'\.[0-9a-f]{12}(\.\d+w)?\.[a-z0-9]+$')
+
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE = 'no-cache'
+
+
+def load_brotli():
+    """Import the optional brotli module on first use"""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def precompress_file(path):
+    """Write .gz (and .br when available) siblings next to a file if they are stale"""
+    path = Path(path)
+    brotli = load_brotli()
+    data = None
+    written = 0
+    for encoding, suffix in ENCODING_SUFFIXES:
+        if encoding == 'br' and brotli is None:
+            continue
+        target = path.with_name(path.name + suffix)
+        if target.exists() and target.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            continue
+        if data is None:
+            data = path.read_bytes()
+        if encoding == 'br':
+            compressed = brotli.compress(data, quality=11)
+        else:
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        # Only keep siblings that actually save bytes
+        if len(compressed) < len(data):
+            target.write_bytes(compressed)
+            written += 1
+    return written
+
+
+def precompress_build(output_dir):
+    """Precompress every text file in a build directory"""
+    files = [p for p in Path(output_dir).rglob('*')
+             if p.is_file() and p.suffix.lower() in COMPRESSIBLE_EXTENSIONS
+             and p.stat().st_size >= MIN_COMPRESS_SIZE]
+    written = sum(precompress_file(p) for p in files)
+    encodings = 'br + gzip' if load_brotli() is not None else 'gzip (pip install brotli for .br)'
+    print(f"  ✅ Precompressed {len(files)} files ({written} siblings written, {encodings})")
+    return written
+
+
+_etag_cache = {}
+
+
+def content_etag(path):
+    """Strong ETag from the file's content hash, cached by mtime and size"""
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _etag_cache:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+        _etag_cache[key] = digest.hexdigest()[:20]
+    return _etag_cache[key]
+
+
+class PresentationRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler with precompression, ETags and cache headers"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def accepted_encodings(self):
+        """Parse Accept-Encoding into a set of codings the client accepts"""
+        accepted = set()
+        for item in self.headers.get('Accept-Encoding', '').split(','):
+            coding, _, params = item.strip().partition(';')
+            if params.replace(' ', '') in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+                continue
+            accepted.add(coding.strip().lower())
+        return accepted
+
+    def negotiate(self, path):
+        """Pick a fresh precompressed sibling the client accepts"""
+        accepted = self.accepted_encodings()
+        for encoding, suffix in ENCODING_SUFFIXES:
+            if encoding not in accepted:
+                continue
+            sibling = path.with_name(path.name + suffix)
+            if sibling.is_file() and sibling.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+                return encoding, sibling
+        return None, path
+
+    def send_head(self):
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            index = path / 'index.html'
+            if not self.path.split('?', 1)[0].endswith('/') or not index.is_file():
+                # Let the base class handle redirects and directory listings
+                return super().send_head()
+            path = index
+
+        if not path.is_file() or path.suffix in ('.gz', '.br'):
+            self.send_error(404, "File not found")
+            return None
+
+        encoding, served_path = self.negotiate(path)
+        etag = f'"{content_etag(path)}{"-" + encoding if encoding else ""}"'
+        cache_control = IMMUTABLE_CACHE if FINGERPRINT_PATTERN.search(path.name) else REVALIDATE_CACHE
+
+        if_none_match = self.headers.get('If-None-Match', '')
+        if etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*':
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', cache_control)
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return None
+
+        f = open(served_path, 'rb')
+        try:
+            size = os.fstat(f.fileno()).st_size
+            self.send_response(200)
+            self.send_header('Content-Type', self.guess_type(str(path)))
+            self.send_header('Content-Length', str(size))
+            if encoding:
+                self.send_header('Content-Encoding', encoding)
+            self.send_header('Vary', 'Accept-Encoding')
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', cache_control)
+            self.send_header('Last-Modified', self.date_time_string(int(path.stat().st_mtime)))
+            self.end_headers()
+            return f
+        except Exception:
+            f.close()
+            raise
+
+
+def serve(build_dir, host='127.0.0.1', port=8000):
+    """Serve a build directory until interrupted"""
+    build_dir = Path(build_dir)
+    if not (build_dir / 'index.html').exists():
+        print(f"❌ Error: {build_dir}/index.html not found!")
+        print("   Run build_linked_presentation_v2.py first to build the presentation")
+        sys.exit(1)
+
+    handler = partial(PresentationRequestHandler, directory=str(build_dir.resolve()))
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"🌐 Serving {build_dir}/ at http://{host}:{server.server_address[1]}/")
+    print(f"   Presenter: http://{host}:{server.server_address[1]}/presenter.html")
+    print("   Press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Server stopped")
+    finally:
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a built presentation over HTTP")
+    parser.add_argument('build_dir', nargs='?', default='vmg_presentation_latest',
+                        help="Build directory to serve (default: vmg_presentation_latest)")
+    parser.add_argument('--host', default='127.0.0.1', help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8000, help="Port to listen on (default: 8000)")
+    parser.add_argument('--precompress', action='store_true',
+                        help="Generate missing .gz/.br siblings before serving")
+    args = parser.parse_args(argv)
+
+    if args.precompress:
+        precompress_build(args.build_dir)
+    serve(args.build_dir, args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
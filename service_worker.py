@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Offline support for a linked presentation build
+Writes a precache manifest of every built file (keyed by content hash) and a
+service worker that installs it into a versioned cache on first load, then
+serves the whole deck from cache. A new build gets a new cache name, and old
+caches are only deleted once the new one is completely populated.
+
+A new build's worker installs in the background and waits; it takes over
+(and drops the old cache) only when the index page is opened, so a deck in
+the middle of a talk keeps the version it started with. The CDN chart
+libraries the slides use are precached too, so the deck works offline
+before any slide has loaded them.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from asset_pipeline import file_content_hash
+
+SERVICE_WORKER_FILE = "sw.js"
+MANIFEST_FILE = "precache-manifest.json"
+CACHE_PREFIX = "vmg-presentation-"
+
+# Files that never belong in the precache
+EXCLUDED_SUFFIXES = {'.gz', '.br'}
+EXCLUDED_NAMES = {SERVICE_WORKER_FILE, MANIFEST_FILE}
+
+# Third-party scripts quoted in built pages: <script src> tags and the
+# library URLs slides load on demand (e.g. PLOTLY_SRC)
+CDN_SCRIPT_PATTERN = re.compile(r'''["'](https://[^"'\s]+\.js)["']''')
+
+# Message the index page sends a waiting worker to take over
+SKIP_WAITING_MESSAGE = 'skipWaiting'
+
+SERVICE_WORKER_TEMPLATE = '''// Generated by build_linked_presentation_v2.py - do not edit
+const CACHE_NAME = '__CACHE_NAME__';
+const CACHE_PREFIX = '__CACHE_PREFIX__';
+const PRECACHE_MANIFEST = __MANIFEST__;
+const CDN_URLS = __CDN_URLS__;
+
+const revisions = new Map(PRECACHE_MANIFEST.map(entry => [
+    new URL(entry.url, self.registration.scope).href, entry.revision
+]));
+
+function cacheKey(url, revision) {
+    return url + '?__rev=' + revision;
+}
+
+function normalize(url) {
+    const clean = new URL(url);
+    clean.search = '';
+    clean.hash = '';
+    if (clean.pathname.endsWith('/')) clean.pathname += 'index.html';
+    return clean.href;
+}
+
+self.addEventListener('install', event => {
+    event.waitUntil((async () => {
+        const cache = await caches.open(CACHE_NAME);
+        // Reuse unchanged entries from older caches; fetch only what changed.
+        // Any failure rejects the install, leaving the previous version active.
+        await Promise.all([...revisions].map(async ([url, revision]) => {
+            const key = cacheKey(url, revision);
+            const previous = await caches.match(key);
+            const response = previous || await fetch(url, {cache: 'no-cache'});
+            if (!response.ok) throw new Error('Precache failed: ' + url);
+            await cache.put(key, response);
+        }));
+        // Chart libraries are best effort: a CDN outage must not block the deck
+        await Promise.all(CDN_URLS.map(async url => {
+            try {
+                const previous = await caches.match(url);
+                const response = previous || await fetch(url, {mode: 'no-cors'});
+                if (response.ok || response.type === 'opaque') await cache.put(url, response);
+            } catch (error) {
+                console.warn('Could not precache ' + url, error);
+            }
+        }));
+        // No skipWaiting: an update waits until the index page activates it
+    })());
+});
+
+self.addEventListener('message', event => {
+    if (event.data === '__SKIP_WAITING__') self.skipWaiting();
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        const names = await caches.keys();
+        await Promise.all(names
+            .filter(name => name.startsWith(CACHE_PREFIX) && name !== CACHE_NAME)
+            .map(name => caches.delete(name)));
+        // Only the first install claims open pages; updates activate from the index
+        if (names.every(name => !name.startsWith(CACHE_PREFIX) || name === CACHE_NAME)) {
+            await self.clients.claim();
+        }
+    })());
+});
+
+self.addEventListener('fetch', event => {
+    if (event.request.method !== 'GET') return;
+
+    const url = normalize(event.request.url);
+    const revision = revisions.get(url);
+    if (revision) {
+        event.respondWith((async () => {
+            const cache = await caches.open(CACHE_NAME);
+            return (await cache.match(cacheKey(url, revision))) || fetch(event.request);
+        })());
+        return;
+    }
+
+    // Third-party libraries (Chart.js, Plotly) are precached or cached on first use
+    if (new URL(url).origin !== self.location.origin) {
+        event.respondWith((async () => {
+            const cache = await caches.open(CACHE_NAME);
+            const cached = await cache.match(event.request);
+            if (cached) return cached;
+            const response = await fetch(event.request);
+            if (response.ok || response.type === 'opaque') {
+                cache.put(event.request, response.clone());
+            }
+            return response;
+        })());
+    }
+});
+'''
+
+
+def service_worker_registration(root_prefix="", activate_updates=False):
+    """Script tag that registers the service worker when served over HTTP
+
+    With activate_updates (the index page), a new build's waiting worker is
+    told to take over and the page reloads from the new version
+    """
+    if not activate_updates:
+        return f'''
+    <script>
+        if ('serviceWorker' in navigator && location.protocol.startsWith('http')) {{
+            navigator.serviceWorker.register('{root_prefix}{SERVICE_WORKER_FILE}');
+        }}
+    </script>
+    '''
+    return f'''
+    <script>
+        if ('serviceWorker' in navigator && location.protocol.startsWith('http')) {{
+            const updating = Boolean(navigator.serviceWorker.controller);
+            navigator.serviceWorker.addEventListener('controllerchange', () => {{
+                if (updating) location.reload();
+            }});
+            navigator.serviceWorker.register('{root_prefix}{SERVICE_WORKER_FILE}').then(registration => {{
+                const activate = worker => worker && worker.postMessage('{SKIP_WAITING_MESSAGE}');
+                activate(registration.waiting);
+                registration.addEventListener('updatefound', () => {{
+                    const worker = registration.installing;
+                    worker.addEventListener('statechange', () => {{
+                        if (worker.state === 'installed') activate(worker);
+                    }});
+                }});
+            }});
+        }}
+    </script>
+    '''
+
+
+def build_precache_manifest(output_dir):
+    """List every built file with its content hash, in a stable order"""
+    output_dir = Path(output_dir)
+    entries = []
+    for path in sorted(output_dir.rglob('*')):
+        if not path.is_file() or path.suffix in EXCLUDED_SUFFIXES or path.name in EXCLUDED_NAMES:
+            continue
+        entries.append({
+            'url': path.relative_to(output_dir).as_posix(),
+            'revision': file_content_hash(path),
+        })
+    return entries
+
+
+def cdn_scripts(output_dir):
+    """Third-party script URLs referenced by the built pages, in a stable order"""
+    urls = set()
+    for path in Path(output_dir).rglob('*.html'):
+        urls.update(CDN_SCRIPT_PATTERN.findall(path.read_text(encoding='utf-8', errors='replace')))
+    return sorted(urls)
+
+
+def write_service_worker(output_dir):
+    """Write the precache manifest and the versioned service worker for a build"""
+    output_dir = Path(output_dir)
+    manifest = build_precache_manifest(output_dir)
+    cdn_urls = cdn_scripts(output_dir)
+    manifest_json = json.dumps({'entries': manifest, 'cdn': cdn_urls}, indent=1)
+
+    # The cache version changes whenever any precached file changes
+    version = hashlib.sha256(manifest_json.encode('utf-8')).hexdigest()[:12]
+    cache_name = f"{CACHE_PREFIX}{version}"
+
+    with open(output_dir / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'cache': cache_name, 'entries': manifest, 'cdn': cdn_urls}, f, indent=1)
+
+    service_worker = (SERVICE_WORKER_TEMPLATE
+                      .replace('__CACHE_NAME__', cache_name)
+                      .replace('__CACHE_PREFIX__', CACHE_PREFIX)
+                      .replace('__MANIFEST__', json.dumps(manifest))
+                      .replace('__CDN_URLS__', json.dumps(cdn_urls))
+                      .replace('__SKIP_WAITING__', SKIP_WAITING_MESSAGE))
+    with open(output_dir / SERVICE_WORKER_FILE, 'w', encoding='utf-8') as f:
+        f.write(service_worker)
+
+    print(f"  ✅ Created: {SERVICE_WORKER_FILE} + {MANIFEST_FILE} "
+          f"({len(manifest)} files and {len(cdn_urls)} CDN script(s) precached, cache {cache_name})")
+    return cache_name
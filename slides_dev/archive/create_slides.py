@@ -13,10 +13,22 @@ from datetime import datetime
 import markdown
 from typing import List, Dict, Tuple
 
+from slide_markdown import parse_slides
+
+SLIDE_FILE_PATTERN = re.compile(r'slide_(\d+)_')
+SLUG_PATTERN = re.compile(r'[^a-z0-9]+')
+
+# Slide-type keywords, each matched once against the lowercased slide text
+CHART_KEYWORDS = re.compile(r'chart:|graph:|plot:|data:|trend|growth rate|percentage')
+INTERACTIVE_KEYWORDS = re.compile(r'input:|adjustable:')
+TIMELINE_KEYWORDS = re.compile(r'phase|quarter|timeline|roadmap|milestone|q[1-4]')
+METRIC_KEYWORDS = re.compile(r'kpi|metric|roi|npv|irr|payback|[$%]')
+
 class SlideGenerator:
     def __init__(self):
         self.slides_created = []
-        self.next_slide_num = self.get_next_slide_number()
+        # Numbering scans slides_complete/ and slides_dev/, so defer it until slides are written
+        self.next_slide_num = None
         
     def get_next_slide_number(self):
         """Find the highest slide number in slides_complete and slides_dev"""
@@ -26,7 +38,7 @@ class SlideGenerator:
             dir_path = Path(directory)
             if dir_path.exists():
                 for file in dir_path.glob('slide_*.html'):
-                    match = re.match(r'slide_(\d+)_', file.name)
+                    match = SLIDE_FILE_PATTERN.match(file.name)
                     if match:
                         num = int(match.group(1))
                         max_num = max(max_num, num)
@@ -38,71 +50,50 @@ class SlideGenerator:
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Split by slide markers (---, ===, or ## Slide:)
-        slide_pattern = r'(?:^---+$|^===+$|^## Slide:)'
-        parts = re.split(slide_pattern, content, flags=re.MULTILINE)
-        
+        # Slides are delimited by ---, === or "## Slide: Title" markers
         slides = []
-        for part in parts:
-            if part.strip():
-                slide_data = self.parse_slide_content(part.strip())
-                if slide_data:
-                    slides.append(slide_data)
+        for ast in parse_slides(content, split_on_rules=True):
+            slide_data = self.parse_slide_content(ast)
+            if slide_data:
+                slides.append(slide_data)
         
         return slides
     
-    def parse_slide_content(self, content: str) -> Dict:
-        """Parse individual slide content"""
-        lines = content.split('\n')
+    def parse_slide_content(self, ast: Dict) -> Dict:
+        """Build slide data from a parsed slide (see slide_markdown.parse_slides)"""
+        content = '\n'.join(ast['lines']).strip()
         slide = {
-            'title': '',
-            'subtitle': '',
-            'content': [],
-            'type': None,
-            'raw_content': content
+            'title': ast['title'],
+            'subtitle': ast['subtitle'] or '',
+            'content': content,
+            'type': self.detect_slide_type(ast, content),
+            'raw_content': content,
+            'metrics': ast['metrics']
         }
         
-        # Extract title (first # or ## that's not "## Slide:")
-        for i, line in enumerate(lines):
-            if line.startswith('# ') and not line.startswith('## Slide:'):
-                slide['title'] = line[2:].strip()
-                lines[i] = ''
-            elif line.startswith('## ') and not line.startswith('## Slide:'):
-                if not slide['title']:
-                    slide['title'] = line[3:].strip()
-                    lines[i] = ''
-            elif line.startswith('### Subtitle:') or line.startswith('**Subtitle:**'):
-                slide['subtitle'] = line.replace('### Subtitle:', '').replace('**Subtitle:**', '').strip()
-                lines[i] = ''
-        
-        # Rejoin content
-        remaining_content = '\n'.join(lines).strip()
-        slide['content'] = remaining_content
-        
-        # Detect slide type
-        slide['type'] = self.detect_slide_type(remaining_content)
-        
         return slide if slide['title'] else None
     
-    def detect_slide_type(self, content: str) -> str:
+    def detect_slide_type(self, ast: Dict, content: str) -> str:
         """Detect which template to use based on content"""
         
         # Check for table (markdown table syntax)
-        if '|' in content and '---|' in content:
+        if any(block['type'] == 'table' for block in ast['blocks']):
             return 'table'
         
+        text = content.lower()
+        
         # Check for data that suggests a chart
-        if any(word in content.lower() for word in ['chart:', 'graph:', 'plot:', 'data:', 'trend', 'growth rate', 'percentage']):
-            if 'input:' in content.lower() or 'adjustable:' in content.lower():
+        if CHART_KEYWORDS.search(text):
+            if INTERACTIVE_KEYWORDS.search(text):
                 return 'interactive'
             return 'chart'
         
         # Check for timeline indicators
-        if any(word in content.lower() for word in ['phase', 'quarter', 'timeline', 'roadmap', 'milestone', 'q1', 'q2', 'q3', 'q4']):
+        if TIMELINE_KEYWORDS.search(text):
             return 'timeline'
         
         # Check for metrics/KPIs
-        if any(word in content.lower() for word in ['kpi', 'metric', 'roi', 'npv', 'irr', 'payback', '$', '%']) and len(content.split('\n')) < 15:
+        if METRIC_KEYWORDS.search(text) and content.count('\n') < 14:
             return 'metrics'
         
         # Default to text/content slide
@@ -124,7 +115,7 @@ class SlideGenerator:
         html_content = generator(slide_data, slide_num)
         
         # Generate filename
-        title_slug = re.sub(r'[^a-z0-9]+', '_', slide_data['title'].lower())
+        title_slug = SLUG_PATTERN.sub('_', slide_data['title'].lower())
         title_slug = title_slug[:50].rstrip('_')  # Limit length
         filename = f"slide_{slide_num:02d}_{title_slug}.html"
         
@@ -469,17 +460,8 @@ class SlideGenerator:
         """Generate HTML for a metrics dashboard slide (Template 5)"""
         base_styles = self.get_base_styles()
         
-        # Parse metrics from content (looking for key: value patterns)
-        lines = slide_data['content'].split('\n')
-        metrics = []
-        for line in lines:
-            if ':' in line:
-                parts = line.split(':', 1)
-                if len(parts) == 2:
-                    metrics.append({
-                        'label': parts[0].strip().strip('-').strip('*').strip(),
-                        'value': parts[1].strip()
-                    })
+        # "Label: value" lines, collected by the parser
+        metrics = slide_data['metrics']
         
         # Generate metric cards HTML
         metrics_html = ''
@@ -568,6 +550,9 @@ class SlideGenerator:
         
         print(f"Found {len(slides)} slide(s) to generate\n")
         
+        if self.next_slide_num is None:
+            self.next_slide_num = self.get_next_slide_number()
+        
         # Generate HTML for each slide
         for slide_data in slides:
             slide_num = self.next_slide_num
@@ -6,9 +6,73 @@ Generates professional-quality slides matching the VMG presentation style.
 
 import re
 import os
+import sys
+import json
+import hashlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import argparse
 
+from slide_markdown import BOLD_PATTERN, parse_slides, table_phases
+
+VS_PATTERN = re.compile(r'vs\.\s*(.*?)(?:\n|$)')
+SLUG_STRIP_PATTERN = re.compile(r'[^\w\s-]')
+SLUG_SEPARATOR_PATTERN = re.compile(r'[-\s]+')
+
+# Per-output-directory record of the content hash each slide was rendered from
+CACHE_FILE = '.slide_cache.json'
+
+
+def generator_version():
+    """Hash this file and every local module it imports (e.g. slide_markdown)"""
+    here = Path(__file__).resolve()
+    sources = {here}
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, '__file__', None)
+        if module_file and Path(module_file).resolve().parent == here.parent:
+            sources.add(Path(module_file).resolve())
+    digest = hashlib.sha256()
+    for source in sorted(sources):
+        digest.update(source.name.encode('utf-8'))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+# Changes to the generator or its helpers (templates, styles, parsing) invalidate every cached slide
+GENERATOR_VERSION = generator_version()
+
+# mkstemp creates files as 0600; written slides get the usual umask-based mode
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def slide_content_hash(slide, slide_num):
+    """Hash of everything a slide's HTML depends on"""
+    payload = json.dumps([GENERATOR_VERSION, slide_num, slide], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def write_atomic(path, text):
+    """Write via a temp file in the same directory, then rename over the target"""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f'.{path.name}.', suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _render_slide(job):
+    """Worker entry point: render one slide to HTML"""
+    slide, slide_num = job
+    return AdvancedSlideGenerator().generate_slide_html(slide, slide_num)
+
+
 class AdvancedSlideGenerator:
     def __init__(self):
         self.base_styles = """
@@ -107,63 +171,59 @@ class AdvancedSlideGenerator:
         """
 
     def parse_markdown(self, content):
-        """Parse markdown content into structured data."""
-        lines = content.strip().split('\n')
+        """Parse markdown content into structured data.
+        
+        Builds on the slide AST from slide_markdown: the first ### heading
+        becomes the subtitle and later ones sections; #### headings become
+        subsections holding the bullets that follow them.
+        """
         slides = []
-        current_slide = None
-        
-        for line in lines:
-            # Check for slide header (## Slide X:)
-            if line.startswith('## Slide'):
-                if current_slide:
-                    slides.append(current_slide)
-                title = line.replace('## Slide ', '').replace(':', '').strip()
-                # Remove "Slide X:" prefix
-                title = re.sub(r'^\d+:\s*', '', title)
-                current_slide = {
-                    'title': title,
-                    'subtitle': None,
-                    'sections': [],
-                    'footer': None,
-                    'type': 'generic'
-                }
-            elif current_slide:
-                if line.startswith('### '):
+        for ast in parse_slides(content):
+            slide = {
+                'title': ast['title'],
+                'subtitle': ast['subtitle'],
+                'sections': [],
+                'footer': ast['footer'],
+                'type': 'generic'
+            }
+            sections = slide['sections']
+            
+            for block in ast['blocks']:
+                if block['type'] == 'heading' and block['level'] == 3:
                     # Subtitle or section header
-                    if not current_slide['subtitle'] and not current_slide['sections']:
-                        current_slide['subtitle'] = line[4:].strip()
+                    if not slide['subtitle'] and not sections:
+                        slide['subtitle'] = block['text']
                     else:
-                        current_slide['sections'].append({
-                            'title': line[4:].strip(),
+                        sections.append({
+                            'title': block['text'],
                             'content': [],
                             'type': 'section'
                         })
-                elif line.startswith('#### '):
-                    # Subsection
-                    if current_slide['sections']:
-                        current_slide['sections'][-1]['content'].append({
-                            'type': 'subsection',
-                            'title': line[5:].strip(),
-                            'items': []
-                        })
-                elif line.startswith('- '):
-                    # List item
-                    if current_slide['sections'] and current_slide['sections'][-1]['content']:
-                        last_content = current_slide['sections'][-1]['content'][-1]
-                        if last_content['type'] == 'subsection':
-                            last_content['items'].append(line[2:].strip())
-                elif line.startswith('*') and line.endswith('*') and not line.startswith('**'):
-                    # Footer note
-                    current_slide['footer'] = line.strip('*').strip()
-                elif line.strip() and current_slide['sections']:
-                    # Regular paragraph
-                    current_slide['sections'][-1]['content'].append({
+                elif not sections:
+                    continue
+                elif block['type'] == 'heading' and block['level'] > 3:
+                    sections[-1]['content'].append({
+                        'type': 'subsection',
+                        'title': block['text'],
+                        'items': []
+                    })
+                elif block['type'] == 'bullets':
+                    content_items = sections[-1]['content']
+                    if content_items and content_items[-1]['type'] == 'subsection':
+                        content_items[-1]['items'].extend(block['items'])
+                elif block['type'] == 'paragraph':
+                    sections[-1]['content'].append({
                         'type': 'paragraph',
-                        'text': line.strip()
+                        'text': block['text']
                     })
-        
-        if current_slide:
-            slides.append(current_slide)
+                elif block['type'] == 'table':
+                    sections[-1]['content'].append({
+                        'type': 'table',
+                        'header': block['header'],
+                        'rows': block['rows']
+                    })
+            
+            slides.append(slide)
         
         return slides
 
@@ -384,8 +444,7 @@ class AdvancedSlideGenerator:
                 for content_item in section['content']:
                     if content_item['type'] == 'paragraph':
                         # Bold key phrases
-                        text = content_item['text']
-                        text = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', text)
+                        text = BOLD_PATTERN.sub(r'<strong>\1</strong>', content_item['text'])
                         content_html += text
                 content_html += '''
                     </div>
@@ -566,12 +625,14 @@ class AdvancedSlideGenerator:
         timeline_section = None
         
         for section in slide['sections']:
-            if 'moves' in section['title'].lower() or 'counter' in section['title'].lower():
+            title = section['title'].lower()
+            if 'moves' in title or 'counter' in title:
                 moves_section = section
-            elif 'advantage' in section['title'].lower():
-                advantages_section = section
-            elif 'timeline' in section['title'].lower() or 'roadmap' in section['title'].lower():
+            elif 'timeline' in title or 'roadmap' in title:
+                # Checked before 'advantage': "Go-to-Market Advantage Timeline"
                 timeline_section = section
+            elif 'advantage' in title:
+                advantages_section = section
         
         # Generate moves column
         if moves_section:
@@ -619,24 +680,23 @@ class AdvancedSlideGenerator:
                 <div class="section-title">{advantages_section['title']}</div>
             '''
             
+            # (competitor, description) pairs; a paragraph under a "#### vs. ..."
+            # heading describes that competitor
+            cards = []
             for content_item in advantages_section['content']:
                 if content_item['type'] == 'subsection':
-                    competitor = content_item['title']
-                    description = ' '.join(content_item['items']) if content_item['items'] else ''
+                    cards.append([content_item['title'], ' '.join(content_item['items'])])
                 elif content_item['type'] == 'paragraph':
-                    description = content_item['text']
-                    # Extract competitor type from bold text
-                    match = re.search(r'vs\.\s*(.*?)(?:\n|$)', content_item['text'])
+                    # Extract competitor type from the text
+                    match = VS_PATTERN.search(content_item['text'])
                     if match:
-                        competitor = match.group(1)
-                        description = re.sub(r'vs\.\s*.*?(?:\n|$)', '', description).strip()
-                    else:
-                        continue
-                else:
-                    continue
-                
+                        cards.append([match.group(1), VS_PATTERN.sub('', content_item['text']).strip()])
+                    elif cards:
+                        cards[-1][1] = (cards[-1][1] + ' ' + content_item['text']).strip()
+            
+            for competitor, description in cards:
                 # Bold important phrases
-                description = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', description)
+                description = BOLD_PATTERN.sub(r'<strong>\1</strong>', description)
                 
                 content_html += f'''
                 <div class="advantage-card">
@@ -657,19 +717,14 @@ class AdvancedSlideGenerator:
                 <div class="timeline-grid">
             '''
             
-            # Parse timeline from table or list
+            # Phases come from the section's timeline table
             for content_item in timeline_section['content']:
-                if content_item['type'] == 'paragraph':
-                    # Parse table row
-                    parts = content_item['text'].split('|')
-                    if len(parts) >= 2:
-                        period = parts[0].strip()
-                        content = parts[1].strip() if len(parts) > 1 else ''
-                        
+                if content_item['type'] == 'table':
+                    for phase in table_phases(content_item):
                         content_html += f'''
                         <div class="timeline-phase">
-                            <div class="phase-period">{period}</div>
-                            <div class="phase-content">{content}</div>
+                            <div class="phase-period">{phase['period']}</div>
+                            <div class="phase-content">{phase['content']}</div>
                         </div>
                         '''
             
@@ -708,6 +763,13 @@ class AdvancedSlideGenerator:
                         content_html += '</ul>'
                     elif content_item['type'] == 'paragraph':
                         content_html += f'<p>{content_item["text"]}</p>'
+                    elif content_item['type'] == 'table':
+                        content_html += '<table>'
+                        if content_item['header']:
+                            content_html += '<tr>' + ''.join(f'<th>{cell}</th>' for cell in content_item['header']) + '</tr>'
+                        for row in content_item['rows']:
+                            content_html += '<tr>' + ''.join(f'<td>{cell}</td>' for cell in row) + '</tr>'
+                        content_html += '</table>'
             content_html += '</div>'
         
         # Build complete HTML
@@ -735,8 +797,19 @@ class AdvancedSlideGenerator:
         
         return html
 
-    def generate_slides(self, markdown_file, output_dir='slides_dev'):
-        """Generate HTML slides from markdown file."""
+    def slide_filename(self, slide, slide_num):
+        """Output file name for a slide."""
+        title_slug = SLUG_STRIP_PATTERN.sub('', slide['title'].lower())
+        title_slug = SLUG_SEPARATOR_PATTERN.sub('_', title_slug)
+        return f"slide_{slide_num:02d}_{title_slug[:50]}.html"
+
+    def generate_slides(self, markdown_file, output_dir='slides_dev', workers=None, force=False):
+        """Generate HTML slides from markdown file.
+        
+        Slides whose content hash matches the previous run (and whose output
+        file still exists) are skipped; the rest render across worker
+        processes and are written atomically.
+        """
         # Read markdown content
         with open(markdown_file, 'r') as f:
             content = f.read()
@@ -745,38 +818,56 @@ class AdvancedSlideGenerator:
         slides = self.parse_markdown(content)
         
         # Create output directory
-        Path(output_dir).mkdir(exist_ok=True)
+        output_dir = Path(output_dir)
+        output_dir.mkdir(exist_ok=True)
+        
+        cache_path = output_dir / CACHE_FILE
+        cache = {}
+        if cache_path.exists() and not force:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
         
-        # Generate HTML for each slide
+        # Work out which slides changed since the last run
         generated_files = []
+        pending = []
         for i, slide in enumerate(slides, 1):
-            # Generate filename
-            title_slug = re.sub(r'[^\w\s-]', '', slide['title'].lower())
-            title_slug = re.sub(r'[-\s]+', '_', title_slug)
-            filename = f"slide_{i:02d}_{title_slug[:50]}.html"
-            filepath = os.path.join(output_dir, filename)
-            
-            # Generate HTML
-            html = self.generate_slide_html(slide, i)
-            
-            # Write file
-            with open(filepath, 'w') as f:
-                f.write(html)
-            
-            generated_files.append(filepath)
+            filepath = output_dir / self.slide_filename(slide, i)
+            content_hash = slide_content_hash(slide, i)
+            generated_files.append(str(filepath))
+            if cache.get(filepath.name) == content_hash and filepath.exists():
+                print(f"Unchanged: {filepath}")
+            else:
+                pending.append((slide, i, filepath, content_hash))
+        
+        # Render changed slides; a process pool only pays off for several slides
+        jobs = [(slide, i) for slide, i, _, _ in pending]
+        if len(jobs) > 1 and workers != 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                rendered = list(pool.map(_render_slide, jobs, chunksize=max(1, len(jobs) // 32)))
+        else:
+            rendered = [_render_slide(job) for job in jobs]
+        
+        for (slide, i, filepath, content_hash), html in zip(pending, rendered):
+            write_atomic(filepath, html)
+            cache[filepath.name] = content_hash
             print(f"Generated: {filepath}")
         
+        if pending:
+            write_atomic(cache_path, json.dumps(cache, indent=1, sort_keys=True))
+        
         return generated_files
 
 def main():
     parser = argparse.ArgumentParser(description='Generate sophisticated HTML slides from markdown')
     parser.add_argument('markdown_file', help='Path to markdown file')
     parser.add_argument('--output-dir', default='slides_dev', help='Output directory for slides')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='Regenerate every slide, ignoring the cache')
     
     args = parser.parse_args()
     
     generator = AdvancedSlideGenerator()
-    files = generator.generate_slides(args.markdown_file, args.output_dir)
+    files = generator.generate_slides(args.markdown_file, args.output_dir, args.workers, args.force)
     
     print(f"\nGenerated {len(files)} slides successfully!")
     print("\nTo view slides, open them in a browser:")
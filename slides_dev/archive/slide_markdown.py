@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Single-pass markdown tokenizer and slide AST shared by the slide generators.
+Each line is classified once by a precompiled pattern; slides are then built
+from the token stream into typed blocks (headings, paragraphs, bullets,
+tables) plus the metrics and timeline phases the templates look for, so
+parsing and slide-type detection stay linear in the size of the document.
+"""
+
+import re
+from collections import namedtuple
+
+Token = namedtuple('Token', 'kind level text line')
+
+# One alternation classifies every line; the first matching group names the token
+LINE_PATTERN = re.compile(r'''
+    (?P<slide>\#\#[ ]Slide\b[ ]*(?:(?P<number>\d+)[ ]*)?:?[ ]*(?P<slide_title>.*))
+  | (?P<subtitle>(?:\#\#\#[ ]Subtitle:|\*\*Subtitle:\*\*)[ ]*(?P<subtitle_text>.*))
+  | (?P<heading>(?P<hashes>\#{1,6})[ ](?P<heading_text>.*))
+  | (?P<rule>(?:-{3,}|={3,})[ \t]*$)
+  | (?P<table_separator>[ \t]*\|?[ \t]*:?-{3,}:?[ \t]*(?:\|[ \t]*:?-{3,}:?[ \t]*)*\|?[ \t]*$)
+  | (?P<table_row>[ \t]*\|.*\|[ \t]*$)
+  | (?P<bullet>[-*+][ ](?P<bullet_text>.*))
+  | (?P<footer>\*(?!\*)(?:.*\*)?[ \t]*$)
+  | (?P<blank>[ \t]*$)
+''', re.VERBOSE)
+
+BOLD_PATTERN = re.compile(r'\*\*(.*?)\*\*')
+METRIC_PATTERN = re.compile(r'^\**([^:*]+?)\**:\s*\**\s*(.+?)\s*$')
+PHASE_PATTERN = re.compile(r'\b(?:phase|month|quarter|year|week|q[1-4])s?\b', re.IGNORECASE)
+
+
+def tokenize(content):
+    """Classify each line of markdown exactly once"""
+    tokens = []
+    for line in content.split('\n'):
+        match = LINE_PATTERN.match(line)
+        kind = match.lastgroup if match else 'text'
+        if kind == 'slide':
+            tokens.append(Token('slide', int(match.group('number') or 0), match.group('slide_title').strip(), line))
+        elif kind == 'subtitle':
+            tokens.append(Token('subtitle', 0, match.group('subtitle_text').strip(), line))
+        elif kind == 'heading':
+            tokens.append(Token('heading', len(match.group('hashes')), match.group('heading_text').strip(), line))
+        elif kind == 'bullet':
+            tokens.append(Token('bullet', 0, match.group('bullet_text').strip(), line))
+        elif kind == 'footer':
+            tokens.append(Token('footer', 0, line.strip().strip('*').strip(), line))
+        else:
+            tokens.append(Token(kind, 0, line.strip(), line))
+    return tokens
+
+
+def split_cells(row):
+    """Cells of a markdown table row"""
+    return [cell.strip() for cell in row.strip().strip('|').split('|')]
+
+
+def strip_bold(text):
+    return BOLD_PATTERN.sub(r'\1', text)
+
+
+def new_slide(title='', number=None):
+    return {
+        'number': number,
+        'title': title,
+        'subtitle': None,
+        'footer': None,
+        'blocks': [],
+        'metrics': [],
+        'phases': [],
+        'lines': [],
+    }
+
+
+def _add_token(slide, token):
+    """Append one token to a slide's block list"""
+    blocks = slide['blocks']
+    last = blocks[-1] if blocks else None
+
+    if token.kind == 'heading':
+        blocks.append({'type': 'heading', 'level': token.level, 'text': token.text})
+        if PHASE_PATTERN.search(token.text) and token.level >= 3:
+            slide['phases'].append({'period': token.text, 'content': ''})
+    elif token.kind == 'subtitle':
+        slide['subtitle'] = token.text
+    elif token.kind == 'footer':
+        slide['footer'] = token.text
+    elif token.kind == 'bullet':
+        if last and last['type'] == 'bullets':
+            last['items'].append(token.text)
+        else:
+            blocks.append({'type': 'bullets', 'items': [token.text]})
+        _add_metric(slide, token.text)
+    elif token.kind in ('table_row', 'table_separator'):
+        if not (last and last['type'] == 'table'):
+            last = {'type': 'table', 'header': [], 'rows': []}
+            blocks.append(last)
+        if token.kind == 'table_separator':
+            # The rows seen so far were the header
+            if last['rows'] and not last['header']:
+                last['header'] = last['rows'].pop()
+        else:
+            last['rows'].append(split_cells(token.line))
+    elif token.kind == 'text':
+        blocks.append({'type': 'paragraph', 'text': token.text})
+        _add_metric(slide, token.text)
+
+
+def _add_metric(slide, text):
+    match = METRIC_PATTERN.match(text)
+    if match:
+        slide['metrics'].append({'label': match.group(1).strip(), 'value': match.group(2)})
+
+
+def table_phases(table):
+    """Timeline phases of a table whose header names periods (Months 1-6, Q1, ...)
+
+    A header of periods pairs each with the cell below it; otherwise each
+    row whose first cell names a period becomes a phase
+    """
+    header = [strip_bold(cell) for cell in table['header']]
+    if header and sum(bool(PHASE_PATTERN.search(cell)) for cell in header) >= len(header) / 2:
+        first_row = table['rows'][0] if table['rows'] else []
+        return [{'period': period, 'content': strip_bold(first_row[i]) if i < len(first_row) else ''}
+                for i, period in enumerate(header)]
+    return [{'period': strip_bold(row[0]), 'content': strip_bold(' '.join(row[1:]))}
+            for row in table['rows'] if row and PHASE_PATTERN.search(row[0])]
+
+
+def _table_phases(slide):
+    for block in slide['blocks']:
+        if block['type'] == 'table':
+            slide['phases'].extend(table_phases(block))
+
+
+def parse_slides(content, split_on_rules=False):
+    """Parse markdown into slide ASTs
+
+    A "## Slide ..." heading always starts a slide; with split_on_rules a
+    --- or === rule does too. Text before the first slide is ignored unless
+    rules delimit slides.
+    """
+    slides = []
+    current = new_slide() if split_on_rules else None
+
+    def finish():
+        if current is not None and (current['title'] or current['blocks']):
+            _table_phases(current)
+            slides.append(current)
+
+    for token in tokenize(content):
+        if token.kind == 'slide':
+            finish()
+            current = new_slide(token.text, token.level or None)
+            continue
+        if token.kind == 'rule' and split_on_rules:
+            finish()
+            current = new_slide()
+            continue
+        if current is None:
+            continue
+        current['lines'].append(token.line)
+        if not current['title'] and token.kind == 'heading' and token.level <= 2:
+            # The first top-level heading names a slide started by a rule
+            current['title'] = token.text
+            current['lines'].pop()
+            continue
+        if token.kind == 'subtitle':
+            current['lines'].pop()
+        _add_token(current, token)
+
+    finish()
+    return slides
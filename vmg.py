@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Unified command line for the VMG presentation tools
+Each subcommand imports its tool only when it runs, and no module touches the
+database or filesystem at import time, so hook-driven and watch-mode
+invocations start quickly
+
+Usage:
+    python vmg.py build [--minify] [--offline] ...
+    python vmg.py serve [build_dir] [--port 8000]
+    python vmg.py capture [--force] [--keep-screenshots]
+    python vmg.py optimize-images slide_captures/
+    python vmg.py search "market share"
+    python vmg.py pipeline [pdf] [--force]
+    python vmg.py benchmark [--sizes 100 1000]
+    python vmg.py startup [--budget-ms 150]
+"""
+
+import argparse
+import importlib
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent
+
+# Import-time budget for every tool module, measured in a fresh interpreter
+STARTUP_BUDGET_MS = 150
+
+# Subcommand -> (module, help); each module exposes main(argv=None)
+COMMANDS = {
+    'build': ('build_linked_presentation_v2', "Build the linked presentation from slides.db"),
+    'serve': ('serve_presentation', "Serve a built presentation over HTTP"),
+    'capture': ('capture_slides_to_pdf', "Capture every slide with Selenium and assemble a PDF"),
+    'optimize-images': ('optimize_images', "Downsize and recompress images in place"),
+    'search': ('search_index', "Full-text search over the slides of the latest build"),
+    'model': ('financial_model', "Run the ROI slide's financial model"),
+    'growth': ('growth_projection', "Project customers from quarterly cohorts with churn and ramp"),
+    'clients': ('client_batch', "Evaluate many clients' model inputs and build their decks"),
+    'sweep': ('scenario_sweep', "Sweep the ROI model's inputs and write sensitivity data"),
+    'simulate': ('monte_carlo', "Monte Carlo risk simulation of the ROI model"),
+    'charts': ('chart_data', "List, show, set or seed chart datasets stored in slides.db"),
+    'scores': ('scoring_engine', "Rank initiatives by weighted scores and adjust criterion weights"),
+    'maturity': ('maturity_assessment', "Store maturity profiles, print gap analyses and render their charts"),
+    'pipeline': ('run_pipeline', "Run the stage graph, skipping stages whose inputs are unchanged"),
+    'benchmark': ('benchmark_build', "Benchmark the build pipeline on synthetic decks"),
+}
+
+
+def measure_import(module, runs):
+    """Best-of-N wall time to import a module in a fresh interpreter, minus bare startup"""
+    def best(code):
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, '-c', code], cwd=REPO_DIR, check=True)
+            timings.append(time.perf_counter() - started)
+        return min(timings) * 1000
+
+    return best(f'import {module}') - best('pass')
+
+
+def check_startup(argv=None):
+    """Measure each tool's import cost against the startup budget"""
+    parser = argparse.ArgumentParser(prog='vmg.py startup', description="Check tool import times")
+    parser.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS,
+                        help=f"Maximum import time per tool (default: {STARTUP_BUDGET_MS})")
+    parser.add_argument('--runs', type=int, default=5, help="Runs per measurement (default: 5)")
+    args = parser.parse_args(argv)
+
+    print(f"⏱️  Import time per tool (budget {args.budget_ms:.0f} ms)")
+    over_budget = []
+    for command, (module, _) in COMMANDS.items():
+        elapsed = measure_import(module, args.runs)
+        status = '✅' if elapsed <= args.budget_ms else '❌'
+        print(f"  {status} {command:<16} {module:<30} {elapsed:>7.1f} ms")
+        if elapsed > args.budget_ms:
+            over_budget.append(command)
+
+    if over_budget:
+        print(f"\n❌ Over budget: {', '.join(over_budget)}")
+        sys.exit(1)
+    print("\n✅ All tools within the startup budget")
+
+
+def main(argv=None):
+    commands = dict(COMMANDS, startup=(None, "Check tool import times against the startup budget"))
+    parser = argparse.ArgumentParser(
+        prog='vmg.py', description="VMG presentation tools",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="commands:\n" + "\n".join(f"  {name:<17} {help_text}" for name, (_, help_text) in commands.items())
+               + "\n\nRun 'vmg.py <command> --help' for a command's options")
+    parser.add_argument('command', choices=commands, metavar='command')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help="Options passed to the command")
+    args = parser.parse_args(argv)
+
+    if args.command == 'startup':
+        check_startup(args.args)
+        return
+
+    module_name, _ = COMMANDS[args.command]
+    module = importlib.import_module(module_name)
+    sys.argv = [f"vmg.py {args.command}"] + args.args
+    module.main(args.args)
+
+
+if __name__ == "__main__":
+    main()